@@ -2,12 +2,13 @@
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Tuple, cast
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 import jwt
 
 from homeassistant import data_entry_flow
-from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
+from homeassistant.auth.const import ACCESS_TOKEN_CACHE_SIZE, ACCESS_TOKEN_EXPIRATION
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
@@ -22,6 +23,8 @@ EVENT_USER_REMOVED = "user_removed"
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
+# Validated refresh token and expiration timestamp of an access token
+_AccessTokenCacheEntry = Tuple[models.RefreshToken, float]
 
 
 async def auth_manager_from_config(
@@ -144,6 +147,9 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        self._access_token_cache: "OrderedDict[str, _AccessTokenCacheEntry]" = (
+            OrderedDict()
+        )
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -277,6 +283,9 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_invalidate_access_tokens(
+            lambda refresh_token: refresh_token.user.id == user.id
+        )
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -434,6 +443,21 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(
+            lambda cached_token: cached_token.id == refresh_token.id
+        )
+
+    @callback
+    def _async_invalidate_access_tokens(
+        self, matcher: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Forget validated access tokens of matching refresh tokens."""
+        for token in [
+            token
+            for token, (refresh_token, _) in self._access_token_cache.items()
+            if matcher(refresh_token)
+        ]:
+            del self._access_token_cache[token]
 
     @callback
     def async_create_access_token(
@@ -457,6 +481,15 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+
+        if cached is not None:
+            refresh_token, expiration = cached
+            if time.time() < expiration and refresh_token.user.is_active:
+                self._access_token_cache.move_to_end(token)
+                return refresh_token
+            del self._access_token_cache[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -474,13 +507,20 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if "exp" in claims:
+            self._access_token_cache[token] = (refresh_token, claims["exp"])
+            if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+                self._access_token_cache.popitem(last=False)
+
         return refresh_token
 
     @callback
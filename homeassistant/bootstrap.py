@@ -2,31 +2,40 @@
 import asyncio
 import contextlib
 from datetime import datetime
+import functools as ft
+import heapq
 import logging
 import logging.handlers
 import os
 import sys
 import threading
 from time import monotonic
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 import voluptuous as vol
 import yarl
 
-from homeassistant import config as conf_util, config_entries, core, loader
+from homeassistant import components, config as conf_util, config_entries, core, loader
 from homeassistant.components import http
-from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_CLOSE,
+    REQUIRED_NEXT_PYTHON_DATE,
+    REQUIRED_NEXT_PYTHON_VER,
+)
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_per_platform
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    async_get_setup_timeline,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
 from homeassistant.util.async_ import gather_with_concurrency
 from homeassistant.util.logging import async_activate_log_queue_handler
-from homeassistant.util.package import async_get_user_site, is_virtual_env
+from homeassistant.util.loop_monitor import LoopMonitor
+from homeassistant.util.package import async_get_user_site, is_installed, is_virtual_env
 from homeassistant.util.yaml import clear_secret_cache
 
 if TYPE_CHECKING:
@@ -38,11 +47,12 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
+# hass.data key for the event loop monitor.
+DATA_LOOP_MONITOR = "loop_monitor"
 
 LOG_SLOW_STARTUP_INTERVAL = 60
 
-STAGE_1_TIMEOUT = 120
-STAGE_2_TIMEOUT = 300
+SETUP_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
@@ -165,9 +175,25 @@ async def async_setup_hass(
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
+    async_start_loop_monitor(hass)
+
     return hass
 
 
+@core.callback
+def async_start_loop_monitor(hass: core.HomeAssistant) -> None:
+    """Start monitoring the event loop for callbacks blocking it."""
+    monitor = hass.data[DATA_LOOP_MONITOR] = LoopMonitor(hass.loop)
+    monitor.start()
+
+    @core.callback
+    def stop_monitor(_: core.Event) -> None:
+        """Stop the monitor."""
+        monitor.stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, stop_monitor)
+
+
 def open_hass_ui(hass: core.HomeAssistant) -> None:
     """Open the UI."""
     import webbrowser  # pylint: disable=import-outside-toplevel
@@ -197,6 +223,8 @@ async def async_from_config_dict(
     This method is a coroutine.
     """
     start = monotonic()
+    # Start the setup timeline at the start of the setup
+    async_get_setup_timeline(hass)
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     await hass.config_entries.async_initialize()
@@ -397,29 +425,172 @@ async def _async_log_pending_setups(
             )
 
 
-async def async_setup_multi_components(
-    hass: core.HomeAssistant,
-    domains: Set[str],
-    config: Dict[str, Any],
-    setup_started: Dict[str, datetime],
-) -> None:
-    """Set up multiple domains. Log on failure."""
-    futures = {
-        domain: hass.async_create_task(async_setup_component(hass, domain, config))
-        for domain in domains
-    }
-    log_task = asyncio.create_task(_async_log_pending_setups(domains, setup_started))
-    await asyncio.wait(futures.values())
-    log_task.cancel()
-    errors = [domain for domain in domains if futures[domain].exception()]
-    for domain in errors:
-        exception = futures[domain].exception()
-        assert exception is not None
-        _LOGGER.error(
-            "Error setting up integration %s - received exception",
-            domain,
-            exc_info=(type(exception), exception, exception.__traceback__),
+class SetupScheduler:
+    """Set up each integration as soon as the integrations it waits for are done."""
+
+    def __init__(
+        self,
+        hass: core.HomeAssistant,
+        config: Dict[str, Any],
+        graph: Dict[str, Set[str]],
+        stages: List[Set[str]],
+        max_concurrent: Optional[int] = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        The graph maps each domain to the domains it waits for. Ready domains
+        of earlier stages are started first.
+        """
+        self.hass = hass
+        self.config = config
+        self.max_concurrent = max_concurrent
+        self.waiting_for = {domain: set(graph[domain]) for domain in graph}
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.done: Set[str] = set()
+        self._dependents: Dict[str, Set[str]] = {}
+        for domain, prerequisites in graph.items():
+            for prerequisite in prerequisites:
+                self._dependents.setdefault(prerequisite, set()).add(domain)
+        self._stage = {
+            domain: index for index, stage in enumerate(stages) for domain in stage
+        }
+        # Setups started outside of the scheduler, like those of platforms,
+        # wait for their after dependencies once the first stages are done.
+        self._early = set().union(*stages[:-1]) if stages else set()
+        self._after_dependencies_enabled = False
+        self._ready: List[Tuple[int, str]] = []
+        self._finished = asyncio.Event()
+
+    async def async_run(self) -> None:
+        """Set up all domains and wait for them to be done."""
+        for domain, prerequisites in self.waiting_for.items():
+            if not prerequisites:
+                heapq.heappush(self._ready, (self._stage.get(domain, 0), domain))
+        self._async_after_done()
+        await self._finished.wait()
+
+    @core.callback
+    def async_start_remaining(self) -> None:
+        """Start all domains that have not been started, regardless of order."""
+        self.max_concurrent = None
+        for domain in self.waiting_for:
+            if domain not in self.tasks:
+                self._async_start(domain)
+
+    @core.callback
+    def _async_start(self, domain: str) -> None:
+        """Start setting up a domain."""
+        task = self.tasks[domain] = self.hass.async_create_task(
+            async_setup_component(self.hass, domain, self.config)
         )
+        task.add_done_callback(ft.partial(self._async_setup_done, domain))
+
+    @core.callback
+    def _async_setup_done(self, domain: str, task: asyncio.Task) -> None:
+        """Handle a domain that is done setting up."""
+        self.done.add(domain)
+        if not task.cancelled() and task.exception():
+            exception = task.exception()
+            assert exception is not None
+            _LOGGER.error(
+                "Error setting up integration %s - received exception",
+                domain,
+                exc_info=(type(exception), exception, exception.__traceback__),
+            )
+
+        for dependent in self._dependents.get(domain, ()):
+            prerequisites = self.waiting_for[dependent]
+            prerequisites.discard(domain)
+            if not prerequisites and dependent not in self.tasks:
+                heapq.heappush(self._ready, (self._stage.get(dependent, 0), dependent))
+
+        self._early.discard(domain)
+        self._async_after_done()
+
+    @core.callback
+    def _async_after_done(self) -> None:
+        """Start ready domains and check if all domains are done."""
+        if not self._early and not self._after_dependencies_enabled:
+            # Enables after dependencies
+            self._after_dependencies_enabled = True
+            async_set_domains_to_be_loaded(self.hass, set(self.waiting_for) - self.done)
+
+        running = len(self.tasks) - len(self.done)
+        while self._ready and (
+            self.max_concurrent is None or running < self.max_concurrent
+        ):
+            _, domain = heapq.heappop(self._ready)
+            if domain not in self.tasks:
+                self._async_start(domain)
+                running += 1
+
+        if len(self.done) == len(self.waiting_for):
+            self._finished.set()
+        elif not running:
+            # Domains are waiting for each other
+            _LOGGER.error(
+                "Unable to order setup of integrations, setting up: %s",
+                ", ".join(sorted(set(self.waiting_for) - set(self.tasks))),
+            )
+            self.async_start_remaining()
+
+
+def _promote_dependencies(
+    stage_domains: Set[str],
+    domains: Set[str],
+    integrations: Dict[str, loader.Integration],
+) -> Set[str]:
+    """Return the domains of a stage together with all their dependencies."""
+    promoted: Set[str] = set()
+
+    # Find all dependencies of any dependency of any integration of the stage
+    # that we plan on loading and promote them to the stage
+    deps_promotion = stage_domains
+    while deps_promotion:
+        old_deps_promotion = deps_promotion
+        deps_promotion = set()
+
+        for domain in old_deps_promotion:
+            if domain not in domains or domain in promoted:
+                continue
+
+            promoted.add(domain)
+
+            dep_itg = integrations.get(domain)
+
+            if dep_itg is None:
+                continue
+
+            deps_promotion.update(dep_itg.all_dependencies)
+
+    return promoted
+
+
+def _build_setup_graph(
+    domains: Set[str],
+    integrations: Dict[str, loader.Integration],
+    stages: List[Set[str]],
+) -> Dict[str, Set[str]]:
+    """Return the domains each domain waits for before it is set up.
+
+    Domains wait for their dependencies and, in the last stage, for their
+    after dependencies. All domains wait for the logging and debugger stages
+    before them.
+    """
+    graph: Dict[str, Set[str]] = {}
+    for index, stage in enumerate(stages):
+        for domain in stage:
+            prerequisites = graph[domain] = set().union(*stages[: min(index, 2)])
+            integration = integrations.get(domain)
+            if integration is not None:
+                prerequisites.update(integration.dependencies)
+                if index == len(stages) - 1:
+                    prerequisites.update(integration.after_dependencies)
+
+            prerequisites &= domains
+            prerequisites.discard(domain)
+
+    return graph
 
 
 async def _async_set_up_integrations(
@@ -470,77 +641,49 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
-    logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
-
-    # Load logging as soon as possible
-    if logging_domains:
-        _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config, setup_started)
-
-    # Start up debuggers. Start these first in case they want to wait.
-    debuggers = domains_to_setup & DEBUGGER_INTEGRATIONS
-
-    if debuggers:
-        _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config, setup_started)
-
-    # calculate what components to setup in what stage
-    stage_1_domains = set()
-
-    # Find all dependencies of any dependency of any stage 1 integration that
-    # we plan on loading and promote them to stage 1
-    deps_promotion = STAGE_1_INTEGRATIONS
-    while deps_promotion:
-        old_deps_promotion = deps_promotion
-        deps_promotion = set()
-
-        for domain in old_deps_promotion:
-            if domain not in domains_to_setup or domain in stage_1_domains:
-                continue
-
-            stage_1_domains.add(domain)
-
-            dep_itg = integration_cache.get(domain)
-
-            if dep_itg is None:
-                continue
-
-            deps_promotion.update(dep_itg.all_dependencies)
-
-    stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
+    prefetch = hass.data[loader.DATA_IMPORT_PREFETCH] = loader.ImportPrefetch(hass)
+    await _async_prefetch_imports(hass, config, prefetch, integration_cache)
+
+    # Logging is set up first, then debuggers, in case they want to wait.
+    # Stage 1 integrations are started before other integrations, but they
+    # ignore after dependencies so the frontend is available as soon as
+    # possible.
+    stages: List[Set[str]] = []
+    for stage_integrations in (
+        LOGGING_INTEGRATIONS,
+        DEBUGGER_INTEGRATIONS,
+        STAGE_1_INTEGRATIONS,
+    ):
+        stages.append(
+            _promote_dependencies(
+                stage_integrations, domains_to_setup, integration_cache
+            ).difference(*stages)
+        )
+    stages.append(domains_to_setup.difference(*stages))
 
     # Kick off loading the registries. They don't need to be awaited.
     asyncio.create_task(hass.helpers.device_registry.async_get_registry())
     asyncio.create_task(hass.helpers.entity_registry.async_get_registry())
     asyncio.create_task(hass.helpers.area_registry.async_get_registry())
 
-    # Start setup
-    if stage_1_domains:
-        _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(
-                    hass, stage_1_domains, config, setup_started
-                )
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
-
-    # Enables after dependencies
-    async_set_domains_to_be_loaded(hass, stage_2_domains)
-
-    if stage_2_domains:
-        _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(
-                    hass, stage_2_domains, config, setup_started
-                )
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+    scheduler = SetupScheduler(
+        hass,
+        config,
+        _build_setup_graph(domains_to_setup, integration_cache, stages),
+        stages,
+        hass.config.setup_concurrency,
+    )
+    log_task = asyncio.create_task(
+        _async_log_pending_setups(domains_to_setup, setup_started)
+    )
+    try:
+        async with hass.timeout.async_timeout(SETUP_TIMEOUT, cool_down=COOLDOWN_TIME):
+            await scheduler.async_run()
+    except asyncio.TimeoutError:
+        _LOGGER.warning("Setup timed out for integrations - moving forward")
+        scheduler.async_start_remaining()
+    finally:
+        log_task.cancel()
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -549,3 +692,112 @@ async def _async_set_up_integrations(
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+
+    hass.data.pop(loader.DATA_IMPORT_PREFETCH)
+    timeline = async_get_setup_timeline(hass)
+    for domain, (start, end) in prefetch.timings.items():
+        timeline.add_span(domain, "prefetch", start, end)
+    _LOGGER.info(
+        "Imported %d integrations ahead of setup, moving %.2f seconds of imports out of the event loop",
+        len(prefetch.timings),
+        sum(end - start for start, end in prefetch.timings.values()),
+    )
+
+
+async def _async_prefetch_imports(
+    hass: core.HomeAssistant,
+    config: Dict[str, Any],
+    prefetch: loader.ImportPrefetch,
+    integration_cache: Dict[str, loader.Integration],
+) -> None:
+    """Schedule importing the integrations and configured platforms to set up."""
+    platforms: Dict[str, Set[str]] = {}
+    for domain in integration_cache:
+        for p_name, _ in config_per_platform(config, domain):
+            if p_name is not None:
+                platforms.setdefault(p_name, set()).add(domain)
+
+    # Platforms forwarded by config entries are not in the configuration
+    entry_domains = set(hass.config_entries.async_domains())
+    for domain, modules in (
+        await hass.async_add_executor_job(
+            _platform_modules,
+            [
+                integration
+                for domain, integration in integration_cache.items()
+                if domain in entry_domains
+            ],
+        )
+    ).items():
+        platforms.setdefault(domain, set()).update(modules)
+
+    integrations = dict(integration_cache)
+    for int_or_exc in await gather_with_concurrency(
+        loader.MAX_LOAD_CONCURRENTLY,
+        *(
+            loader.async_get_integration(hass, p_name)
+            for p_name in platforms
+            if p_name not in integrations
+        ),
+        return_exceptions=True,
+    ):
+        if isinstance(int_or_exc, loader.Integration):
+            integrations[int_or_exc.domain] = int_or_exc
+
+    # Modules importing missing requirements fail to import. The requirements
+    # are installed during setup, when the integration is imported again.
+    installed = await hass.async_add_executor_job(
+        _requirements_installed, list(integrations.values())
+    )
+    blocked = set(integrations) - installed
+    changed = True
+    while changed:
+        changed = False
+        for domain, integration in integrations.items():
+            if domain not in blocked and not blocked.isdisjoint(
+                [
+                    *integration.dependencies,
+                    *integration.after_dependencies,
+                    *platforms.get(domain, ()),
+                ]
+            ):
+                blocked.add(domain)
+                changed = True
+
+    if blocked:
+        _LOGGER.debug("Not importing ahead of setup: %s", blocked)
+
+    for domain, integration in integrations.items():
+        if domain not in blocked:
+            prefetch.async_schedule(integration, platforms.get(domain, ()))
+
+
+def _platform_modules(integrations: List[loader.Integration]) -> Dict[str, Set[str]]:
+    """Return the modules of integrations named after a built-in integration."""
+    built_in = set()
+    for path in components.__path__:  # type: ignore
+        built_in.update(os.listdir(path))
+
+    modules = {}
+    for integration in integrations:
+        try:
+            names = os.listdir(integration.file_path)
+        except OSError:
+            continue
+        modules[integration.domain] = {
+            name[:-3] if name.endswith(".py") else name for name in names
+        }.intersection(built_in) - {integration.domain}
+    return modules
+
+
+def _requirements_installed(integrations: List[loader.Integration]) -> Set[str]:
+    """Return the domains of the integrations with all requirements installed."""
+    installed = set()
+    for integration in integrations:
+        try:
+            if all(is_installed(req) for req in integration.requirements):
+                installed.add(integration.domain)
+        except ValueError:
+            # Invalid requirement, reported when it is processed
+            pass
+    return installed
@@ -6,7 +6,8 @@ import logging
 import aiohttp
 import async_timeout
 
-from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
+from homeassistant.const import EVENT_STATE_CHANGED, HTTP_ACCEPTED, STATE_ON
+from homeassistant.core import callback
 import homeassistant.util.dt as dt_util
 
 from .const import API_CHANGE, Cause
@@ -25,20 +26,26 @@ async def async_enable_proactive_mode(hass, smart_home_config):
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
-        if not hass.is_running:
-            return
-
-        if not new_state:
-            return
+    @callback
+    def async_entity_state_filter(event):
+        """Filter state changes of exposed entities."""
+        new_state = event.data["new_state"]
+        if not hass.is_running or new_state is None:
+            return False
 
         if new_state.domain not in ENTITY_ADAPTERS:
-            return
+            return False
+
+        if not smart_home_config.should_expose(new_state.entity_id):
+            _LOGGER.debug(
+                "Not exposing %s because filtered by config", new_state.entity_id
+            )
+            return False
 
-        if not smart_home_config.should_expose(changed_entity):
-            _LOGGER.debug("Not exposing %s because filtered by config", changed_entity)
-            return
+        return True
 
+    async def async_entity_state_listener(event):
+        new_state = event.data["new_state"]
         alexa_changed_entity = ENTITY_ADAPTERS[new_state.domain](
             hass, smart_home_config, new_state
         )
@@ -58,8 +65,10 @@ async def async_enable_proactive_mode(hass, smart_home_config):
                 )
                 return
 
-    return hass.helpers.event.async_track_state_change(
-        MATCH_ALL, async_entity_state_listener
+    return hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        async_entity_state_listener,
+        event_filter=async_entity_state_filter,
     )
 
 
@@ -1,5 +1,6 @@
 """Rest API for Home Assistant."""
 import asyncio
+from functools import lru_cache
 import json
 import logging
 
@@ -7,12 +8,16 @@ from aiohttp import web
 from aiohttp.web_exceptions import HTTPBadRequest
 import async_timeout
 import voluptuous as vol
+from voluptuous.humanize import humanize_error
 
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
     HTTP_CREATED,
@@ -32,13 +37,19 @@ from homeassistant.const import (
     __version__,
 )
 import homeassistant.core as ha
-from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
-from homeassistant.helpers import template
+from homeassistant.exceptions import (
+    HomeAssistantError,
+    ServiceNotFound,
+    TemplateError,
+    Unauthorized,
+)
+from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.state import AsyncTrackStates
 from homeassistant.helpers.system_info import async_get_system_info
+from homeassistant.setup import async_get_setup_timeline
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +65,16 @@ ATTR_VERSION = "version"
 DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
+URL_API_SETUP_TIMELINE = "/api/setup_timeline"
+
+STATE_WRITE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("state"): cv.string,
+        vol.Optional("attributes"): dict,
+        vol.Optional("force_update", default=False): cv.boolean,
+    }
+)
 
 
 async def async_setup(hass, config):
@@ -70,6 +91,7 @@ async def async_setup(hass, config):
     hass.http.register_view(APIDomainServicesView)
     hass.http.register_view(APIComponentsView)
     hass.http.register_view(APITemplateView)
+    hass.http.register_view(APISetupTimelineView)
 
     if DATA_LOGGING in hass.data:
         hass.http.register_view(APIErrorLog)
@@ -107,6 +129,16 @@ class APIEventStream(HomeAssistantView):
         if restrict:
             restrict = restrict.split(",") + [EVENT_HOMEASSISTANT_STOP]
 
+        entity_ids = request.query.get("entity_id")
+        entity_ids = set(entity_ids.split(",")) if entity_ids else None
+        domains = request.query.get("domain")
+        domains = {f"{domain}." for domain in domains.split(",")} if domains else None
+
+        if request.query.get("compact"):
+            serialize = _cached_compact_event_payload
+        else:
+            serialize = _cached_event_payload
+
         async def forward_events(event):
             """Forward events to the open request."""
             if event.event_type == EVENT_TIME_CHANGED:
@@ -115,12 +147,16 @@ class APIEventStream(HomeAssistantView):
             if restrict and event.event_type not in restrict:
                 return
 
-            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
-
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
                 data = stop_obj
             else:
-                data = json.dumps(event, cls=JSONEncoder)
+                if (entity_ids or domains) and not _entity_matches(
+                    event.data.get(ATTR_ENTITY_ID), entity_ids, domains
+                ):
+                    return
+                data = serialize(event)
+
+            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
 
             await to_write.put(data)
 
@@ -160,6 +196,43 @@ class APIEventStream(HomeAssistantView):
         return response
 
 
+def _entity_matches(entity_id, entity_ids, domains):
+    """Return if the entity id of an event passes the stream filters."""
+    if not isinstance(entity_id, str):
+        return False
+    if entity_ids and entity_id in entity_ids:
+        return True
+    return bool(domains) and entity_id.startswith(tuple(domains))
+
+
+@lru_cache(maxsize=128)
+def _cached_event_payload(event):
+    """Serialize an event.
+
+    Events are shared by all streams, so each one is serialized only once.
+    """
+    return json.dumps(event, cls=JSONEncoder)
+
+
+@lru_cache(maxsize=128)
+def _cached_compact_event_payload(event):
+    """Serialize an event, reducing state changes to the new state."""
+    if event.event_type != EVENT_STATE_CHANGED:
+        return _cached_event_payload(event)
+
+    new_state = event.data.get("new_state")
+    payload = {
+        "event_type": event.event_type,
+        "entity_id": event.data[ATTR_ENTITY_ID],
+        "state": None,
+    }
+    if new_state is not None:
+        payload["state"] = new_state.state
+        payload["attributes"] = dict(new_state.attributes)
+        payload["last_changed"] = new_state.last_changed
+    return json.dumps(payload, cls=JSONEncoder)
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -229,7 +302,67 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        try:
+            body = f"[{', '.join(state.as_json() for state in states)}]"
+        except (ValueError, TypeError):
+            # Logged and turned into an error response
+            return self.json(states)
+        response = web.Response(body=body, content_type=CONTENT_TYPE_JSON)
+        response.enable_compression()
+        return response
+
+    async def post(self, request):
+        """Update the state of multiple entities."""
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        hass = request.app["hass"]
+        try:
+            data = await request.json()
+        except ValueError:
+            return self.json_message("Invalid JSON specified.", HTTP_BAD_REQUEST)
+
+        if not isinstance(data, list):
+            return self.json_message("Expected a list of states.", HTTP_BAD_REQUEST)
+
+        context = self.context(request)
+        results = []
+
+        for item in data:
+            try:
+                item = STATE_WRITE_SCHEMA(item)
+            except vol.Invalid as err:
+                entity_id = item.get("entity_id") if isinstance(item, dict) else None
+                results.append(
+                    {
+                        "entity_id": entity_id,
+                        "success": False,
+                        "error": humanize_error(item, err),
+                    }
+                )
+                continue
+
+            entity_id = item["entity_id"]
+            is_new_state = hass.states.get(entity_id) is None
+
+            try:
+                hass.states.async_set(
+                    entity_id,
+                    item["state"],
+                    item.get("attributes"),
+                    item["force_update"],
+                    context,
+                )
+            except HomeAssistantError as err:
+                results.append(
+                    {"entity_id": entity_id, "success": False, "error": str(err)}
+                )
+                continue
+
+            results.append(
+                {"entity_id": entity_id, "success": True, "created": is_new_state}
+            )
+
+        return self.json(results)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -430,6 +563,26 @@ class APIErrorLog(HomeAssistantView):
         return web.FileResponse(request.app["hass"].data[DATA_LOGGING])
 
 
+class APISetupTimelineView(HomeAssistantView):
+    """View to download the setup timeline as a Chrome trace."""
+
+    url = URL_API_SETUP_TIMELINE
+    name = "api:setup_timeline"
+
+    @ha.callback
+    def get(self, request):
+        """Retrieve the setup timeline."""
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        timeline = async_get_setup_timeline(request.app["hass"])
+        return self.json(
+            timeline.as_chrome_trace(),
+            headers={
+                "Content-Disposition": 'attachment; filename="setup_timeline.json"'
+            },
+        )
+
+
 async def async_services_json(hass):
     """Generate services data to JSONify."""
     descriptions = await async_get_all_descriptions(hass)
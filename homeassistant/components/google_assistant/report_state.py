@@ -1,7 +1,7 @@
 """Google Report State implementation."""
 import logging
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
@@ -20,15 +20,20 @@ _LOGGER = logging.getLogger(__name__)
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
-        if not hass.is_running:
-            return
-
-        if not new_state:
-            return
+    @callback
+    def async_entity_state_filter(event):
+        """Filter state changes of exposed entities."""
+        new_state = event.data["new_state"]
+        return (
+            hass.is_running
+            and new_state is not None
+            and google_config.should_expose(new_state)
+        )
 
-        if not google_config.should_expose(new_state):
-            return
+    async def async_entity_state_listener(event):
+        changed_entity = event.data["entity_id"]
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
 
         entity = GoogleEntity(hass, google_config, new_state)
 
@@ -80,6 +85,8 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
     async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    return hass.helpers.event.async_track_state_change(
-        MATCH_ALL, async_entity_state_listener
+    return hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        async_entity_state_listener,
+        event_filter=async_entity_state_filter,
     )
@@ -3,6 +3,7 @@ from contextvars import ContextVar
 from ipaddress import ip_network
 import logging
 import os
+from pathlib import Path
 import ssl
 from traceback import extract_stack
 from typing import Dict, Optional, cast
@@ -26,11 +27,22 @@ from homeassistant.util import ssl as ssl_util
 
 from .auth import setup_auth
 from .ban import setup_bans
-from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_HASS_USER  # noqa: F401
+from .const import (  # noqa: F401
+    DATA_REQUEST_STATS,
+    KEY_AUTHENTICATED,
+    KEY_HASS,
+    KEY_HASS_USER,
+)
 from .cors import setup_cors
 from .forwarded import async_setup_forwarded
 from .request_context import setup_request_context
-from .static import CACHE_HEADERS, CachingStaticResource
+from .static import (
+    CachingStaticResource,
+    StaticFile,
+    async_get_static_file,
+    async_serve_static_file,
+)
+from .stats import RequestStats, setup_request_stats
 from .view import HomeAssistantView  # noqa: F401
 from .web_runner import HomeAssistantTCPSite
 
@@ -50,6 +62,7 @@ CONF_TRUSTED_PROXIES = "trusted_proxies"
 CONF_LOGIN_ATTEMPTS_THRESHOLD = "login_attempts_threshold"
 CONF_IP_BAN_ENABLED = "ip_ban_enabled"
 CONF_SSL_PROFILE = "ssl_profile"
+CONF_REQUEST_STATS = "request_stats"
 
 SSL_MODERN = "modern"
 SSL_INTERMEDIATE = "intermediate"
@@ -93,6 +106,7 @@ HTTP_SCHEMA = vol.All(
             vol.Optional(CONF_SSL_PROFILE, default=SSL_MODERN): vol.In(
                 [SSL_INTERMEDIATE, SSL_MODERN]
             ),
+            vol.Optional(CONF_REQUEST_STATS, default=False): cv.boolean,
         }
     ),
 )
@@ -205,6 +219,7 @@ async def async_setup(hass, config):
     is_ban_enabled = conf[CONF_IP_BAN_ENABLED]
     login_threshold = conf[CONF_LOGIN_ATTEMPTS_THRESHOLD]
     ssl_profile = conf[CONF_SSL_PROFILE]
+    request_stats = conf[CONF_REQUEST_STATS]
 
     server = HomeAssistantHTTP(
         hass,
@@ -219,6 +234,7 @@ async def async_setup(hass, config):
         login_threshold=login_threshold,
         is_ban_enabled=is_ban_enabled,
         ssl_profile=ssl_profile,
+        request_stats=request_stats,
     )
 
     startup_listeners = []
@@ -289,6 +305,7 @@ class HomeAssistantHTTP:
         login_threshold,
         is_ban_enabled,
         ssl_profile,
+        request_stats=False,
     ):
         """Initialize the HTTP Home Assistant server."""
         app = self.app = web.Application(
@@ -304,6 +321,10 @@ class HomeAssistantHTTP:
 
         setup_request_context(app, current_request)
 
+        if request_stats:
+            stats = hass.data[DATA_REQUEST_STATS] = RequestStats()
+            setup_request_stats(app, stats)
+
         if is_ban_enabled:
             setup_bans(hass, app, login_threshold)
 
@@ -372,10 +393,14 @@ class HomeAssistantHTTP:
             return
 
         if cache_headers:
+            index: Dict[str, StaticFile] = {}
 
             async def serve_file(request):
-                """Serve file from disk."""
-                return web.FileResponse(path, headers=CACHE_HEADERS)
+                """Serve file from the static file index."""
+                static_file = await async_get_static_file(
+                    self.hass, index, path, Path(path)
+                )
+                return await async_serve_static_file(request, static_file)
 
         else:
 
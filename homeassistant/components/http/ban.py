@@ -1,10 +1,11 @@
 """Ban logic for HTTP component."""
+import asyncio
 from collections import defaultdict
 from datetime import datetime
-from ipaddress import ip_address
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
 import logging
 from socket import gethostbyaddr, herror
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from aiohttp.web import middleware
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
@@ -45,8 +46,9 @@ def setup_bans(hass, app, login_threshold):
 
     async def ban_startup(app):
         """Initialize bans when app starts up."""
-        app[KEY_BANNED_IPS] = await async_load_ip_bans_config(
-            hass, hass.config.path(IP_BANS_FILE)
+        path = hass.config.path(IP_BANS_FILE)
+        app[KEY_BANNED_IPS] = IpBanStore(
+            hass, path, await async_load_ip_bans_config(hass, path)
         )
 
     app.on_startup.append(ban_startup)
@@ -60,12 +62,7 @@ async def ban_middleware(request, handler):
         return await handler(request)
 
     # Verify if IP is not banned
-    ip_address_ = ip_address(request.remote)
-    is_banned = any(
-        ip_ban.ip_address == ip_address_ for ip_ban in request.app[KEY_BANNED_IPS]
-    )
-
-    if is_banned:
+    if ip_address(request.remote) in request.app[KEY_BANNED_IPS]:
         raise HTTPForbidden()
 
     try:
@@ -134,12 +131,7 @@ async def process_wrong_login(request):
         request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr]
         >= request.app[KEY_LOGIN_THRESHOLD]
     ):
-        new_ban = IpBan(remote_addr)
-        request.app[KEY_BANNED_IPS].append(new_ban)
-
-        await hass.async_add_executor_job(
-            update_ip_bans_config, hass.config.path(IP_BANS_FILE), new_ban
-        )
+        request.app[KEY_BANNED_IPS].async_add(IpBan(remote_addr))
 
         _LOGGER.warning("Banned IP %s for too many login attempts", remote_addr)
 
@@ -174,13 +166,87 @@ async def process_success_login(request):
 
 
 class IpBan:
-    """Represents banned IP address."""
+    """Represents banned IP address or network."""
 
-    def __init__(self, ip_ban: str, banned_at: Optional[datetime] = None) -> None:
+    def __init__(
+        self,
+        ip_ban: Union[str, IPv4Address, IPv6Address],
+        banned_at: Optional[datetime] = None,
+    ) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        self.ip_network = ip_network(ip_ban)
         self.banned_at = banned_at or dt_util.utcnow()
 
+    def __str__(self) -> str:
+        """Return the banned address, or network in CIDR notation."""
+        if self.ip_network.num_addresses == 1:
+            return str(self.ip_network.network_address)
+        return str(self.ip_network)
+
+
+class IpBanStore:
+    """Banned IP addresses and networks, indexed for fast lookups.
+
+    Networks are stored per IP version and prefix length as the integer value
+    of their prefix, so a lookup is a set lookup per prefix length in use.
+    New bans are appended to the bans file in batches in the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, ip_bans: List[IpBan]) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self.path = path
+        self._index: Dict[Tuple[int, int], Set[int]] = {}
+        self._count = 0
+        self._pending: List[IpBan] = []
+        self._write_task: Optional[asyncio.Task] = None
+
+        for ip_ban in ip_bans:
+            self._add_to_index(ip_ban)
+
+    def __len__(self) -> int:
+        """Return the number of bans."""
+        return self._count
+
+    def __contains__(self, address: Union[IPv4Address, IPv6Address]) -> bool:
+        """Return if an IP address is banned."""
+        value = int(address)
+        for (version, prefixlen), prefixes in self._index.items():
+            if (
+                version == address.version
+                and value >> (address.max_prefixlen - prefixlen) in prefixes
+            ):
+                return True
+        return False
+
+    def _add_to_index(self, ip_ban: IpBan) -> None:
+        """Add a ban to the index."""
+        network = ip_ban.ip_network
+        self._index.setdefault((network.version, network.prefixlen), set()).add(
+            int(network.network_address) >> (network.max_prefixlen - network.prefixlen)
+        )
+        self._count += 1
+
+    @callback
+    def async_add(self, ip_ban: IpBan) -> None:
+        """Ban an IP address or network and schedule saving it."""
+        self._add_to_index(ip_ban)
+        self._pending.append(ip_ban)
+
+        if self._write_task is None:
+            self._write_task = self.hass.async_create_task(self._async_write())
+
+    async def _async_write(self) -> None:
+        """Append the pending bans to the bans file."""
+        try:
+            while self._pending:
+                ip_bans, self._pending = self._pending, []
+                await self.hass.async_add_executor_job(
+                    update_ip_bans_config, self.path, ip_bans
+                )
+        finally:
+            self._write_task = None
+
 
 async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> List[IpBan]:
     """Load list of banned IPs from config file."""
@@ -198,16 +264,19 @@ async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> List[IpBa
         try:
             ip_info = SCHEMA_IP_BAN_ENTRY(ip_info)
             ip_list.append(IpBan(ip_ban, ip_info["banned_at"]))
-        except vol.Invalid as err:
+        except (vol.Invalid, ValueError) as err:
             _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
             continue
 
     return ip_list
 
 
-def update_ip_bans_config(path: str, ip_ban: IpBan) -> None:
-    """Update config file with new banned IP address."""
+def update_ip_bans_config(path: str, ip_bans: List[IpBan]) -> None:
+    """Update config file with new banned IP addresses."""
     with open(path, "a") as out:
-        ip_ = {str(ip_ban.ip_address): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}}
+        ip_ = {
+            str(ip_ban): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}
+            for ip_ban in ip_bans
+        }
         out.write("\n")
         out.write(yaml.dump(ip_))
@@ -2,3 +2,6 @@
 KEY_AUTHENTICATED = "ha_authenticated"
 KEY_HASS = "hass"
 KEY_HASS_USER = "hass_user"
+
+# Data used to store the request statistics, when enabled
+DATA_REQUEST_STATS = "http.request_stats"
@@ -1,22 +1,274 @@
 """Static file handling for HTTP component."""
+import hashlib
+import math
+import mimetypes
 from pathlib import Path
+import re
+from typing import Dict, List, Optional, Set, Tuple
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
-from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
+from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound, HTTPNotModified
 from aiohttp.web_urldispatcher import StaticResource
 
+from homeassistant.helpers.typing import HomeAssistantType
+
+from .const import KEY_HASS
+
 # mypy: allow-untyped-defs
 
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
+IMMUTABLE_CACHE_TIME = 365 * 86400  # = 1 year
+IMMUTABLE_CACHE_HEADERS = {
+    hdrs.CACHE_CONTROL: f"public, max-age={IMMUTABLE_CACHE_TIME}, immutable"
+}
+
+# Build tools add a content hash to the file name, like app.de2d54bf.js
+FINGERPRINT_RE = re.compile(r"\.[0-9a-f]{8,}\.")
+
+# Precompressed variants in order of preference
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+# (content encoding, path, etag, last modified)
+Representation = Tuple[Optional[str], Path, str, int]
+# Modification time in ns and size of a file, None if it does not exist
+Signature = Optional[Tuple[int, int]]
+
+
+def _stat_signature(path: Path) -> Signature:
+    """Return the modification time and size of a file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _candidates(path: Path) -> List[Path]:
+    """Return the paths of a file and its possible precompressed variants."""
+    return [
+        path.with_name(path.name + suffix) for _, suffix in PRECOMPRESSED_VARIANTS
+    ] + [path]
+
+
+class StaticFile:
+    """A file in the static file index with its precompressed variants."""
+
+    __slots__ = (
+        "content_type",
+        "headers",
+        "representations",
+        "signatures",
+    )
+
+    def __init__(
+        self,
+        content_type: str,
+        headers: Dict[str, str],
+        representations: List[Representation],
+        signatures: List[Signature],
+    ) -> None:
+        """Initialize the static file."""
+        self.content_type = content_type
+        self.headers = headers
+        # Ordered by preference, the uncompressed file is always last
+        self.representations = representations
+        # Signatures of the file and its possible variants when indexed
+        self.signatures = signatures
+
+    def select(self, accept_encoding: str) -> Representation:
+        """Return the preferred representation acceptable to the client."""
+        accepted = _accepted_encodings(accept_encoding)
+        for representation in self.representations:
+            encoding = representation[0]
+            if encoding is None or encoding in accepted or "*" in accepted:
+                return representation
+        return self.representations[-1]
+
+    def is_current(self) -> bool:
+        """Return if the file and its variants did not change since indexed.
+
+        Does I/O, run in the executor.
+        """
+        path = self.representations[-1][1]
+        return [_stat_signature(path) for path in _candidates(path)] == self.signatures
+
+
+def _accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Return the content codings of an Accept-Encoding header."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _file_hash(path: Path) -> str:
+    """Return the hash of the contents of a file."""
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as fil:
+        for chunk in iter(lambda: fil.read(HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()[:32]
+
+
+def index_file(path: Path) -> StaticFile:
+    """Build the index entry of a file.
+
+    Does I/O, run in the executor.
+    """
+    # Before reading, so a change while reading is noticed next time
+    signatures = [_stat_signature(candidate) for candidate in _candidates(path)]
+    if signatures[-1] is None:
+        raise FileNotFoundError(path)
+    content_hash = _file_hash(path)
+    representations: List[Representation] = []
+
+    for candidate, signature, (encoding, _) in zip(
+        _candidates(path), signatures, PRECOMPRESSED_VARIANTS + ((None, ""),)
+    ):
+        if signature is None:
+            continue
+        representations.append(
+            (
+                encoding,
+                candidate,
+                f'"{content_hash}-{encoding}"' if encoding else f'"{content_hash}"',
+                # HTTP dates have a resolution of one second, FileResponse
+                # rounds up
+                math.ceil(signature[0] / 1e9),
+            )
+        )
+
+    if FINGERPRINT_RE.search(path.name):
+        headers = IMMUTABLE_CACHE_HEADERS
+    else:
+        headers = CACHE_HEADERS
+
+    return StaticFile(
+        mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        headers,
+        representations,
+        signatures,
+    )
+
+
+def _not_modified(request: Request, etag: str, last_modified: int) -> bool:
+    """Return if the client has the current representation."""
+    if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+
+    if if_none_match is not None:
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag in ("*", etag):
+                return True
+        return False
+
+    modified_since = request.if_modified_since
+    return modified_since is not None and last_modified <= modified_since.timestamp()
+
+
+class _RepresentationFileResponse(FileResponse):
+    """File response serving a selected representation of a file as is.
+
+    FileResponse replaces a file with its gzip variant if the Accept-Encoding
+    header mentions gzip, even if the client refused it.
+    """
+
+    async def prepare(self, request: Request) -> Optional[AbstractStreamWriter]:
+        """Prepare the response, without looking for a gzip variant."""
+        if hdrs.CONTENT_ENCODING not in self.headers and "gzip" in request.headers.get(
+            hdrs.ACCEPT_ENCODING, ""
+        ):
+            headers = request.headers.copy()
+            del headers[hdrs.ACCEPT_ENCODING]
+            request = request.clone(headers=headers)
+        return await super().prepare(request)
+
+
+async def async_serve_static_file(
+    request: Request, static_file: StaticFile, chunk_size: int = 256 * 1024
+) -> StreamResponse:
+    """Serve the best representation of an indexed file.
+
+    Conditional requests are answered from the index, other requests with a
+    FileResponse of the selected representation.
+    """
+    encoding, path, etag, last_modified = static_file.select(
+        request.headers.get(hdrs.ACCEPT_ENCODING, "")
+    )
+    headers = {**static_file.headers, hdrs.ETAG: etag}
+
+    if len(static_file.representations) > 1:
+        headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+    if _not_modified(request, etag, last_modified):
+        return Response(status=HTTPNotModified.status_code, headers=headers)
+
+    headers[hdrs.CONTENT_TYPE] = static_file.content_type
+    if encoding is not None:
+        headers[hdrs.CONTENT_ENCODING] = encoding
+
+    return _RepresentationFileResponse(path, chunk_size=chunk_size, headers=headers)
+
+
+async def async_get_static_file(
+    hass: HomeAssistantType, index: Dict[str, StaticFile], key: str, path: Path
+) -> StaticFile:
+    """Return the index entry of a file, indexing it if it changed.
+
+    Raises HTTPNotFound if the file does not exist.
+    """
+    static_file = index.get(key)
+    if static_file is not None and await hass.async_add_executor_job(
+        static_file.is_current
+    ):
+        return static_file
+
+    try:
+        static_file = index[key] = await hass.async_add_executor_job(index_file, path)
+    except FileNotFoundError as err:
+        index.pop(key, None)
+        raise HTTPNotFound() from err
+    return static_file
 
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Served files are indexed on first access. The index entry is used while
+    the file and its precompressed variants do not change.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the resource."""
+        super().__init__(*args, **kwargs)
+        self._index: Dict[str, StaticFile] = {}
 
     async def _handle(self, request):
         rel_url = request.match_info["filename"]
+        hass = request.app[KEY_HASS]
+        static_file = self._index.get(rel_url)
+
+        if static_file is not None:
+            static_file = await async_get_static_file(
+                hass, self._index, rel_url, static_file.representations[-1][1]
+            )
+            return await async_serve_static_file(request, static_file, self._chunk_size)
+
         try:
             filename = Path(rel_url)
             if filename.anchor:
@@ -39,10 +291,8 @@ class CachingStaticResource(StaticResource):
         if filepath.is_dir():
             return await super()._handle(request)
         if filepath.is_file():
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
-                headers=CACHE_HEADERS,  # type: ignore
+            static_file = await async_get_static_file(
+                hass, self._index, rel_url, filepath
             )
+            return await async_serve_static_file(request, static_file, self._chunk_size)
         raise HTTPNotFound
@@ -0,0 +1,128 @@
+"""Middleware to collect request timing statistics per route."""
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp.web import FileResponse, HTTPException, Request, StreamResponse, middleware
+
+from homeassistant.const import HTTP_INTERNAL_SERVER_ERROR
+from homeassistant.core import callback
+from homeassistant.util.histogram import DURATION_BUCKETS, SIZE_BUCKETS, Histogram
+
+# mypy: allow-untyped-defs
+
+# Start of requests with a file response that is not prepared yet
+KEY_STATS_START = "ha_request_stats_start"
+
+
+class RequestStatsEntry:
+    """Histograms and status counts for a single route and method."""
+
+    __slots__ = ("duration", "response_size", "status")
+
+    def __init__(self) -> None:
+        """Initialize the entry."""
+        self.duration = Histogram(DURATION_BUCKETS)
+        self.response_size = Histogram(SIZE_BUCKETS)
+        self.status: Dict[int, int] = {}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the entry."""
+        return {
+            "duration": self.duration.as_dict(),
+            "response_size": self.response_size.as_dict(),
+            "status": {str(status): count for status, count in self.status.items()},
+        }
+
+
+class RequestStats:
+    """Collect request statistics per route."""
+
+    def __init__(self) -> None:
+        """Initialize the request stats."""
+        # (method, route) -> entry
+        self.routes: Dict[Tuple[str, str], RequestStatsEntry] = {}
+
+    @callback
+    def async_record(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        response_size: Optional[int],
+    ) -> None:
+        """Record a handled request."""
+        entry = self.routes.get((method, route))
+        if entry is None:
+            entry = self.routes[(method, route)] = RequestStatsEntry()
+        entry.duration.add(duration)
+        if response_size is not None:
+            entry.response_size.add(response_size)
+        entry.status[status] = entry.status.get(status, 0) + 1
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """Return a JSON serializable representation of the stats."""
+        return [
+            {"method": method, "route": route, **entry.as_dict()}
+            for (method, route), entry in self.routes.items()
+        ]
+
+
+def _response_size(response: StreamResponse) -> Optional[int]:
+    """Return the size of the body of a response."""
+    if response.content_length is not None:
+        return response.content_length
+    # Streamed responses know their size once they have been written
+    return response.body_length or None
+
+
+@callback
+def setup_request_stats(app, stats: RequestStats):
+    """Create request statistics middleware for the app."""
+
+    @callback
+    def record(
+        request: Request, status: int, response_size: Optional[int], start: float
+    ) -> None:
+        """Record a request if it matched a route."""
+        resource = request.match_info.route.resource
+        if resource is None:
+            return
+        stats.async_record(
+            request.method,
+            resource.canonical,
+            status,
+            perf_counter() - start,
+            response_size,
+        )
+
+    @middleware
+    async def request_stats_middleware(request, handler):
+        """Request statistics middleware."""
+        start = perf_counter()
+
+        try:
+            response = await handler(request)
+        except HTTPException as err:
+            record(request, err.status, _response_size(err), start)
+            raise
+        except Exception:
+            # Turned into an internal server error by aiohttp
+            record(request, HTTP_INTERNAL_SERVER_ERROR, None, start)
+            raise
+
+        if isinstance(response, FileResponse) and not response.prepared:
+            # File responses only know their size once aiohttp prepares them
+            request[KEY_STATS_START] = start
+        else:
+            record(request, response.status, _response_size(response), start)
+        return response
+
+    async def request_stats_on_prepare(request, response):
+        """Record requests whose response is prepared after the middleware."""
+        start = request.pop(KEY_STATS_START, None)
+        if start is not None:
+            record(request, response.status, response.content_length, start)
+
+    app.middlewares.append(request_stats_middleware)
+    app.on_response_prepare.append(request_stats_on_prepare)
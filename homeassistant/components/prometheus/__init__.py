@@ -4,6 +4,7 @@ import string
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -13,11 +14,13 @@ from homeassistant.components.climate.const import (
     CURRENT_HVAC_ACTIONS,
 )
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http.const import DATA_REQUEST_STATS
 from homeassistant.components.humidifier.const import (
     ATTR_AVAILABLE_MODES,
     ATTR_HUMIDITY,
     ATTR_MODE,
 )
+from homeassistant.components.websocket_api.const import DATA_COMMAND_STATS
 from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
     ATTR_DEVICE_CLASS,
@@ -25,6 +28,7 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     ATTR_UNIT_OF_MEASUREMENT,
     CONTENT_TYPE_TEXT_PLAIN,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     PERCENTAGE,
     STATE_ON,
@@ -104,6 +108,16 @@ def setup(hass, config):
     )
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
+
+    registry = prometheus_client.REGISTRY
+    collector = InstrumentationCollector(hass, namespace)
+    registry.register(collector)
+
+    def unregister_collector(event):
+        """Stop exporting the statistics of this instance."""
+        registry.unregister(collector)
+
+    hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, unregister_collector)
     return True
 
 
@@ -473,6 +487,86 @@ class PrometheusMetrics:
         metric.labels(**self._labels(state)).inc()
 
 
+class InstrumentationCollector:
+    """Export the internal instrumentation histograms of Home Assistant."""
+
+    def __init__(self, hass, namespace):
+        """Initialize the collector."""
+        self.hass = hass
+        if namespace:
+            self.metrics_prefix = f"{namespace}_"
+        else:
+            self.metrics_prefix = ""
+
+    @staticmethod
+    def describe():
+        """Return no descriptions, the exported metrics depend on runtime data."""
+        return []
+
+    def collect(self):
+        """Yield the metric families."""
+        command_stats = self.hass.data.get(DATA_COMMAND_STATS)
+        if command_stats is not None:
+            yield from self._collect_histograms(
+                "websocket_command",
+                ["command"],
+                {
+                    (command,): entry
+                    for command, entry in command_stats.commands.items()
+                },
+                {
+                    "duration": ("duration_seconds", "Time handlers held the loop"),
+                    "response_time": (
+                        "response_time_seconds",
+                        "Time until async handlers finished",
+                    ),
+                    "payload_size": ("payload_bytes", "Size of the received messages"),
+                },
+            )
+
+        request_stats = self.hass.data.get(DATA_REQUEST_STATS)
+        if request_stats is not None:
+            yield from self._collect_histograms(
+                "http_request",
+                ["method", "route"],
+                request_stats.routes,
+                {
+                    "duration": ("duration_seconds", "Time until responses were ready"),
+                    "response_size": ("response_bytes", "Size of the responses"),
+                },
+            )
+
+            responses = CounterMetricFamily(
+                f"{self.metrics_prefix}http_responses",
+                "Number of responses per status code",
+                labels=["method", "route", "status"],
+            )
+            for (method, route), entry in request_stats.routes.items():
+                for status, count in entry.status.items():
+                    responses.add_metric([method, route, str(status)], count)
+            yield responses
+
+    def _collect_histograms(self, prefix, labels, entries, histograms):
+        """Yield a histogram family per histogram attribute of the entries."""
+        for attr, (suffix, documentation) in histograms.items():
+            family = HistogramMetricFamily(
+                f"{self.metrics_prefix}{prefix}_{suffix}",
+                documentation,
+                labels=labels,
+            )
+            for label_values, entry in entries.items():
+                histogram = getattr(entry, attr)
+                if not histogram.count:
+                    continue
+                bounds = [str(bound) for bound in histogram.bounds] + ["+Inf"]
+                family.add_metric(
+                    list(label_values),
+                    list(zip(bounds, histogram.cumulative_counts())),
+                    histogram.sum,
+                )
+            yield family
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
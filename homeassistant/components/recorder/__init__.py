@@ -2,7 +2,7 @@
 import asyncio
 from collections import namedtuple
 import concurrent.futures
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import queue
 import threading
@@ -31,6 +31,7 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
@@ -199,6 +200,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack"])
 
 
+class CommitTask:
+    """An object to insert into the recorder queue to commit the session."""
+
+
+class KeepAliveTask:
+    """An object to insert into the recorder queue to keep the connection alive."""
+
+
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
@@ -240,9 +249,7 @@ class Recorder(threading.Thread):
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
-        self._timechanges_seen = 0
         self._commits_without_expire = 0
-        self._keepalive_count = 0
         self._old_states = {}
         self._pending_expunge = []
         self.event_session = None
@@ -252,7 +259,9 @@ class Recorder(threading.Thread):
     @callback
     def async_initialize(self):
         """Initialize the recorder."""
-        self.hass.bus.async_listen(MATCH_ALL, self.event_listener)
+        self.hass.bus.async_listen(
+            MATCH_ALL, self.event_listener, event_filter=self._async_event_filter
+        )
 
     def do_adhoc_purge(self, **kwargs):
         """Trigger an adhoc purge retaining keep_days worth of data."""
@@ -315,6 +324,16 @@ class Recorder(threading.Thread):
 
             self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, shutdown)
 
+            if self.commit_interval:
+                async_track_time_interval(
+                    self.hass,
+                    self.async_commit,
+                    timedelta(seconds=self.commit_interval),
+                )
+            async_track_time_interval(
+                self.hass, self.async_keep_alive, timedelta(seconds=KEEPALIVE_TIME)
+            )
+
             if self.hass.state == CoreState.running:
                 hass_started.set_result(None)
             else:
@@ -351,8 +370,8 @@ class Recorder(threading.Thread):
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
         # Use a session for the event read loop
-        # with a commit every time the event time
-        # has changed. This reduces the disk io.
+        # with a commit every commit interval.
+        # This reduces the disk io.
         while True:
             event = self.queue.get()
             if event is None:
@@ -367,25 +386,13 @@ class Recorder(threading.Thread):
             if isinstance(event, WaitTask):
                 self._queue_watch.set()
                 continue
-            if event.event_type == EVENT_TIME_CHANGED:
-                self._keepalive_count += 1
-                if self._keepalive_count >= KEEPALIVE_TIME:
-                    self._keepalive_count = 0
-                    self._send_keep_alive()
-                if self.commit_interval:
-                    self._timechanges_seen += 1
-                    if self._timechanges_seen >= self.commit_interval:
-                        self._timechanges_seen = 0
-                        self._commit_event_session_or_retry()
+            if isinstance(event, CommitTask):
+                self._commit_event_session_or_retry()
                 continue
-            if event.event_type in self.exclude_t:
+            if isinstance(event, KeepAliveTask):
+                self._send_keep_alive()
                 continue
 
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
-                    continue
-
             try:
                 if event.event_type == EVENT_STATE_CHANGED:
                     dbevent = Events.from_event(event, event_data="{}")
@@ -534,11 +541,30 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             self.event_session.expire_all()
 
+    @callback
+    def _async_event_filter(self, event):
+        """Return if an event should be recorded."""
+        if event.event_type == EVENT_TIME_CHANGED or event.event_type in self.exclude_t:
+            return False
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        return entity_id is None or self.entity_filter(entity_id)
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
         self.queue.put(event)
 
+    @callback
+    def async_commit(self, now):
+        """Put a commit task in the process queue."""
+        self.queue.put(CommitTask())
+
+    @callback
+    def async_keep_alive(self, now):
+        """Put a keep alive task in the process queue."""
+        self.queue.put(KeepAliveTask())
+
     def block_till_done(self):
         """Block till all events processed.
 
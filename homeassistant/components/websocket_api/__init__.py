@@ -4,6 +4,7 @@ from typing import Optional, Union, cast
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
 from homeassistant.loader import bind_hass
 
 from . import commands, connection, const, decorators, http, messages  # noqa
@@ -31,6 +32,7 @@ from .messages import (  # noqa
     event_message,
     result_message,
 )
+from .stats import CommandStats
 
 # mypy: allow-untyped-calls, allow-untyped-defs
 
@@ -38,6 +40,17 @@ DOMAIN = const.DOMAIN
 
 DEPENDENCIES = ("http",)
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Maybe(
+            vol.Schema(
+                {vol.Optional(const.CONF_COMMAND_STATS, default=False): cv.boolean}
+            )
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 @bind_hass
 @callback
@@ -63,6 +76,11 @@ def async_register_command(
 
 async def async_setup(hass, config):
     """Initialize the websocket API."""
+    conf = config.get(DOMAIN) or {}
+
+    if conf.get(const.CONF_COMMAND_STATS):
+        hass.data[const.DATA_COMMAND_STATS] = CommandStats()
+
     hass.http.register_view(http.WebsocketAPIView)
     commands.async_register_commands(hass, async_register_command)
     return True
@@ -4,7 +4,10 @@ import asyncio
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
+from homeassistant.bootstrap import DATA_LOOP_MONITOR
+from homeassistant.components.http.const import DATA_REQUEST_STATS
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
+from homeassistant.config import DATA_CONFIG_VALIDATION_TIMES
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
 from homeassistant.core import DOMAIN as HASS_DOMAIN, callback
 from homeassistant.exceptions import (
@@ -18,6 +21,7 @@ from homeassistant.helpers.event import TrackTemplate, async_track_template_resu
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.template import Template
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_timeline
 
 from . import const, decorators, messages
 
@@ -40,6 +44,11 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
+    async_reg(hass, handle_command_stats)
+    async_reg(hass, handle_request_stats)
+    async_reg(hass, handle_loop_monitor)
+    async_reg(hass, handle_executor_pools)
+    async_reg(hass, handle_setup_timeline)
 
 
 def pong_message(iden):
@@ -68,27 +77,26 @@ def handle_subscribe_events(hass, connection, msg):
     if event_type == EVENT_STATE_CHANGED:
 
         @callback
-        def forward_events(event):
-            """Forward state changed events to websocket."""
-            if not connection.user.permissions.check_entity(
+        def event_filter(event):
+            """Filter state changed events the user can read."""
+            return connection.user.permissions.check_entity(
                 event.data["entity_id"], POLICY_READ
-            ):
-                return
-
-            connection.send_message(messages.cached_event_message(msg["id"], event))
+            )
 
     else:
 
         @callback
-        def forward_events(event):
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
+        def event_filter(event):
+            """Filter out timer ticks."""
+            return event.event_type != EVENT_TIME_CHANGED
 
-            connection.send_message(messages.cached_event_message(msg["id"], event))
+    @callback
+    def forward_events(event):
+        """Forward events to websocket."""
+        connection.send_message(messages.cached_event_message(msg["id"], event))
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
+        event_type, forward_events, event_filter=event_filter
     )
 
     connection.send_message(messages.result_message(msg["id"]))
@@ -181,7 +189,13 @@ def handle_get_states(hass, connection, msg):
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    try:
+        response = messages.states_result_message(msg["id"], states)
+    except (ValueError, TypeError):
+        # Reported as a serialization error when it is sent
+        response = messages.result_message(msg["id"], states)
+
+    connection.send_message(response)
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -409,3 +423,73 @@ async def handle_test_condition(hass, connection, msg):
     connection.send_result(
         msg["id"], {"result": check_condition(hass, msg.get("variables"))}
     )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "websocket_api/command_stats"})
+@decorators.require_admin
+def handle_command_stats(hass, connection, msg):
+    """Handle command stats command."""
+    stats = hass.data.get(const.DATA_COMMAND_STATS)
+
+    if stats is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_SUPPORTED, "Command statistics are not enabled"
+        )
+        return
+
+    connection.send_result(msg["id"], stats.as_dict())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "http/request_stats"})
+@decorators.require_admin
+def handle_request_stats(hass, connection, msg):
+    """Handle HTTP request stats command."""
+    stats = hass.data.get(DATA_REQUEST_STATS)
+
+    if stats is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_SUPPORTED, "Request statistics are not enabled"
+        )
+        return
+
+    connection.send_result(msg["id"], stats.as_list())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "loop_monitor"})
+@decorators.require_admin
+def handle_loop_monitor(hass, connection, msg):
+    """Handle event loop monitor command."""
+    monitor = hass.data.get(DATA_LOOP_MONITOR)
+
+    if monitor is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_SUPPORTED, "Event loop monitor is not running"
+        )
+        return
+
+    connection.send_result(msg["id"], monitor.as_dict())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "executor_pools"})
+@decorators.require_admin
+def handle_executor_pools(hass, connection, msg):
+    """Handle executor pools command."""
+    connection.send_result(msg["id"], hass.executor_pools.as_list())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "setup_timeline"})
+@decorators.require_admin
+def handle_setup_timeline(hass, connection, msg):
+    """Handle setup timeline command."""
+    connection.send_result(
+        msg["id"],
+        {
+            **async_get_setup_timeline(hass).as_dict(),
+            "config_validation": hass.data.get(DATA_CONFIG_VALIDATION_TIMES, {}),
+        },
+    )
@@ -1,5 +1,6 @@
 """Connection session."""
 import asyncio
+from time import perf_counter
 from typing import Any, Callable, Dict, Hashable, Optional
 
 import voluptuous as vol
@@ -54,8 +55,11 @@ class ActiveConnection:
         self.send_message(messages.error_message(msg_id, code, message))
 
     @callback
-    def async_handle(self, msg):
-        """Handle a single incoming message."""
+    def async_handle(self, msg, payload=None):
+        """Handle a single incoming message.
+
+        The raw payload is only used to record its size in the command stats.
+        """
         handlers = self.hass.data[const.DOMAIN]
 
         try:
@@ -90,12 +94,21 @@ class ActiveConnection:
             return
 
         handler, schema = handlers[msg["type"]]
+        stats = self.hass.data.get(const.DATA_COMMAND_STATS)
+        start = perf_counter() if stats is not None else 0
 
         try:
             handler(self.hass, self, schema(msg))
         except Exception as err:  # pylint: disable=broad-except
             self.async_handle_exception(msg, err)
 
+        if stats is not None:
+            stats.async_record(
+                msg["type"],
+                perf_counter() - start,
+                None if payload is None else len(payload.encode("utf-8")),
+            )
+
         self.last_id = cur_id
 
     @callback
@@ -45,4 +45,9 @@ SIGNAL_WEBSOCKET_DISCONNECTED = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS = f"{DOMAIN}.connections"
 
+# Data used to store the command handler statistics, when enabled
+DATA_COMMAND_STATS = f"{DOMAIN}.command_stats"
+
+CONF_COMMAND_STATS = "command_stats"
+
 JSON_DUMP = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
@@ -1,6 +1,7 @@
 """Decorators for the Websocket API."""
 import asyncio
 from functools import wraps
+from time import perf_counter
 from typing import Awaitable, Callable
 
 from homeassistant.core import HomeAssistant, callback
@@ -14,11 +15,17 @@ from .connection import ActiveConnection
 
 async def _handle_async_response(func, hass, connection, msg):
     """Create a response and handle exception."""
+    stats = hass.data.get(const.DATA_COMMAND_STATS)
+    start = perf_counter() if stats is not None else 0
+
     try:
         await func(hass, connection, msg)
     except Exception as err:  # pylint: disable=broad-except
         connection.async_handle_exception(msg, err)
 
+    if stats is not None:
+        stats.async_record_response_time(msg["type"], perf_counter() - start)
+
 
 def async_response(
     func: Callable[[HomeAssistant, ActiveConnection, dict], Awaitable[None]]
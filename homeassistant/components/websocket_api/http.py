@@ -210,7 +210,7 @@ class WebSocketHandler:
                     break
 
                 self._logger.debug("Received %s", msg_data)
-                connection.async_handle(msg_data)
+                connection.async_handle(msg_data, msg.data)
 
         except asyncio.CancelledError:
             self._logger.info("Connection closed by client")
@@ -2,11 +2,11 @@
 
 from functools import lru_cache
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -37,6 +37,18 @@ def result_message(iden: int, result: Any = None) -> Dict:
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def states_result_message(iden: int, states: Iterable[State]) -> str:
+    """Return a success result message with a list of states.
+
+    Reuses the JSON representation that each state caches.
+    """
+    result = ", ".join(state.as_json() for state in states)
+    return (
+        f'{{"id": {iden}, "type": "{const.TYPE_RESULT}", "success": true, '
+        f'"result": [{result}]}}'
+    )
+
+
 def error_message(iden: int, code: str, message: str) -> Dict:
     """Return an error result message."""
     return {
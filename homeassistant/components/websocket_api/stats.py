@@ -0,0 +1,61 @@
+"""Instrumentation of websocket command handlers."""
+from typing import Any, Dict, Optional
+
+from homeassistant.core import callback
+from homeassistant.util.histogram import DURATION_BUCKETS, SIZE_BUCKETS, Histogram
+
+
+class CommandStatsEntry:
+    """Histograms for a single command type."""
+
+    __slots__ = ("duration", "response_time", "payload_size")
+
+    def __init__(self) -> None:
+        """Initialize the entry."""
+        # Time the handler held the event loop when it was dispatched.
+        self.duration = Histogram(DURATION_BUCKETS)
+        # Time until an async handler finished.
+        self.response_time = Histogram(DURATION_BUCKETS)
+        self.payload_size = Histogram(SIZE_BUCKETS)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the entry."""
+        return {
+            "duration": self.duration.as_dict(),
+            "response_time": self.response_time.as_dict(),
+            "payload_size": self.payload_size.as_dict(),
+        }
+
+
+class CommandStats:
+    """Collect handler statistics per websocket command type."""
+
+    def __init__(self) -> None:
+        """Initialize the command stats."""
+        self.commands: Dict[str, CommandStatsEntry] = {}
+
+    def _entry(self, command: str) -> CommandStatsEntry:
+        """Return the entry of a command, creating it if needed."""
+        entry = self.commands.get(command)
+        if entry is None:
+            entry = self.commands[command] = CommandStatsEntry()
+        return entry
+
+    @callback
+    def async_record(
+        self, command: str, duration: float, payload_size: Optional[int]
+    ) -> None:
+        """Record a dispatched command."""
+        entry = self._entry(command)
+        entry.duration.add(duration)
+        if payload_size is not None:
+            entry.payload_size.add(payload_size)
+
+    @callback
+    def async_record_response_time(self, command: str, response_time: float) -> None:
+        """Record the time it took an async handler to finish."""
+        self._entry(command).response_time.add(response_time)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the stats."""
+        return {command: entry.as_dict() for command, entry in self.commands.items()}
@@ -5,8 +5,9 @@ import logging
 import os
 import re
 import shutil
+from timeit import default_timer as timer
 from types import ModuleType
-from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
@@ -28,6 +29,7 @@ from homeassistant.const import (
     CONF_CUSTOMIZE_DOMAIN,
     CONF_CUSTOMIZE_GLOB,
     CONF_ELEVATION,
+    CONF_EXECUTOR_POOLS,
     CONF_EXTERNAL_URL,
     CONF_ID,
     CONF_INTERNAL_URL,
@@ -37,6 +39,7 @@ from homeassistant.const import (
     CONF_MEDIA_DIRS,
     CONF_NAME,
     CONF_PACKAGES,
+    CONF_SETUP_CONCURRENCY,
     CONF_TEMPERATURE_UNIT,
     CONF_TIME_ZONE,
     CONF_TYPE,
@@ -51,7 +54,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, extract_domain_configs
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
-from homeassistant.loader import Integration, IntegrationNotFound
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.loader import (
+    Integration,
+    IntegrationNotFound,
+    async_wait_for_import_prefetch,
+)
 from homeassistant.requirements import (
     RequirementsNotFound,
     async_get_integration_with_requirements,
@@ -59,14 +67,17 @@ from homeassistant.requirements import (
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
 from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml.cache import load_yaml_cached
 
 _LOGGER = logging.getLogger(__name__)
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
+DATA_CONFIG_VALIDATION_TIMES = "config_validation_times"
 RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+YAML_CACHE_FILE = "core.yaml_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
 
@@ -226,6 +237,12 @@ CORE_CONFIG_SCHEMA = CUSTOMIZE_CONFIG_SCHEMA.extend(
         # pylint: disable=no-value-for-parameter
         vol.Optional(CONF_MEDIA_DIRS): cv.schema_with_slug_keys(vol.IsDir()),
         vol.Optional(CONF_LEGACY_TEMPLATES): cv.boolean,
+        vol.Optional(CONF_EXECUTOR_POOLS): cv.schema_with_slug_keys(
+            vol.All(vol.Coerce(int), vol.Range(min=1))
+        ),
+        vol.Optional(CONF_SETUP_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
     }
 )
 
@@ -312,21 +329,32 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     """
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
-        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE)
+        None,
+        load_yaml_config_file,
+        hass.config.path(YAML_CONFIG_FILE),
+        hass.config.path(STORAGE_DIR, YAML_CACHE_FILE),
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
-def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
+def load_yaml_config_file(
+    config_path: str, cache_path: Optional[str] = None
+) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
+    If cache_path is given, the parsed file is cached there and reused while
+    none of the files it was loaded from change.
+
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path)
+    if cache_path is None:
+        conf_dict = load_yaml(config_path)
+    else:
+        conf_dict = load_yaml_cached(config_path, cache_path)
 
     if not isinstance(conf_dict, dict):
         msg = (
@@ -503,6 +531,7 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: Dict) -> Non
         (CONF_EXTERNAL_URL, "external_url"),
         (CONF_MEDIA_DIRS, "media_dirs"),
         (CONF_LEGACY_TEMPLATES, "legacy_templates"),
+        (CONF_SETUP_CONCURRENCY, "setup_concurrency"),
     ):
         if key in config:
             setattr(hac, attr, config[key])
@@ -539,6 +568,9 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: Dict) -> Non
             for url in config[CONF_ALLOWLIST_EXTERNAL_URLS]
         )
 
+    if CONF_EXECUTOR_POOLS in config:
+        hass.executor_pools.configure(config[CONF_EXECUTOR_POOLS])
+
     # Customize
     cust_exact = dict(config[CONF_CUSTOMIZE])
     cust_domain = dict(config[CONF_CUSTOMIZE_DOMAIN])
@@ -740,6 +772,7 @@ async def async_process_component_config(
     This method must be run in the event loop.
     """
     domain = integration.domain
+    await async_wait_for_import_prefetch(hass, domain)
     try:
         component = integration.get_component()
     except ImportError as ex:
@@ -772,90 +805,159 @@ async def async_process_component_config(
             _LOGGER.exception("Unknown error calling %s config validator", domain)
             return None
 
-    # No custom config validator, proceed with schema validation
-    if hasattr(component, "CONFIG_SCHEMA"):
-        try:
-            return component.CONFIG_SCHEMA(config)  # type: ignore
-        except vol.Invalid as ex:
-            async_log_exception(ex, domain, config, hass, integration.documentation)
-            return None
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception("Unknown error calling %s CONFIG_SCHEMA", domain)
-            return None
-
-    component_platform_schema = getattr(
-        component, "PLATFORM_SCHEMA_BASE", getattr(component, "PLATFORM_SCHEMA", None)
-    )
+    # No custom config validator, proceed with schema validation.
+    # Schemas only transform the data passed to them, so they are run in the
+    # executor to validate the configuration of integrations concurrently.
+    validation_time = 0.0
+    try:
+        if hasattr(component, "CONFIG_SCHEMA"):
+            [(validated, err)], elapsed = await hass.async_add_executor_job(
+                _validate_configs, [(component.CONFIG_SCHEMA, config)]  # type: ignore
+            )
+            validation_time += elapsed
+            if isinstance(err, vol.Invalid):
+                async_log_exception(
+                    err, domain, config, hass, integration.documentation
+                )
+                return None
+            if err is not None:
+                _LOGGER.error(
+                    "Unknown error calling %s CONFIG_SCHEMA", domain, exc_info=err
+                )
+                return None
+            return validated  # type: ignore
 
-    if component_platform_schema is None:
-        return config
+        component_platform_schema = getattr(
+            component,
+            "PLATFORM_SCHEMA_BASE",
+            getattr(component, "PLATFORM_SCHEMA", None),
+        )
 
-    platforms = []
-    for p_name, p_config in config_per_platform(config, domain):
-        # Validate component specific platform schema
-        try:
-            p_validated = component_platform_schema(p_config)
-        except vol.Invalid as ex:
-            async_log_exception(ex, domain, p_config, hass, integration.documentation)
-            continue
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Unknown error validating %s platform config with %s component platform schema",
-                p_name,
-                domain,
-            )
-            continue
+        if component_platform_schema is None:
+            return config
 
-        # Not all platform components follow same pattern for platforms
-        # So if p_name is None we are not going to validate platform
-        # (the automation component is one of them)
-        if p_name is None:
-            platforms.append(p_validated)
-            continue
+        p_configs = list(config_per_platform(config, domain))
+        results, elapsed = await hass.async_add_executor_job(
+            _validate_configs,
+            [(component_platform_schema, p_config) for _, p_config in p_configs],
+        )
+        validation_time += elapsed
+
+        # Validated configs by position, to keep the order of the platforms
+        platforms: Dict[int, Any] = {}
+        # Platforms that still need to be validated with their own schema
+        pending: List[Tuple[int, str, Dict, Integration, Callable[[Any], Any]]] = []
+
+        for index, ((p_name, p_config), (p_validated, err)) in enumerate(
+            zip(p_configs, results)
+        ):
+            # Validate component specific platform schema
+            if isinstance(err, vol.Invalid):
+                async_log_exception(
+                    err, domain, p_config, hass, integration.documentation
+                )
+                continue
+            if err is not None:
+                _LOGGER.error(
+                    "Unknown error validating %s platform config with %s component platform schema",
+                    p_name,
+                    domain,
+                    exc_info=err,
+                )
+                continue
 
-        try:
-            p_integration = await async_get_integration_with_requirements(hass, p_name)
-        except (RequirementsNotFound, IntegrationNotFound) as ex:
-            _LOGGER.error("Platform error: %s - %s", domain, ex)
-            continue
+            # Not all platform components follow same pattern for platforms
+            # So if p_name is None we are not going to validate platform
+            # (the automation component is one of them)
+            if p_name is None:
+                platforms[index] = p_validated
+                continue
 
-        try:
-            platform = p_integration.get_platform(domain)
-        except ImportError:
-            _LOGGER.exception("Platform error: %s", domain)
-            continue
+            try:
+                p_integration = await async_get_integration_with_requirements(
+                    hass, p_name
+                )
+            except (RequirementsNotFound, IntegrationNotFound) as ex:
+                _LOGGER.error("Platform error: %s - %s", domain, ex)
+                continue
 
-        # Validate platform specific schema
-        if hasattr(platform, "PLATFORM_SCHEMA"):
+            await async_wait_for_import_prefetch(hass, p_name)
             try:
-                p_validated = platform.PLATFORM_SCHEMA(p_config)  # type: ignore
-            except vol.Invalid as ex:
+                platform = p_integration.get_platform(domain)
+            except ImportError:
+                _LOGGER.exception("Platform error: %s", domain)
+                continue
+
+            # Validate platform specific schema
+            if hasattr(platform, "PLATFORM_SCHEMA"):
+                pending.append(
+                    (index, p_name, p_config, p_integration, platform.PLATFORM_SCHEMA)  # type: ignore
+                )
+            else:
+                platforms[index] = p_validated
+
+        if pending:
+            results, elapsed = await hass.async_add_executor_job(
+                _validate_configs,
+                [(schema, p_config) for _, _, p_config, _, schema in pending],
+            )
+            validation_time += elapsed
+
+        for (index, p_name, p_config, p_integration, _), (p_validated, err) in zip(
+            pending, results
+        ):
+            if isinstance(err, vol.Invalid):
                 async_log_exception(
-                    ex,
+                    err,
                     f"{domain}.{p_name}",
                     p_config,
                     hass,
                     p_integration.documentation,
                 )
                 continue
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception(
+            if err is not None:
+                _LOGGER.error(
                     "Unknown error validating config for %s platform for %s component with PLATFORM_SCHEMA",
                     p_name,
                     domain,
+                    exc_info=err,
                 )
                 continue
 
-        platforms.append(p_validated)
+            platforms[index] = p_validated
+
+    finally:
+        hass.data.setdefault(DATA_CONFIG_VALIDATION_TIMES, {})[domain] = validation_time
+        _LOGGER.debug(
+            "Validated configuration of %s in %.3f seconds", domain, validation_time
+        )
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
     config = config_without_domain(config, domain)
-    config[domain] = platforms
+    config[domain] = [platforms[index] for index in sorted(platforms)]
 
     return config
 
 
+def _validate_configs(
+    validations: Sequence[Tuple[Callable[[Any], Any], Any]]
+) -> Tuple[List[Tuple[Any, Optional[Exception]]], float]:
+    """Validate configs with their schemas.
+
+    Returns the validated config or the raised exception for each config and
+    the time it took to validate them.
+    """
+    start = timer()
+    results: List[Tuple[Any, Optional[Exception]]] = []
+    for schema, conf in validations:
+        try:
+            results.append((schema(conf), None))
+        except Exception as err:  # pylint: disable=broad-except
+            results.append((None, err))
+    return results, timer() - start
+
+
 @callback
 def config_without_domain(config: Dict, domain: str) -> Dict:
     """Return a config with all configuration for a domain removed."""
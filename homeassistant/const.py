@@ -95,6 +95,7 @@ CONF_EVENT = "event"
 CONF_EVENT_DATA = "event_data"
 CONF_EVENT_DATA_TEMPLATE = "event_data_template"
 CONF_EXCLUDE = "exclude"
+CONF_EXECUTOR_POOLS = "executor_pools"
 CONF_EXTERNAL_URL = "external_url"
 CONF_FILENAME = "filename"
 CONF_FILE_PATH = "file_path"
@@ -162,6 +163,7 @@ CONF_SEQUENCE = "sequence"
 CONF_SERVICE = "service"
 CONF_SERVICE_DATA = "data"
 CONF_SERVICE_TEMPLATE = "service_template"
+CONF_SETUP_CONCURRENCY = "setup_concurrency"
 CONF_SHOW_ON_MAP = "show_on_map"
 CONF_SLAVE = "slave"
 CONF_SOURCE = "source"
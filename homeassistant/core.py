@@ -5,10 +5,12 @@ Home Assistant is a Home Automation framework for observing the state
 of entities and react to changes.
 """
 import asyncio
+from collections import OrderedDict
 import datetime
 import enum
 import functools
 from ipaddress import ip_address
+import json
 import logging
 import os
 import pathlib
@@ -29,6 +31,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -41,6 +44,7 @@ import yarl
 from homeassistant import block_async_io, loader, util
 from homeassistant.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
     ATTR_SECONDS,
@@ -73,6 +77,8 @@ from homeassistant.exceptions import (
 from homeassistant.util import location, network
 from homeassistant.util.async_ import fire_coroutine_threadsafe, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import ExecutorPools
+from homeassistant.util.json import JSONEncoder
 from homeassistant.util.thread import fix_threading_exception_logging
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
@@ -105,6 +111,10 @@ BLOCK_LOG_TIMEOUT = 60
 
 # How long we wait for the result of a service call
 SERVICE_CALL_LIMIT = 10  # seconds
+# How many services of a batch run at the same time
+SERVICE_CALL_BATCH_PARALLEL = 10
+# How many validated payloads are kept per service
+SERVICE_VALIDATION_CACHE_SIZE = 64
 
 # Source of core configuration
 SOURCE_DISCOVERED = "discovered"
@@ -236,6 +246,8 @@ class HomeAssistant:
         self._stopped: Optional[asyncio.Event] = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Named executor pools to isolate blocking work
+        self.executor_pools = ExecutorPools()
 
     @property
     def is_running(self) -> bool:
@@ -397,10 +409,15 @@ class HomeAssistant:
 
     @callback
     def async_add_executor_job(
-        self, target: Callable[..., T], *args: Any
+        self, target: Callable[..., T], *args: Any, pool: Optional[str] = None
     ) -> Awaitable[T]:
-        """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        """Add an executor job from within the event loop.
+
+        If pool is the name of a configured executor pool, the job runs in that
+        pool instead of the default executor.
+        """
+        executor = self.executor_pools.get(pool) if pool is not None else None
+        task = self.loop.run_in_executor(executor, target, *args)
 
         # If a task is scheduled
         if self._track_task:
@@ -558,6 +575,13 @@ class HomeAssistant:
                 "Timed out waiting for shutdown stage 3 to complete, the shutdown will continue"
             )
 
+        if self.executor_pools.pools:
+            try:
+                async with self.timeout.async_timeout(30):
+                    await self.loop.run_in_executor(None, self.executor_pools.shutdown)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Timed out waiting for the executor pools to shut down")
+
         self.exit_code = exit_code
         self.state = CoreState.stopped
 
@@ -571,7 +595,7 @@ class Context:
 
     user_id: str = attr.ib(default=None)
     parent_id: Optional[str] = attr.ib(default=None)
-    id: str = attr.ib(factory=uuid_util.random_uuid_hex)
+    id: str = attr.ib(factory=uuid_util.ulid_hex)
 
     def as_dict(self) -> dict:
         """Return a dictionary representation of the context."""
@@ -652,8 +676,12 @@ class EventBus:
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: Dict[str, List[HassJob]] = {}
+        self._listeners: Dict[
+            str, List[Tuple[HassJob, Optional[Callable[[Event], bool]]]]
+        ] = {}
         self._hass = hass
+        # Called by the timer to resume ticking when a time listener is added
+        self._time_listener_added: Optional[Callable[[], None]] = None
 
     @callback
     def async_listeners(self) -> Dict[str, int]:
@@ -663,6 +691,16 @@ class EventBus:
         """
         return {key: len(self._listeners[key]) for key in self._listeners}
 
+    @callback
+    def async_has_listeners(self, event_type: str) -> bool:
+        """Return if there are listeners for an event type.
+
+        Listeners for all events are not taken into account.
+
+        This method must be run in the event loop.
+        """
+        return bool(self._listeners.get(event_type))
+
     @property
     def listeners(self) -> Dict[str, int]:
         """Return dictionary with events and the number of listeners."""
@@ -708,7 +746,14 @@ class EventBus:
         if not listeners:
             return
 
-        for job in listeners:
+        for job, event_filter in listeners:
+            if event_filter is not None:
+                try:
+                    if not event_filter(event):
+                        continue
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in event filter")
+                    continue
             self._hass.async_add_hass_job(job, event)
 
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
@@ -728,23 +773,43 @@ class EventBus:
         return remove_listener
 
     @callback
-    def async_listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
+    def async_listen(
+        self,
+        event_type: str,
+        listener: Callable,
+        event_filter: Optional[Callable[[Event], bool]] = None,
+    ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
         To listen to all events specify the constant ``MATCH_ALL``
         as event_type.
 
+        An optional event_filter, which must be a callback decorated with
+        @callback, is run inside async_fire. The listener is only scheduled
+        for events the filter returns True for.
+
         This method must be run in the event loop.
         """
-        return self._async_listen_job(event_type, HassJob(listener))
+        if event_filter is not None and not is_callback(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        return self._async_listen_filterable_job(
+            event_type, (HassJob(listener), event_filter)
+        )
 
     @callback
-    def _async_listen_job(self, event_type: str, hassjob: HassJob) -> CALLBACK_TYPE:
-        self._listeners.setdefault(event_type, []).append(hassjob)
+    def _async_listen_filterable_job(
+        self,
+        event_type: str,
+        filterable_job: Tuple[HassJob, Optional[Callable[[Event], bool]]],
+    ) -> CALLBACK_TYPE:
+        self._listeners.setdefault(event_type, []).append(filterable_job)
+
+        if event_type == EVENT_TIME_CHANGED and self._time_listener_added is not None:
+            self._time_listener_added()
 
         def remove_listener() -> None:
             """Remove the listener."""
-            self._async_remove_listener(event_type, hassjob)
+            self._async_remove_listener(event_type, filterable_job)
 
         return remove_listener
 
@@ -777,12 +842,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        job: Optional[HassJob] = None
+        filterable_job: Optional[Tuple[HassJob, None]] = None
 
         @callback
         def _onetime_listener(event: Event) -> None:
             """Remove listener from event bus and then fire listener."""
-            nonlocal job
+            nonlocal filterable_job
             if hasattr(_onetime_listener, "run"):
                 return
             # Set variable so that we will never run twice.
@@ -791,22 +856,26 @@ class EventBus:
             # multiple times as well.
             # This will make sure the second time it does nothing.
             setattr(_onetime_listener, "run", True)
-            assert job is not None
-            self._async_remove_listener(event_type, job)
+            assert filterable_job is not None
+            self._async_remove_listener(event_type, filterable_job)
             self._hass.async_run_job(listener, event)
 
-        job = HassJob(_onetime_listener)
+        filterable_job = (HassJob(_onetime_listener), None)
 
-        return self._async_listen_job(event_type, job)
+        return self._async_listen_filterable_job(event_type, filterable_job)
 
     @callback
-    def _async_remove_listener(self, event_type: str, hassjob: HassJob) -> None:
+    def _async_remove_listener(
+        self,
+        event_type: str,
+        filterable_job: Tuple[HassJob, Optional[Callable[[Event], bool]]],
+    ) -> None:
         """Remove a listener of a specific event_type.
 
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(hassjob)
+            self._listeners[event_type].remove(filterable_job)
 
             # delete event_type list if empty
             if not self._listeners[event_type]:
@@ -814,7 +883,9 @@ class EventBus:
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
-            _LOGGER.exception("Unable to remove unknown job listener %s", hassjob)
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
 
 
 class State:
@@ -840,6 +911,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_json",
     ]
 
     def __init__(
@@ -875,6 +947,7 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: Optional[Dict[str, Collection[Any]]] = None
+        self._as_json: Optional[str] = None
 
     @property
     def name(self) -> str:
@@ -907,6 +980,18 @@ class State:
             }
         return self._as_dict
 
+    def as_json(self) -> str:
+        """Return the JSON representation of the State.
+
+        Async friendly.
+
+        Serialized once, raises ValueError or TypeError if the attributes
+        can't be serialized.
+        """
+        if self._as_json is None:
+            self._as_json = json.dumps(self.as_dict(), cls=JSONEncoder, allow_nan=False)
+        return self._as_json
+
     @classmethod
     def from_dict(cls, json_dict: Dict) -> Any:
         """Initialize a state from a dict.
@@ -967,6 +1052,8 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: Dict[str, State] = {}
+        # domain -> entity_id -> state
+        self._domain_index: Dict[str, Dict[str, State]] = {}
         self._reservations: Set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -990,13 +1077,9 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
-        ]
+        return [state.entity_id for state in self._async_domain_states(domain_filter)]
 
     @callback
     def async_entity_ids_count(
@@ -1010,10 +1093,11 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._domain_index.get(domain, ()))
+            for domain in {domain.lower() for domain in domain_filter}
         )
 
     def all(self, domain_filter: Optional[Union[str, Iterable]] = None) -> List[State]:
@@ -1034,11 +1118,24 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
+        return self._async_domain_states(domain_filter)
+
+    @callback
+    def _async_domain_states(self, domain_filter: Iterable) -> List[State]:
+        """Return the states of domains in the order they were added."""
+        domains = {domain.lower() for domain in domain_filter}
+        indexes = [
+            self._domain_index[domain]
+            for domain in domains
+            if domain in self._domain_index
         ]
+        if len(indexes) <= 1:
+            return list(indexes[0].values()) if indexes else []
+
+        # States of multiple domains are interleaved in the state machine
+        return [state for state in self._states.values() if state.domain in domains]
 
     def get(self, entity_id: str) -> Optional[State]:
         """Retrieve state of entity_id or None if not found.
@@ -1081,6 +1178,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1186,6 +1288,7 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1198,7 +1301,7 @@ class StateMachine:
 class Service:
     """Representation of a callable service."""
 
-    __slots__ = ["job", "schema"]
+    __slots__ = ["job", "schema", "validated"]
 
     def __init__(
         self,
@@ -1209,6 +1312,8 @@ class Service:
         """Initialize a service."""
         self.job = HassJob(func)
         self.schema = schema
+        # Hashable representation of service data -> validated data
+        self.validated: "OrderedDict[Any, Dict]" = OrderedDict()
 
 
 class ServiceCall:
@@ -1389,24 +1494,8 @@ class ServiceRegistry:
         context = context or Context()
         service_data = service_data or {}
 
-        try:
-            handler = self._services[domain][service]
-        except KeyError:
-            raise ServiceNotFound(domain, service) from None
-
-        if handler.schema:
-            try:
-                processed_data = handler.schema(service_data)
-            except vol.Invalid:
-                _LOGGER.debug(
-                    "Invalid data for service call %s.%s: %s",
-                    domain,
-                    service,
-                    service_data,
-                )
-                raise
-        else:
-            processed_data = service_data
+        handler = self._get_handler(domain, service)
+        processed_data = self._validate(handler, domain, service, service_data)
 
         service_call = ServiceCall(domain, service, processed_data, context)
 
@@ -1451,6 +1540,194 @@ class ServiceRegistry:
         _LOGGER.debug("Service did not complete before timeout: %s", service_call)
         return False
 
+    async def async_call_batch(
+        self,
+        calls: Iterable[Tuple[str, str, Optional[Dict]]],
+        context: Optional[Context] = None,
+        limit: Optional[float] = SERVICE_CALL_LIMIT,
+        max_parallel: int = SERVICE_CALL_BATCH_PARALLEL,
+    ) -> List[Union[bool, Exception]]:
+        """
+        Call many services and wait for them to finish.
+
+        Calls is an iterable of (domain, service, service_data). A single call_service
+        event is fired for calls that only differ in their entity_id, with the
+        entity ids combined. At most max_parallel handlers run at the same time
+        and the batch waits a maximum of limit for all of them.
+
+        Returns a result for each call: True if it finished, False if it did not
+        finish within limit or the exception it raised.
+
+        This method is a coroutine.
+        """
+        context = context or Context()
+        results: List[Union[bool, Exception]] = []
+        events: Dict[Any, Dict[str, Any]] = {}
+        pending: Dict[int, Tuple[Service, ServiceCall]] = {}
+
+        for index, (domain, service, service_data) in enumerate(calls):
+            domain = domain.lower()
+            service = service.lower()
+            service_data = service_data or {}
+            results.append(True)
+
+            try:
+                handler = self._get_handler(domain, service)
+                processed_data = self._validate(handler, domain, service, service_data)
+            except (ServiceNotFound, vol.Invalid) as err:
+                results[index] = err
+                continue
+
+            self._add_batch_event(events, domain, service, service_data)
+            pending[index] = (
+                handler,
+                ServiceCall(domain, service, processed_data, context),
+            )
+
+        for event_data in events.values():
+            self._hass.bus.async_fire(EVENT_CALL_SERVICE, event_data, context=context)
+
+        if not pending:
+            return results
+
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def execute(handler: Service, service_call: ServiceCall) -> None:
+            """Execute a service when it is its turn."""
+            async with semaphore:
+                await self._execute_service(handler, service_call)
+
+        tasks = {
+            index: self._hass.async_create_task(execute(handler, service_call))
+            for index, (handler, service_call) in pending.items()
+        }
+        try:
+            await asyncio.wait(set(tasks.values()), timeout=limit)
+        except asyncio.CancelledError:
+            _LOGGER.debug("Batched service call was cancelled")
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.wait(set(tasks.values()), timeout=SERVICE_CALL_LIMIT)
+            raise
+
+        for index, task in tasks.items():
+            service_call = pending[index][1]
+            if task.cancelled():
+                results[index] = asyncio.CancelledError()
+            elif not task.done():
+                results[index] = False
+                self._run_service_in_background(task, service_call)
+                _LOGGER.debug(
+                    "Service did not complete before timeout: %s", service_call
+                )
+            elif task.exception() is not None:
+                results[index] = cast(Exception, task.exception())
+
+        return results
+
+    @staticmethod
+    def _add_batch_event(
+        events: Dict[Any, Dict[str, Any]],
+        domain: str,
+        service: str,
+        service_data: Dict,
+    ) -> None:
+        """Add a call to the call_service events fired for a batch.
+
+        Calls that only differ in the entities they target share an event.
+        """
+        entity_ids = service_data.get(ATTR_ENTITY_ID)
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        if not isinstance(entity_ids, list) or not all(
+            isinstance(entity_id, str) and valid_entity_id(entity_id)
+            for entity_id in entity_ids
+        ):
+            entity_ids = None
+
+        try:
+            key: Any = (
+                domain,
+                service,
+                _freeze(
+                    {
+                        attr: value
+                        for attr, value in service_data.items()
+                        if attr != ATTR_ENTITY_ID
+                    }
+                ),
+            )
+        except TypeError:
+            key = object()
+
+        event_data = events.get(key)
+        if event_data is not None:
+            merged_ids = event_data[ATTR_SERVICE_DATA].get(ATTR_ENTITY_ID)
+            if entity_ids is not None and isinstance(merged_ids, list):
+                merged_ids.extend(
+                    entity_id for entity_id in entity_ids if entity_id not in merged_ids
+                )
+                return
+            key = object()
+
+        if entity_ids is not None:
+            service_data = {**service_data, ATTR_ENTITY_ID: list(entity_ids)}
+
+        events[key] = {
+            ATTR_DOMAIN: domain,
+            ATTR_SERVICE: service,
+            ATTR_SERVICE_DATA: service_data,
+        }
+
+    def _get_handler(self, domain: str, service: str) -> Service:
+        """Return the handler of a service."""
+        try:
+            return self._services[domain][service]
+        except KeyError:
+            raise ServiceNotFound(domain, service) from None
+
+    @staticmethod
+    def _validate(
+        handler: Service, domain: str, service: str, service_data: Dict
+    ) -> Dict:
+        """Validate the data of a service call.
+
+        Results are cached per handler for service data that is hashable, so a
+        service that is registered again starts with an empty cache. Cached
+        results are copied, as handlers may change the data of their call.
+        """
+        if not handler.schema:
+            return service_data
+
+        try:
+            key = _freeze(service_data)
+        except TypeError:
+            key = None
+
+        if key is not None and key in handler.validated:
+            handler.validated.move_to_end(key)
+            return cast(Dict, _copy_containers(handler.validated[key]))
+
+        try:
+            processed_data = cast(Dict, handler.schema(service_data))
+        except vol.Invalid:
+            _LOGGER.debug(
+                "Invalid data for service call %s.%s: %s",
+                domain,
+                service,
+                service_data,
+            )
+            raise
+
+        if key is None:
+            return processed_data
+
+        handler.validated[key] = processed_data
+        if len(handler.validated) > SERVICE_VALIDATION_CACHE_SIZE:
+            handler.validated.popitem(last=False)
+
+        return cast(Dict, _copy_containers(processed_data))
+
     def _run_service_in_background(
         self, coro_or_task: Union[Coroutine, asyncio.Task], service_call: ServiceCall
     ) -> None:
@@ -1484,6 +1761,34 @@ class ServiceRegistry:
             await self._hass.async_add_executor_job(handler.job.target, service_call)
 
 
+def _freeze(value: Any) -> Any:
+    """Return a hashable representation of service data.
+
+    Values are paired with their type, as schemas tell apart values that
+    compare equal, like 1, 1.0 and True or lists and tuples.
+
+    Raises TypeError if the data contains values that are not hashable.
+    """
+    if isinstance(value, dict):
+        return (
+            type(value),
+            frozenset((_freeze(key), _freeze(item)) for key, item in value.items()),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _copy_containers(value: Any) -> Any:
+    """Return a copy of the dicts and lists in validated service data."""
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    return value
+
+
 class Config:
     """Configuration settings for Home Assistant."""
 
@@ -1529,6 +1834,9 @@ class Config:
         # Use legacy template behavior
         self.legacy_templates: bool = False
 
+        # Maximum number of integrations set up at the same time on startup
+        self.setup_concurrency: Optional[int] = None
+
     def distance(self, lat: float, lon: float) -> Optional[float]:
         """Calculate distance from Home Assistant.
 
@@ -1739,8 +2047,13 @@ class Config:
 
 
 def _async_create_timer(hass: HomeAssistant) -> None:
-    """Create a timer that will start on HOMEASSISTANT_START."""
-    handle = None
+    """Create a timer that will start on HOMEASSISTANT_START.
+
+    The timer only ticks while there are listeners for time changed events,
+    time patterns are scheduled for when they are due.
+    """
+    handle: Optional[asyncio.TimerHandle] = None
+    stopped = False
     timer_context = Context()
 
     def schedule_tick(now: datetime.datetime) -> None:
@@ -1754,8 +2067,15 @@ def _async_create_timer(hass: HomeAssistant) -> None:
     @callback
     def fire_time_event(target: float) -> None:
         """Fire next time event."""
+        nonlocal handle
+
+        handle = None
         now = dt_util.utcnow()
 
+        if not hass.bus.async_has_listeners(EVENT_TIME_CHANGED):
+            # Resumed by time_listener_added
+            return
+
         hass.bus.async_fire(
             EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=timer_context
         )
@@ -1772,13 +2092,25 @@ def _async_create_timer(hass: HomeAssistant) -> None:
 
         schedule_tick(now)
 
+    @callback
+    def time_listener_added() -> None:
+        """Resume ticking when a listener for time changed events is added."""
+        if handle is None and not stopped:
+            schedule_tick(dt_util.utcnow())
+
     @callback
     def stop_timer(_: Event) -> None:
         """Stop the timer."""
+        nonlocal stopped
+
+        stopped = True
         if handle is not None:
             handle.cancel()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_timer)
+    hass.bus._time_listener_added = (  # pylint: disable=protected-access
+        time_listener_added
+    )
 
     _LOGGER.info("Timer:starting")
     schedule_tick(dt_util.utcnow())
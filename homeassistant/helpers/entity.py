@@ -440,6 +440,16 @@ class Entity(ABC):
         else:
             self.async_write_ha_state()
 
+    @property
+    def _executor_pool(self) -> Optional[str]:
+        """Return the executor pool for blocking calls of the entity.
+
+        This is the integration that provides the entity, which only gets its
+        own pool if one is configured for it and the limit of pools is not
+        reached. Otherwise its jobs run in the default executor.
+        """
+        return self.platform.platform_name if self.platform else None
+
     async def async_device_update(self, warning: bool = True) -> None:
         """Process 'update' or 'async_update' from entity.
 
@@ -458,7 +468,9 @@ class Entity(ABC):
             if hasattr(self, "async_update"):
                 task = self.hass.async_create_task(self.async_update())  # type: ignore
             elif hasattr(self, "update"):
-                task = self.hass.async_add_executor_job(self.update)  # type: ignore
+                task = self.hass.async_add_executor_job(
+                    self.update, pool=self._executor_pool  # type: ignore
+                )
             else:
                 return
 
@@ -687,7 +699,9 @@ class ToggleEntity(Entity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
         assert self.hass is not None
-        await self.hass.async_add_executor_job(ft.partial(self.turn_on, **kwargs))
+        await self.hass.async_add_executor_job(
+            ft.partial(self.turn_on, **kwargs), pool=self._executor_pool
+        )
 
     def turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
@@ -696,7 +710,9 @@ class ToggleEntity(Entity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
         assert self.hass is not None
-        await self.hass.async_add_executor_job(ft.partial(self.turn_off, **kwargs))
+        await self.hass.async_add_executor_job(
+            ft.partial(self.turn_off, **kwargs), pool=self._executor_pool
+        )
 
     def toggle(self, **kwargs: Any) -> None:
         """Toggle the entity."""
@@ -3,6 +3,7 @@ import asyncio
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
 
@@ -18,6 +19,7 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
 from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.setup import async_get_setup_timeline
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
@@ -183,6 +185,7 @@ class EntityPlatform:
         full_name = f"{self.domain}.{self.platform_name}"
 
         logger.info("Setting up %s", full_name)
+        start = timer()
         warn_task = hass.loop.call_later(
             SLOW_SETUP_WARNING,
             logger.warning,
@@ -244,6 +247,9 @@ class EntityPlatform:
             return False
         finally:
             warn_task.cancel()
+            async_get_setup_timeline(hass).add_span(
+                self.platform_name, f"{self.domain} platform", start, timer()
+            )
 
     def _schedule_add_entities(
         self, new_entities: Iterable["Entity"], update_before_add: bool = False
@@ -4,6 +4,8 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
+import itertools
 import logging
 import time
 from typing import (
@@ -62,6 +64,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TIME_PATTERN_SCHEDULER = "track_time_pattern_scheduler"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -260,8 +264,15 @@ def async_track_state_change_event(
                         "Error while processing state changed for %s", entity_id
                     )
 
+        @callback
+        def _async_state_change_filter(event: Event) -> bool:
+            """Filter state changes by entity_id."""
+            return event.data.get("entity_id") in entity_callbacks
+
         hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, _async_state_change_dispatcher
+            EVENT_STATE_CHANGED,
+            _async_state_change_dispatcher,
+            event_filter=_async_state_change_filter,
         )
 
     job = HassJob(action)
@@ -345,8 +356,16 @@ def async_track_entity_registry_updated_event(
                         entity_id,
                     )
 
+        @callback
+        def _async_entity_registry_updated_filter(event: Event) -> bool:
+            """Filter entity registry updates by entity_id."""
+            entity_id = event.data.get("old_entity_id", event.data["entity_id"])
+            return entity_id in entity_callbacks
+
         hass.data[TRACK_ENTITY_REGISTRY_UPDATED_LISTENER] = hass.bus.async_listen(
-            EVENT_ENTITY_REGISTRY_UPDATED, _async_entity_registry_updated_dispatcher
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            _async_entity_registry_updated_dispatcher,
+            event_filter=_async_entity_registry_updated_filter,
         )
 
     job = HassJob(action)
@@ -368,6 +387,15 @@ def async_track_entity_registry_updated_event(
     return remove_listener
 
 
+@callback
+def _async_domain_has_listeners(event: Event, callbacks: Dict[str, List]) -> bool:
+    """Return if there are listeners for the domain of a state change."""
+    return (
+        MATCH_ALL in callbacks
+        or split_entity_id(event.data["entity_id"])[0] in callbacks
+    )
+
+
 @callback
 def _async_dispatch_domain_event(
     hass: HomeAssistant, event: Event, callbacks: Dict[str, List]
@@ -406,13 +434,19 @@ def async_track_state_added_domain(
         @callback
         def _async_state_change_dispatcher(event: Event) -> None:
             """Dispatch state changes by entity_id."""
-            if event.data.get("old_state") is not None:
-                return
-
             _async_dispatch_domain_event(hass, event, domain_callbacks)
 
+        @callback
+        def _async_state_added_filter(event: Event) -> bool:
+            """Filter state changes that add an entity to a tracked domain."""
+            return event.data.get("old_state") is None and _async_domain_has_listeners(
+                event, domain_callbacks
+            )
+
         hass.data[TRACK_STATE_ADDED_DOMAIN_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, _async_state_change_dispatcher
+            EVENT_STATE_CHANGED,
+            _async_state_change_dispatcher,
+            event_filter=_async_state_added_filter,
         )
 
     job = HassJob(action)
@@ -452,13 +486,19 @@ def async_track_state_removed_domain(
         @callback
         def _async_state_change_dispatcher(event: Event) -> None:
             """Dispatch state changes by entity_id."""
-            if event.data.get("new_state") is not None:
-                return
-
             _async_dispatch_domain_event(hass, event, domain_callbacks)
 
+        @callback
+        def _async_state_removed_filter(event: Event) -> bool:
+            """Filter state changes that remove an entity from a tracked domain."""
+            return event.data.get("new_state") is None and _async_domain_has_listeners(
+                event, domain_callbacks
+            )
+
         hass.data[TRACK_STATE_REMOVED_DOMAIN_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, _async_state_change_dispatcher
+            EVENT_STATE_CHANGED,
+            _async_state_change_dispatcher,
+            event_filter=_async_state_removed_filter,
         )
 
     job = HassJob(action)
@@ -1316,6 +1356,105 @@ track_sunset = threaded_listener_factory(async_track_sunset)
 time_tracker_utcnow = dt_util.utcnow
 
 
+@attr.s(slots=True)
+class _TimePatternListener:
+    """A listener registered with the time pattern scheduler."""
+
+    job: HassJob = attr.ib()
+    calculate_next: Callable[[datetime], datetime] = attr.ib()
+    local: bool = attr.ib()
+    cancelled: bool = attr.ib(default=False)
+
+
+class _TimePatternScheduler:
+    """Run time pattern listeners from a single timer.
+
+    The listeners are kept in a heap ordered by the time they are due next and
+    the timer is armed for the earliest of them, so nothing wakes up the event
+    loop while no pattern matches.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        # (due time, sequence, listener)
+        self._heap: List[Tuple[datetime, int, _TimePatternListener]] = []
+        self._sequence = itertools.count()
+        self._active = 0
+        self._deadline: Optional[datetime] = None
+        self._cancel_timer: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_add(self, listener: _TimePatternListener, due: datetime) -> None:
+        """Add a listener that is due at a point in UTC time."""
+        self._active += 1
+        self._push(listener, due)
+        if self._deadline is None or due < self._deadline:
+            self._arm(due)
+
+    @callback
+    def async_remove(self, listener: _TimePatternListener) -> None:
+        """Remove a listener."""
+        if listener.cancelled:
+            return
+        listener.cancelled = True
+        self._active -= 1
+        if self._active:
+            return
+        # Entries of cancelled listeners are otherwise discarded when due
+        self._heap.clear()
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+        self._deadline = self._cancel_timer = None
+
+    def _push(self, listener: _TimePatternListener, due: datetime) -> None:
+        """Add an entry for a listener to the heap."""
+        heapq.heappush(self._heap, (due, next(self._sequence), listener))
+
+    def _arm(self, deadline: datetime) -> None:
+        """Arm the timer for the next deadline."""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+        self._deadline = deadline
+        self._cancel_timer = async_track_point_in_utc_time(
+            self.hass, self._async_fire, deadline
+        )
+
+    @callback
+    def _async_fire(self, fire_time: datetime) -> None:
+        """Run the listeners that are due and rearm the timer."""
+        self._deadline = self._cancel_timer = None
+        now = time_tracker_utcnow()
+        cutoff = max(now, fire_time)
+        heap = self._heap
+        due = []
+
+        while heap and heap[0][0] <= cutoff:
+            listener = heapq.heappop(heap)[2]
+            if not listener.cancelled:
+                due.append(listener)
+
+        for listener in due:
+            # A listener that ran before may have removed this one
+            if listener.cancelled:
+                continue
+            self._push(listener, listener.calculate_next(now + timedelta(seconds=1)))
+            try:
+                self.hass.async_run_hass_job(
+                    listener.job, dt_util.as_local(now) if listener.local else now
+                )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error running time pattern listener %s", listener.job
+                )
+
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+
+        if heap:
+            self._arm(heap[0][0])
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -1351,31 +1490,19 @@ def async_track_utc_time_change(
             localized_now, matching_seconds, matching_minutes, matching_hours
         )
 
-    time_listener: Optional[CALLBACK_TYPE] = None
-
-    @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
-
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
-
-        time_listener = async_track_point_in_utc_time(
-            hass,
-            pattern_time_change_listener,
-            calculate_next(now + timedelta(seconds=1)),
+    scheduler = hass.data.get(TRACK_TIME_PATTERN_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[TRACK_TIME_PATTERN_SCHEDULER] = _TimePatternScheduler(
+            hass
         )
 
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener, calculate_next(dt_util.utcnow())
-    )
+    listener = _TimePatternListener(job, calculate_next, local)
+    scheduler.async_add(listener, calculate_next(dt_util.utcnow()))
 
     @callback
     def unsub_pattern_time_change_listener() -> None:
         """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
+        scheduler.async_remove(listener)
 
     return unsub_pattern_time_change_listener
 
@@ -1,9 +1,11 @@
 """Helper to help store data."""
 import asyncio
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
@@ -15,6 +17,10 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_VERSION = 1
+# Rewrite the snapshot when the journal grows larger than this part of it
+JOURNAL_COMPACT_RATIO = 0.5
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -60,6 +66,316 @@ async def async_migrator(
     return config
 
 
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """Return the inode, size and modification time of a file."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class StoreJournal:
+    """Journal of the changes to the records of stored data.
+
+    The data is stored as a snapshot. Saves append the records that were
+    added, changed or removed since the previous save to a journal next to
+    it, which is replayed on load. When the journal grows too large compared
+    to the snapshot, or data outside of the records changes, the snapshot is
+    rewritten and the journal started over.
+
+    The snapshot and its journal share a generation and the journal records
+    the size and modification time of its snapshot, so a journal left behind
+    by an interrupted rewrite, or by a snapshot that was replaced or edited,
+    is ignored. The snapshot is on disk before its journal is started over. A
+    journal line that was only partly written is ignored together with the
+    lines after it. If the snapshot or the journal changed since they were
+    last read or written, the snapshot is rewritten instead of appending to a
+    journal of another generation.
+    """
+
+    def __init__(
+        self,
+        collections: Dict[str, str],
+        private: bool,
+        encoder: Optional[Type[JSONEncoder]],
+    ) -> None:
+        """Initialize the journal.
+
+        Collections map the lists of records in the data to the field that
+        identifies a record.
+        """
+        self.collections = collections
+        self._private = private
+        self._encoder = encoder
+        self._record_encoder = (encoder or JSONEncoder)(separators=(",", ":"))
+        self._lock = threading.Lock()
+        self._generation = 0
+        # Encoded records and other data as they are stored
+        self._records: Optional[Dict[str, Dict[str, str]]] = None
+        self._other: Optional[str] = None
+        # Signature of the snapshot and size of the journal in bytes
+        self._snapshot_signature: Optional[Tuple[int, int, int]] = None
+        self._journal_size = 0
+        # If the journal has changes that are not in the snapshot
+        self._has_changes = False
+
+    def read(self, path: str) -> Dict[str, Any]:
+        """Read the snapshot and replay the journal.
+
+        Does blocking I/O, run in the executor.
+        """
+        with self._lock:
+            snapshot_signature = _file_signature(path)
+            data = json_util.load_json(path)
+            self._records = None
+            if not data:
+                return {}
+
+            self._generation = data.pop("journal", 0)
+            changes, appendable = self._read_journal(
+                path + JOURNAL_SUFFIX, snapshot_signature
+            )
+
+            stored = data["data"]
+            records = {
+                collection: {record[field]: record for record in stored[collection]}
+                for collection, field in self.collections.items()
+                if collection in stored
+            }
+            for change in changes:
+                collection_records = records.setdefault(change["collection"], {})
+                if change["record"] is None:
+                    collection_records.pop(change["key"], None)
+                else:
+                    collection_records[change["key"]] = change["record"]
+            for collection, collection_records in records.items():
+                stored[collection] = list(collection_records.values())
+
+            self._has_changes = bool(changes)
+            if appendable:
+                self._records, self._other = self._encode(data)
+                self._snapshot_signature = snapshot_signature
+            return data  # type: ignore
+
+    def _read_journal(
+        self, journal_path: str, snapshot_signature: Optional[Tuple[int, int, int]]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Read the changes from the journal of the current snapshot.
+
+        Returns the changes and if new changes can be appended to the journal.
+        """
+        try:
+            with open(journal_path, "rb") as fdesc:
+                content = fdesc.read()
+        except FileNotFoundError:
+            return [], False
+
+        # A partly written character fails to parse with the rest of its line
+        lines = content.decode("utf-8", errors="replace").split("\n")
+
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            header = None
+        if header != self._journal_header(snapshot_signature):
+            _LOGGER.debug("Ignoring outdated journal %s", journal_path)
+            return [], False
+
+        changes = []
+        # The last line is empty if all changes were completely written
+        for line in lines[1:]:
+            try:
+                changes.append(json.loads(line))
+            except ValueError:
+                if line:
+                    _LOGGER.warning(
+                        "Ignoring partly written change in journal %s", journal_path
+                    )
+                    return changes, False
+
+        self._journal_size = len(content)
+        # Appending to a line without its line ending would corrupt it
+        return changes, not lines[-1]
+
+    def write(self, path: str, data: Dict[str, Any], snapshot: bool = False) -> None:
+        """Write the changes since the previous write.
+
+        With snapshot, the data is written as a new snapshot that does not
+        depend on the journal.
+
+        Does blocking I/O, run in the executor.
+        """
+        with self._lock:
+            try:
+                records, other = self._encode(data)
+            except TypeError as err:
+                raise json_util.SerializationError(
+                    f"Failed to serialize to JSON: {path}: {err}"
+                ) from err
+
+            if (
+                snapshot
+                or self._records is None
+                or other != self._other
+                or not self._is_current(path)
+            ):
+                self._write_snapshot(path, data, records, other)
+                return
+
+            lines = []
+            for collection, collection_records in records.items():
+                old_records = self._records.get(collection, {})
+                for key, record in collection_records.items():
+                    if old_records.get(key) != record:
+                        lines.append(self._encode_change(collection, key, record))
+                for key in old_records:
+                    if key not in collection_records:
+                        lines.append(self._encode_change(collection, key, "null"))
+
+            content = "".join(lines).encode("utf-8")
+            snapshot_size = self._snapshot_signature[1]  # type: ignore
+            if (
+                self._journal_size + len(content)
+                > snapshot_size * JOURNAL_COMPACT_RATIO
+            ):
+                self._write_snapshot(path, data, records, other)
+                return
+
+            if content:
+                self._write_journal(path + JOURNAL_SUFFIX, "a", content)
+                self._journal_size += len(content)
+                self._has_changes = True
+            self._records = records
+
+    def compact(self, path: str) -> None:
+        """Rewrite the snapshot if the journal has changes.
+
+        Does blocking I/O, run in the executor.
+        """
+        with self._lock:
+            if not self._has_changes:
+                return
+        data = self.read(path)
+        if data:
+            self.write(path, data, snapshot=True)
+
+    def _is_current(self, path: str) -> bool:
+        """Return if the snapshot and journal are as last read or written."""
+        try:
+            journal_size = os.path.getsize(path + JOURNAL_SUFFIX)
+        except OSError:
+            return False
+        return (
+            _file_signature(path) == self._snapshot_signature
+            and journal_size == self._journal_size
+        )
+
+    def _write_snapshot(
+        self,
+        path: str,
+        data: Dict[str, Any],
+        records: Dict[str, Dict[str, str]],
+        other: str,
+    ) -> None:
+        """Write the data as a new snapshot and start a new journal."""
+        # Force a new snapshot if writing fails half way
+        self._records = None
+        generation = self._generation + 1
+        # The old journal is only replaced once the new snapshot is on disk
+        json_util.save_json(
+            path,
+            {**data, "journal": generation},
+            self._private,
+            encoder=self._encoder,
+            fsync=True,
+        )
+        self._generation = generation
+        snapshot_signature = _file_signature(path)
+        header = json.dumps(self._journal_header(snapshot_signature))
+        content = f"{header}\n".encode("utf-8")
+        self._write_journal(path + JOURNAL_SUFFIX, "w", content)
+        self._records = records
+        self._other = other
+        self._snapshot_signature = snapshot_signature
+        self._journal_size = len(content)
+        self._has_changes = False
+
+    def _journal_header(
+        self, snapshot_signature: Optional[Tuple[int, int, int]]
+    ) -> Dict[str, Any]:
+        """Return the header of the journal of the current snapshot."""
+        return {
+            "version": JOURNAL_VERSION,
+            "generation": self._generation,
+            # The inode changes when the snapshot is copied, e.g. from a backup
+            "snapshot": snapshot_signature and list(snapshot_signature[1:]),
+        }
+
+    def _write_journal(self, journal_path: str, mode: str, content: bytes) -> None:
+        """Write to the journal and wait until it is on disk."""
+        try:
+            fdesc = os.open(
+                journal_path,
+                os.O_WRONLY | os.O_CREAT | (os.O_APPEND if mode == "a" else os.O_TRUNC),
+                0o600 if self._private else 0o644,
+            )
+            with open(fdesc, f"{mode}b") as fil:
+                fil.write(content)
+                fil.flush()
+                os.fsync(fil.fileno())
+            if mode == "w":
+                # The journal might have been created
+                json_util.fsync_directory(os.path.dirname(journal_path) or os.curdir)
+        except OSError as err:
+            self._records = None
+            _LOGGER.exception("Writing journal failed: %s", journal_path)
+            raise json_util.WriteError(err) from err
+
+    def remove(self, path: str) -> None:
+        """Remove the journal.
+
+        Does blocking I/O, run in the executor.
+        """
+        with self._lock:
+            self._records = None
+            self._has_changes = False
+            try:
+                os.unlink(path + JOURNAL_SUFFIX)
+            except FileNotFoundError:
+                pass
+
+    def _encode(self, data: Dict[str, Any]) -> Any:
+        """Encode the records and the other data for comparison."""
+        stored = data["data"]
+        encode = self._record_encoder.encode
+        records = {
+            collection: {
+                record[field]: encode(record) for record in stored.get(collection, [])
+            }
+            for collection, field in self.collections.items()
+        }
+        other = encode(
+            {
+                "version": data["version"],
+                "data": {
+                    key: value
+                    for key, value in stored.items()
+                    if key not in self.collections
+                },
+            }
+        )
+        return records, other
+
+    @staticmethod
+    def _encode_change(collection: str, key: str, record: str) -> str:
+        """Encode a journal line for a changed record."""
+        return (
+            f'{{"collection":{json.dumps(collection)},"key":{json.dumps(key)},'
+            f'"record":{record}}}\n'
+        )
+
+
 @bind_hass
 class Store:
     """Class to help storing data."""
@@ -72,8 +388,13 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        journal_collections: Optional[Dict[str, str]] = None,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Stores with journal collections only write the records of those
+        collections that changed, see StoreJournal.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -84,6 +405,9 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._journal: Optional[StoreJournal] = None
+        if journal_collections is not None:
+            self._journal = StoreJournal(journal_collections, private, encoder)
 
     @property
     def path(self):
@@ -121,9 +445,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._read_data, self.path)
 
             if data == {}:
                 return None
@@ -198,10 +520,13 @@ class Store:
     async def _async_callback_final_write(self, _event):
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
-        await self._async_handle_write_data()
+        await self._async_handle_write_data(final=True)
+
+    async def _async_handle_write_data(self, *_args, final: bool = False):
+        """Handle writing the config.
 
-    async def _async_handle_write_data(self, *_args):
-        """Handle writing the config."""
+        The final write leaves a snapshot that does not need the journal.
+        """
 
         async with self._write_lock:
             self._async_cleanup_delay_listener()
@@ -209,6 +534,13 @@ class Store:
 
             if self._data is None:
                 # Another write already consumed the data
+                if final and self._journal is not None:
+                    try:
+                        await self.hass.async_add_executor_job(
+                            self._journal.compact, self.path
+                        )
+                    except (json_util.SerializationError, json_util.WriteError) as err:
+                        _LOGGER.error("Error writing config for %s: %s", self.key, err)
                 return
 
             data = self._data
@@ -220,18 +552,31 @@ class Store:
 
             try:
                 await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
+                    self._write_data, self.path, data, final
                 )
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
-    def _write_data(self, path: str, data: Dict) -> None:
+            if self._journal is not None and not final:
+                # Changes appended to the journal are moved to the snapshot
+                self._async_ensure_final_write_listener()
+
+    def _write_data(self, path: str, data: Dict, final: bool = False) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        if self._journal is not None:
+            self._journal.write(path, data, snapshot=final)
+        else:
+            json_util.save_json(path, data, self._private, encoder=self._encoder)
+
+    def _read_data(self, path: str) -> Dict:
+        """Read the data."""
+        if self._journal is not None:
+            return self._journal.read(path)
+        return json_util.load_json(path)  # type: ignore
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -242,6 +587,9 @@ class Store:
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
 
+        if self._journal is not None:
+            await self.hass.async_add_executor_job(self._journal.remove, self.path)
+
         try:
             await self.hass.async_add_executor_job(os.unlink, self.path)
         except FileNotFoundError:
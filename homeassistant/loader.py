@@ -9,22 +9,27 @@ import functools as ft
 import importlib
 import json
 import logging
+import os
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
 )
 
+from homeassistant.const import __version__
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
@@ -40,6 +45,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
+DATA_IMPORT_PREFETCH = "import_prefetch"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -52,6 +59,10 @@ _UNDEF = object()
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 10
+
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
     """Generate a manifest from a legacy module."""
@@ -72,9 +83,22 @@ async def _async_get_custom_components(
     if hass.config.safe_mode:
         return {}
 
+    index = await async_get_manifest_index(hass)
+    if index.custom_components is not None:
+        return {
+            domain: index.integration_from_record(record)
+            for domain, record in index.custom_components.items()
+        }
+
+    # Creating the custom_components directory invalidates the index
+    paths = [hass.config.path(PACKAGE_CUSTOM_COMPONENTS)]
+
     try:
         import custom_components  # pylint: disable=import-outside-toplevel
     except ImportError:
+        index.async_set_custom_components(
+            [], await hass.async_add_executor_job(_stat_paths, paths)
+        )
         return {}
 
     def get_sub_directories(paths: List[str]) -> List[pathlib.Path]:
@@ -90,6 +114,11 @@ async def _async_get_custom_components(
         get_sub_directories, custom_components.__path__
     )
 
+    paths.extend(custom_components.__path__)
+    for comp in dirs:
+        paths.extend((str(comp), str(comp / "manifest.json")))
+    mtimes = await hass.async_add_executor_job(_stat_paths, paths)
+
     integrations = await asyncio.gather(
         *(
             hass.async_add_executor_job(
@@ -99,11 +128,10 @@ async def _async_get_custom_components(
         )
     )
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    found = [integration for integration in integrations if integration is not None]
+    index.async_set_custom_components(found, mtimes)
+
+    return {integration.domain: integration for integration in found}
 
 
 async def async_get_custom_components(
@@ -384,6 +412,14 @@ class Integration:
         if self._all_dependencies_resolved is not None:
             return self._all_dependencies_resolved
 
+        index = self.hass.data.get(DATA_MANIFEST_INDEX)
+        if not isinstance(index, ManifestIndex):
+            index = None
+        elif self.domain in index.dependencies:
+            self._all_dependencies = set(index.dependencies[self.domain])
+            self._all_dependencies_resolved = True
+            return True
+
         try:
             dependencies = await _async_component_dependencies(
                 self.hass, self.domain, self, set(), set()
@@ -391,6 +427,8 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if index is not None:
+                index.async_set_dependencies(self.domain, dependencies)
         except IntegrationNotFound as err:
             _LOGGER.error(
                 "Unable to resolve dependencies for %s:  we are unable to resolve (sub)dependency %s",
@@ -469,9 +507,25 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    index = await async_get_manifest_index(hass)
+    record = index.integrations.get(domain)
+    if record is not None:
+        integration = index.integration_from_record(record)
+    else:
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
+        if integration is not None:
+            index.async_add_integration(
+                integration,
+                await hass.async_add_executor_job(
+                    _stat_paths,
+                    [
+                        str(integration.file_path),
+                        str(integration.file_path / "manifest.json"),
+                    ],
+                ),
+            )
 
     if integration is not None:
         cache[domain] = integration
@@ -493,6 +547,244 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
     return integration
 
 
+def _stat_paths(paths: Iterable[str]) -> Dict[str, Optional[int]]:
+    """Return the modification time of paths, None for paths that do not exist."""
+    mtimes: Dict[str, Optional[int]] = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def _integration_record(integration: Integration) -> Dict[str, Any]:
+    """Return how to create an integration without reading its manifest."""
+    return {
+        "pkg_path": integration.pkg_path,
+        "file_path": str(integration.file_path),
+        "manifest": integration.manifest,
+    }
+
+
+class ManifestIndex:
+    """Persistent index of integration manifests and their dependencies.
+
+    Allows resolving integrations without reading every manifest.json file on
+    startup. The index is discarded when the Home Assistant version changes or
+    when one of the directories or manifests it was built from changed.
+    """
+
+    def __init__(self, hass: "HomeAssistant", data: Dict[str, Any]) -> None:
+        """Initialize the index."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers.storage import Store
+
+        self.hass = hass
+        self.mtimes: Dict[str, Optional[int]] = data["mtimes"]
+        self.integrations: Dict[str, Dict[str, Any]] = data["integrations"]
+        self.custom_components: Optional[Dict[str, Dict[str, Any]]] = data[
+            "custom_components"
+        ]
+        self.dependencies: Dict[str, List[str]] = data["dependencies"]
+        self._store = Store(
+            hass,
+            MANIFEST_INDEX_STORAGE_VERSION,
+            MANIFEST_INDEX_STORAGE_KEY,
+            private=True,
+        )
+
+    @classmethod
+    async def async_load(cls, hass: "HomeAssistant") -> "ManifestIndex":
+        """Load the index from storage, or start a new one if it is outdated."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant import components
+        from homeassistant.exceptions import HomeAssistantError
+        from homeassistant.helpers.storage import Store
+
+        store = Store(
+            hass,
+            MANIFEST_INDEX_STORAGE_VERSION,
+            MANIFEST_INDEX_STORAGE_KEY,
+            private=True,
+        )
+        try:
+            data = cast(Optional[Dict[str, Any]], await store.async_load())
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load manifest index: %s", err)
+            data = None
+
+        if (
+            data is not None
+            and data["ha_version"] == __version__
+            and await hass.async_add_executor_job(_stat_paths, data["mtimes"])
+            == data["mtimes"]
+        ):
+            return cls(hass, data)
+
+        return cls(
+            hass,
+            {
+                "ha_version": __version__,
+                # Adding or removing a built-in integration invalidates the index
+                "mtimes": await hass.async_add_executor_job(
+                    _stat_paths, components.__path__  # type: ignore
+                ),
+                "integrations": {},
+                "custom_components": None,
+                "dependencies": {},
+            },
+        )
+
+    def integration_from_record(self, record: Dict[str, Any]) -> Integration:
+        """Create an integration from a record in the index."""
+        return Integration(
+            self.hass,
+            record["pkg_path"],
+            pathlib.Path(record["file_path"]),
+            dict(record["manifest"]),
+        )
+
+    def async_add_integration(
+        self, integration: Integration, mtimes: Dict[str, Optional[int]]
+    ) -> None:
+        """Add a built-in integration and the modification times of its files."""
+        self.integrations[integration.domain] = _integration_record(integration)
+        self.mtimes.update(mtimes)
+        self._async_schedule_save()
+
+    def async_set_custom_components(
+        self, integrations: List[Integration], mtimes: Dict[str, Optional[int]]
+    ) -> None:
+        """Set the custom integrations and the modification times of their files."""
+        self.custom_components = {
+            integration.domain: _integration_record(integration)
+            for integration in integrations
+        }
+        self.mtimes.update(mtimes)
+        self._async_schedule_save()
+
+    def async_set_dependencies(self, domain: str, dependencies: Set[str]) -> None:
+        """Set the resolved dependencies of an integration.
+
+        Only stored if the integration and all its dependencies are indexed,
+        because legacy integrations are not tracked for changes.
+        """
+        indexed = set(self.integrations)
+        if self.custom_components is not None:
+            indexed.update(self.custom_components)
+        if domain not in indexed or not dependencies <= indexed:
+            return
+        self.dependencies[domain] = sorted(dependencies)
+        self._async_schedule_save()
+
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the index."""
+        self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data of the index to store."""
+        return {
+            "ha_version": __version__,
+            "mtimes": self.mtimes,
+            "integrations": self.integrations,
+            "custom_components": self.custom_components,
+            "dependencies": self.dependencies,
+        }
+
+
+async def async_get_manifest_index(hass: "HomeAssistant") -> ManifestIndex:
+    """Return the manifest index, loading it if needed."""
+    index_or_evt = hass.data.get(DATA_MANIFEST_INDEX)
+
+    if index_or_evt is None:
+        evt = hass.data[DATA_MANIFEST_INDEX] = asyncio.Event()
+
+        index = await ManifestIndex.async_load(hass)
+
+        hass.data[DATA_MANIFEST_INDEX] = index
+        evt.set()
+        return index
+
+    if isinstance(index_or_evt, asyncio.Event):
+        await index_or_evt.wait()
+        return cast(ManifestIndex, hass.data[DATA_MANIFEST_INDEX])
+
+    return cast(ManifestIndex, index_or_evt)
+
+
+def _import_modules(pkg_paths: List[str]) -> Tuple[float, float]:
+    """Import modules and return when the imports started and ended."""
+    start = timer()
+    for pkg_path in pkg_paths:
+        try:
+            importlib.import_module(pkg_path)
+        except Exception as err:  # pylint: disable=broad-except
+            # Missing requirements, or a circular import detected by the
+            # import system. The module is imported again when it is needed.
+            _LOGGER.debug("Unable to prefetch %s: %s", pkg_path, err)
+            break
+    return start, timer()
+
+
+class ImportPrefetch:
+    """Import integrations and their platforms in the executor ahead of setup.
+
+    Before an integration's modules are imported in the event loop,
+    async_wait must be called. It waits for an import of the integration in
+    progress instead of importing it a second time, and cancels an import
+    that has not started yet. Modules shared by integrations can still be
+    imported by a worker and the event loop at the same time; importlib's
+    per-module locks let one of them wait for the other.
+    """
+
+    def __init__(self, hass: "HomeAssistant") -> None:
+        """Initialize the prefetch."""
+        self.hass = hass
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.started: Set[str] = set()
+        # Start and end of the imports of each domain
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self._semaphore = asyncio.Semaphore(MAX_LOAD_CONCURRENTLY)
+
+    def async_schedule(
+        self, integration: Integration, platforms: Iterable[str]
+    ) -> None:
+        """Schedule importing an integration and some of its platforms."""
+        if integration.domain in self.tasks:
+            return
+        pkg_paths = [integration.pkg_path]
+        pkg_paths.extend(f"{integration.pkg_path}.{platform}" for platform in platforms)
+        self.tasks[integration.domain] = self.hass.async_create_task(
+            self._async_import(integration.domain, pkg_paths)
+        )
+
+    async def _async_import(self, domain: str, pkg_paths: List[str]) -> None:
+        """Import the modules of a domain in the executor."""
+        async with self._semaphore:
+            self.started.add(domain)
+            self.timings[domain] = await self.hass.async_add_executor_job(
+                _import_modules, pkg_paths
+            )
+
+    async def async_wait(self, domain: str) -> None:
+        """Wait for the imports of a domain before importing it in the event loop."""
+        task = self.tasks.get(domain)
+        if task is None or task.done():
+            return
+        if domain not in self.started:
+            task.cancel()
+            return
+        await asyncio.wait([task])
+
+
+async def async_wait_for_import_prefetch(hass: "HomeAssistant", domain: str) -> None:
+    """Wait for the prefetched imports of a domain, if any."""
+    prefetch: Optional[ImportPrefetch] = hass.data.get(DATA_IMPORT_PREFETCH)
+    if prefetch is not None:
+        await prefetch.async_wait(domain)
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -6,7 +6,9 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 from typing import Callable, Dict, TypeVar
 
 from homeassistant import core
@@ -323,6 +325,403 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_states_cached(hass):
+    """Serialize 5000 states 200 times reusing their cached JSON."""
+    states = [
+        core.State(f"light.kitchen_{i}", "on", {"friendly_name": "Kitchen Lights"})
+        for i in range(5000)
+    ]
+
+    start = timer()
+    for _ in range(200):
+        ", ".join(state.as_json() for state in states)
+    return timer() - start
+
+
+@benchmark
+async def state_memory(hass):
+    """Create 100,000 states and report the memory they use."""
+    tracemalloc.start()
+    start = timer()
+    states = [
+        core.State(f"light.kitchen_{i}", "on", {"friendly_name": "Kitchen Lights"})
+        for i in range(10 ** 5)
+    ]
+    runtime = timer() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Memory per state: {size / len(states):.0f} bytes")
+    return runtime
+
+
+@benchmark
+async def service_call_throughput(hass):
+    """Make 100,000 blocking calls to a service with an entity service schema."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+
+    count = 0
+
+    @core.callback
+    def handler(_):
+        """Handle a service call."""
+        nonlocal count
+        count += 1
+
+    hass.services.async_register(
+        "light",
+        "turn_on",
+        handler,
+        cv.make_entity_service_schema({"brightness": cv.positive_int}),
+    )
+    data = {"entity_id": ["light.kitchen", "light.living_room"], "brightness": 100}
+
+    start = timer()
+
+    for _ in range(10 ** 5):
+        await hass.services.async_call("light", "turn_on", data, blocking=True)
+
+    return timer() - start
+
+
+@benchmark
+async def yaml_loader(hass):
+    """Parse a 40,000 line configuration with the C and Python YAML loaders."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.util.yaml import loader
+
+    content = "automation:\n" + "".join(
+        f"  - alias: Automation {i}\n"
+        "    trigger:\n"
+        "      platform: state\n"
+        f"      entity_id: binary_sensor.motion_{i}\n"
+        "    action:\n"
+        "      service: light.turn_on\n"
+        "      data:\n"
+        f"        entity_id: light.kitchen_{i}\n"
+        for i in range(5000)
+    )
+
+    start = timer()
+    loader.yaml.load(content, Loader=loader.SafeLineLoader)
+    print(f"Python loader: {timer() - start}s")
+
+    if not loader.HAS_C_LOADER:
+        print("C loader not available, libyaml is not installed")
+
+    start = timer()
+    loader.yaml.load(content, Loader=loader.FastSafeLoader)
+    return timer() - start
+
+
+@benchmark
+async def config_validation(hass):
+    """Validate 2,000 template sensors for two integrations at the same time."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.config import async_process_component_config
+    from homeassistant.loader import async_get_integration
+
+    config = {
+        domain: {
+            "platform": "template",
+            "sensors": {
+                f"{domain}_{i}": {
+                    "value_template": f"{{{{ states('sensor.source_{i}') | int + 1 }}}}",
+                    "icon_template": "{{ 'mdi:thermometer' }}",
+                }
+                for i in range(1000)
+            },
+        }
+        for domain in ("sensor", "binary_sensor")
+    }
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        integrations = [
+            await async_get_integration(hass, domain)
+            for domain in ("sensor", "binary_sensor")
+        ]
+        max_lag = 0.0
+
+        async def measure_lag():
+            nonlocal max_lag
+            while True:
+                before = timer()
+                await asyncio.sleep(0)
+                max_lag = max(max_lag, timer() - before)
+
+        lag_task = hass.async_create_task(measure_lag())
+        start = timer()
+        await asyncio.gather(
+            *(
+                async_process_component_config(hass, config, integration)
+                for integration in integrations
+            )
+        )
+        elapsed = timer() - start
+        lag_task.cancel()
+        print(f"Event loop blocked for at most {max_lag}s")
+        return elapsed
+
+
+@benchmark
+async def manifest_index(hass):
+    """Resolve all built-in integrations with and without the manifest index."""
+    # pylint: disable=import-outside-toplevel
+    import os
+
+    from homeassistant import components, loader
+
+    domains = sorted(
+        entry.name
+        for entry in os.scandir(components.__path__[0])
+        if os.path.isfile(os.path.join(entry.path, "manifest.json"))
+    )
+
+    async def resolve_all(hass):
+        for domain in domains:
+            integration = await loader.async_get_integration(hass, domain)
+            await integration.resolve_dependencies()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+        await hass.async_start()
+        start = timer()
+        await resolve_all(hass)
+        print(f"Without index: {timer() - start}s")
+        # Writes the index
+        await hass.async_stop()
+
+        indexed_hass = core.HomeAssistant()
+        indexed_hass.config.config_dir = config_dir
+        indexed_hass.config.skip_pip = True
+        await indexed_hass.async_start()
+        start = timer()
+        await resolve_all(indexed_hass)
+        elapsed = timer() - start
+        await indexed_hass.async_stop()
+
+    return elapsed
+
+
+IMPORT_PREFETCH_SCRIPT = """
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from timeit import default_timer as timer
+
+from homeassistant import components, core, loader
+
+
+async def main(prefetch):
+    hass = core.HomeAssistant()
+    domains = []
+    for entry in sorted(os.scandir(components.__path__[0]), key=lambda e: e.name):
+        manifest = os.path.join(entry.path, "manifest.json")
+        if os.path.isfile(manifest):
+            with open(manifest) as fil:
+                if not json.load(fil).get("requirements"):
+                    domains.append(entry.name)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        integrations = [
+            await loader.async_get_integration(hass, domain) for domain in domains
+        ]
+        start = timer()
+        if prefetch:
+            import_prefetch = loader.ImportPrefetch(hass)
+            hass.data[loader.DATA_IMPORT_PREFETCH] = import_prefetch
+            for integration in integrations:
+                import_prefetch.async_schedule(integration, [])
+
+        blocked = 0.0
+        for integration in integrations:
+            # Other work done during setup
+            await asyncio.sleep(0.002)
+            await loader.async_wait_for_import_prefetch(hass, integration.domain)
+            import_start = timer()
+            try:
+                integration.get_component()
+            except Exception:  # pylint: disable=broad-except
+                pass
+            blocked += timer() - import_start
+
+        print(timer() - start, blocked)
+        await hass.async_stop()
+
+
+asyncio.run(main(sys.argv[1] == "prefetch"))
+"""
+
+
+@benchmark
+async def import_prefetch(hass):
+    """Import all integrations without requirements, with and without prefetching.
+
+    Runs in new interpreters, as modules are only imported once.
+    """
+    # pylint: disable=import-outside-toplevel
+    import sys
+
+    results = {}
+    for mode in ("sequential", "prefetch"):
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            IMPORT_PREFETCH_SCRIPT,
+            mode,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+        total, blocked = (float(value) for value in stdout.split())
+        results[mode] = total
+        print(f"{mode}: {total}s, event loop blocked by imports for {blocked}s")
+
+    return results["prefetch"]
+
+
+@benchmark
+async def bootstrap_setup(hass):
+    """Set up 100 synthetic integrations and a slow stage 1 integration."""
+    # pylint: disable=import-outside-toplevel
+    import os
+    import random
+    import sys
+
+    from homeassistant import bootstrap, config_entries
+
+    rand = random.Random(0)
+    logging.getLogger("homeassistant").setLevel(logging.ERROR)
+    # Custom integrations are loaded from a new directory each run
+    for module in list(sys.modules):
+        if module.split(".")[0] == "custom_components":
+            del sys.modules[module]
+
+    def write_integration(config_dir, domain, dependencies, delay):
+        """Write an integration that takes delay seconds to set up."""
+        path = os.path.join(config_dir, "custom_components", domain)
+        os.makedirs(path)
+        with open(os.path.join(path, "manifest.json"), "w") as fil:
+            json.dump(
+                {"domain": domain, "name": domain, "dependencies": dependencies}, fil
+            )
+        with open(os.path.join(path, "__init__.py"), "w") as fil:
+            fil.write(
+                "import asyncio\n\n"
+                "async def async_setup(hass, config):\n"
+                f"    await asyncio.sleep({delay})\n"
+                "    return True\n"
+            )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+
+        domains = ["mqtt_eventstream"]
+        write_integration(config_dir, "mqtt_eventstream", [], 1)
+        for index in range(100):
+            domain = f"synthetic_{index}"
+            dependencies = rand.sample(domains[1:], min(index, rand.randint(0, 2)))
+            write_integration(config_dir, domain, dependencies, rand.uniform(0.01, 0.1))
+            domains.append(domain)
+
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+
+        start = timer()
+        await bootstrap._async_set_up_integrations(  # pylint: disable=protected-access
+            hass, {domain: {} for domain in domains}
+        )
+        return timer() - start
+
+
+@benchmark
+async def requirements_check(hass):
+    """Check the requirements of 150 integrations with 2 installed packages each."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.requirements import async_process_requirements
+    from homeassistant.util import package as pkg_util
+
+    dists = list(pkg_util.distributions())
+    requirements = [
+        f"{dist.metadata['Name']}=={dist.metadata['Version']}" for dist in dists
+    ]
+    hass.config.config_dir = None
+
+    start = timer()
+    for index in range(150):
+        await async_process_requirements(
+            hass,
+            f"integration_{index}",
+            [
+                requirements[(2 * index + offset) % len(requirements)]
+                for offset in (0, 1)
+            ],
+        )
+    return timer() - start
+
+
+@benchmark
+async def entity_registry_save(hass):
+    """Save 100 single entity updates of an entity registry of 15,000 entities."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    import os
+
+    from homeassistant.helpers import entity_registry, storage
+
+    def file_stats(path):
+        """Return the modification time and size of a file."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None, 0
+        return stat.st_mtime_ns, stat.st_size
+
+    logging.getLogger("homeassistant").setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        registry = entity_registry.EntityRegistry(hass)
+        await registry.async_load()
+        for index in range(15000):
+            registry.async_get_or_create(
+                "sensor",
+                "benchmark",
+                f"unique_{index}",
+                suggested_object_id=f"sensor_{index}",
+                original_name=f"Sensor {index}",
+            )
+        store = registry._store
+        await store._async_handle_write_data()
+
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        written = 0
+        elapsed = 0.0
+        for index in range(100):
+            snapshot_before = file_stats(store.path)
+            journal_before = file_stats(journal_path)
+            registry.async_update_entity(
+                f"sensor.sensor_{index}", name=f"Renamed {index}"
+            )
+            start = timer()
+            await store._async_handle_write_data()
+            elapsed += timer() - start
+            snapshot_after = file_stats(store.path)
+            journal_after = file_stats(journal_path)
+            if snapshot_after != snapshot_before:
+                written += snapshot_after[1] + journal_after[1]
+            else:
+                written += journal_after[1] - journal_before[1]
+
+        print(f"Wrote {written} bytes")
+        return elapsed
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -11,6 +11,7 @@ from homeassistant.const import EVENT_COMPONENT_LOADED, PLATFORM_FORMAT
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.timeline import Timeline
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMELINE = "setup_timeline"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
@@ -34,6 +36,15 @@ def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str])
     hass.data[DATA_SETUP_DONE] = {domain: asyncio.Event() for domain in domains}
 
 
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> Timeline:
+    """Return the timeline of integration setups."""
+    timeline: Optional[Timeline] = hass.data.get(DATA_SETUP_TIMELINE)
+    if timeline is None:
+        timeline = hass.data[DATA_SETUP_TIMELINE] = Timeline()
+    return timeline
+
+
 def setup_component(hass: core.HomeAssistant, domain: str, config: ConfigType) -> bool:
     """Set up a component and all its dependencies."""
     return asyncio.run_coroutine_threadsafe(
@@ -105,10 +116,11 @@ async def _async_process_dependencies(
             list(after_dependencies_tasks),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    with async_get_setup_timeline(hass).span(integration.domain, "dependencies"):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -152,6 +164,11 @@ async def _async_setup_component(
     if not await integration.resolve_dependencies():
         return False
 
+    timeline = async_get_setup_timeline(hass)
+    timeline.add_dependencies(
+        domain, integration.dependencies + integration.after_dependencies
+    )
+
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
     try:
@@ -162,8 +179,10 @@ async def _async_setup_component(
 
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
+    await loader.async_wait_for_import_prefetch(hass, domain)
     try:
-        component = integration.get_component()
+        with timeline.span(domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -171,9 +190,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with timeline.span(domain, "config"):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -227,6 +247,7 @@ async def _async_setup_component(
         return False
     finally:
         end = timer()
+        timeline.add_span(domain, "setup", start, end)
         if warn_task:
             warn_task.cancel()
     _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
@@ -247,12 +268,12 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-    await asyncio.gather(
-        *[
-            entry.async_setup(hass, integration=integration)
-            for entry in hass.config_entries.async_entries(domain)
-        ]
-    )
+    entries = hass.config_entries.async_entries(domain)
+    if entries:
+        with timeline.span(domain, "config entries"):
+            await asyncio.gather(
+                *[entry.async_setup(hass, integration=integration) for entry in entries]
+            )
 
     hass.config.components.add(domain)
     hass.data[DATA_SETUP_STARTED].pop(domain)
@@ -294,6 +315,7 @@ async def async_prepare_setup_platform(
         log_error(str(err))
         return None
 
+    await loader.async_wait_for_import_prefetch(hass, platform_name)
     try:
         platform = integration.get_platform(domain)
     except ImportError as exc:
@@ -339,10 +361,11 @@ async def async_process_deps_reqs(
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        with async_get_setup_timeline(hass).span(integration.domain, "requirements"):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
@@ -0,0 +1,116 @@
+"""Named thread pool executors to isolate blocking work."""
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pools past this number are not created, their jobs run in the default executor
+MAX_EXECUTOR_POOLS = 8
+
+T = TypeVar("T")
+
+
+class ExecutorPool(ThreadPoolExecutor):
+    """A named thread pool executor that keeps track of its queue."""
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        """Initialize the pool."""
+        super().__init__(
+            max_workers=max_workers, thread_name_prefix=f"SyncWorker_{name}"
+        )
+        self.name = name
+        self.max_workers = max_workers
+        self.queued = 0
+        self.max_queued = 0
+        self.running = 0
+        self.completed = 0
+        self._stats_lock = threading.Lock()
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> "Future[T]":
+        """Submit a job to the pool."""
+        with self._stats_lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        return super().submit(self._run, fn, *args, **kwargs)
+
+    def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a job in a worker thread."""
+        with self._stats_lock:
+            self.queued -= 1
+            self.running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self.running -= 1
+                self.completed += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the pool."""
+        return {
+            "name": self.name,
+            "max_workers": self.max_workers,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "running": self.running,
+            "completed": self.completed,
+        }
+
+
+class ExecutorPools:
+    """Executor pools by name.
+
+    A pool is created the first time a job is added to it, if a size has been
+    configured for its name and fewer than MAX_EXECUTOR_POOLS pools exist.
+    Jobs for other names run in the default executor.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pools."""
+        self.sizes: Dict[str, int] = {}
+        self.pools: Dict[str, ExecutorPool] = {}
+        self._over_limit: Set[str] = set()
+
+    def configure(self, sizes: Dict[str, int]) -> None:
+        """Configure the size of pools.
+
+        Pools that have already been created keep their size.
+        """
+        self.sizes.update(sizes)
+
+    def get(self, name: str) -> Optional[ExecutorPool]:
+        """Return the pool for a name or None to use the default executor."""
+        pool = self.pools.get(name)
+        if pool is not None or name not in self.sizes:
+            return pool
+
+        if len(self.pools) >= MAX_EXECUTOR_POOLS:
+            if name not in self._over_limit:
+                self._over_limit.add(name)
+                _LOGGER.warning(
+                    "Not creating executor pool %s, the limit of %d pools is reached",
+                    name,
+                    MAX_EXECUTOR_POOLS,
+                )
+            return None
+
+        pool = self.pools[name] = ExecutorPool(name, self.sizes[name])
+        return pool
+
+    def shutdown(self) -> None:
+        """Shut down all pools and wait for their running jobs.
+
+        Does blocking I/O, run in the executor.
+        """
+        pools = list(self.pools.values())
+        self.pools.clear()
+        for pool in pools:
+            pool.shutdown()
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """Return a JSON serializable representation of the pools."""
+        return [pool.as_dict() for pool in self.pools.values()]
@@ -0,0 +1,70 @@
+"""Low overhead fixed bucket histograms."""
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence
+
+# Upper bounds in seconds, suitable for code running inside the event loop.
+DURATION_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Upper bounds in bytes.
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+class Histogram:
+    """Count values in fixed buckets.
+
+    A value is counted in the first bucket whose upper bound is greater than
+    or equal to the value. Values above the last bound are counted in an
+    extra overflow bucket.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Sequence[float] = DURATION_BUCKETS) -> None:
+        """Initialize the histogram."""
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum: float = 0
+        self.max: float = 0
+
+    def add(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def cumulative_counts(self) -> List[int]:
+        """Return the cumulative count per bucket, the last one being the total."""
+        total = 0
+        cumulative = []
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the histogram."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "bounds": list(self.bounds),
+            "counts": list(self.counts),
+        }
@@ -1,17 +1,35 @@
 """JSON utility functions."""
 from collections import deque
+from datetime import datetime
 import json
 import logging
 import os
 import tempfile
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
-from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class JSONEncoder(json.JSONEncoder):
+    """JSONEncoder that supports Home Assistant objects."""
+
+    def default(self, o: Any) -> Any:
+        """Convert Home Assistant objects.
+
+        Hand other objects to the original method.
+        """
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, set):
+            return list(o)
+        if hasattr(o, "as_dict"):
+            return o.as_dict()
+
+        return json.JSONEncoder.default(self, o)
+
+
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
 
@@ -48,9 +66,12 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
+    fsync: bool = False,
 ) -> None:
     """Save JSON data to a file.
 
+    With fsync, waits until the file is on disk before returning.
+
     Returns True on success.
     """
     try:
@@ -69,9 +90,14 @@ def save_json(
         ) as fdesc:
             fdesc.write(json_data)
             tmp_filename = fdesc.name
+            if fsync:
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
         if not private:
             os.chmod(tmp_filename, 0o644)
         os.replace(tmp_filename, filename)
+        if fsync:
+            fsync_directory(tmp_path or os.curdir)
     except OSError as error:
         _LOGGER.exception("Saving JSON file failed: %s", filename)
         raise WriteError(error) from error
@@ -85,6 +111,20 @@ def save_json(
                 _LOGGER.error("JSON replacement cleanup failed: %s", err)
 
 
+def fsync_directory(path: str) -> None:
+    """Wait until the entries of a directory are on disk.
+
+    Only supported on POSIX systems, does nothing on other systems.
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fdesc = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fdesc)
+    finally:
+        os.close(fdesc)
+
+
 def format_unserializable_data(data: Dict[str, Any]) -> str:
     """Format output of find_paths in a friendly way.
 
@@ -100,6 +140,12 @@ def find_paths_unserializable_data(
 
     This method is slow! Only use for error handling.
     """
+    # The core imports this module for the JSONEncoder
+    from homeassistant.core import (  # pylint: disable=import-outside-toplevel
+        Event,
+        State,
+    )
+
     to_process = deque([(bad_data, "$")])
     invalid = {}
 
@@ -0,0 +1,161 @@
+"""Monitor the event loop for lag and the callbacks causing it."""
+import asyncio
+from collections import deque
+import logging
+import os
+import re
+import sys
+import threading
+from time import monotonic
+from types import FrameType
+from typing import Any, Deque, Dict, List, Optional
+
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 1
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MAX_REPORTS = 50
+
+ASYNCIO_DIR = os.path.dirname(asyncio.__file__)
+INTEGRATION_RE = re.compile(r"(?:homeassistant/components|custom_components)/(\w+)/")
+
+
+def integration_from_path(path: str) -> Optional[str]:
+    """Return the integration a source file belongs to."""
+    match = INTEGRATION_RE.search(path.replace(os.sep, "/"))
+    return match.group(1) if match else None
+
+
+def _frame_name(frame: FrameType) -> str:
+    """Return the name of the function of a frame."""
+    return f"{frame.f_globals.get('__name__')}.{frame.f_code.co_name}"
+
+
+def describe_stack(frame: FrameType) -> Dict[str, Optional[str]]:
+    """Describe what the event loop is running from the innermost frame.
+
+    The target is the callback or task the loop dispatched, the integration
+    the innermost frame of integration code.
+    """
+    stack: List[FrameType] = []
+    current: Optional[FrameType] = frame
+    while current is not None:
+        stack.append(current)
+        current = current.f_back
+    stack.reverse()
+
+    # Skip the event loop and task machinery that dispatched the target
+    start = 0
+    for index, stack_frame in enumerate(stack):
+        if stack_frame.f_code.co_filename.startswith(ASYNCIO_DIR):
+            start = index + 1
+
+    target = stack[start] if start < len(stack) else frame
+
+    integration = None
+    for stack_frame in reversed(stack[start:]):
+        integration = integration_from_path(stack_frame.f_code.co_filename)
+        if integration is not None:
+            break
+
+    return {
+        "target": _frame_name(target),
+        "integration": integration,
+        "location": f"{frame.f_code.co_filename}:{frame.f_lineno}",
+    }
+
+
+class LoopMonitor:
+    """Measure event loop lag from a watchdog thread.
+
+    The thread schedules a callback on the loop every interval and measures
+    how long it takes to run. If it takes longer than the threshold, the stack
+    of the loop thread is sampled to find out what is blocking it.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        interval: float = DEFAULT_INTERVAL,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_reports: int = DEFAULT_MAX_REPORTS,
+    ) -> None:
+        """Initialize the monitor."""
+        self.loop = loop
+        self.interval = interval
+        self.threshold = threshold
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.reports: Deque[Dict[str, Any]] = deque(maxlen=max_reports)
+        self._loop_thread_id: Optional[int] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Start monitoring.
+
+        Must be called from the event loop thread.
+        """
+        self._loop_thread_id = threading.get_ident()
+        threading.Thread(target=self._run, name="LoopMonitor", daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop monitoring."""
+        self._stop.set()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the monitor."""
+        return {
+            "threshold": self.threshold,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "reports": list(self.reports),
+        }
+
+    def _run(self) -> None:
+        """Probe the loop until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self._probe()
+            except RuntimeError:
+                # Event loop was closed
+                return
+
+    def _probe(self) -> None:
+        """Measure the time it takes the loop to run a callback."""
+        responded = threading.Event()
+        start = monotonic()
+        self.loop.call_soon_threadsafe(responded.set)
+
+        if responded.wait(self.threshold):
+            self._set_lag(monotonic() - start)
+            return
+
+        # Still blocked, capture what the loop is running
+        frame = sys._current_frames().get(  # pylint: disable=protected-access
+            self._loop_thread_id
+        )
+        culprit = describe_stack(frame) if frame is not None else {}
+
+        while not responded.wait(self.interval):
+            if self._stop.is_set():
+                return
+
+        lag = monotonic() - start
+        self._set_lag(lag)
+        self.reports.append(
+            {"time": dt_util.utcnow().isoformat(), "lag": lag, **culprit}
+        )
+        _LOGGER.warning(
+            "Event loop was blocked for %.3f seconds by %s (integration: %s) at %s",
+            lag,
+            culprit.get("target"),
+            culprit.get("integration"),
+            culprit.get("location"),
+        )
+
+    def _set_lag(self, lag: float) -> None:
+        """Store the measured lag."""
+        self.lag = lag
+        self.max_lag = max(self.max_lag, lag)
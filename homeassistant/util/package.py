@@ -1,11 +1,14 @@
 """Helpers to install PyPi packages."""
 import asyncio
+from functools import lru_cache
 import logging
 import os
 from pathlib import Path
+import re
 from subprocess import PIPE, Popen
 import sys
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import pkg_resources
@@ -13,16 +16,20 @@ import pkg_resources
 if sys.version_info[:2] >= (3, 8):
     from importlib.metadata import (  # pylint: disable=no-name-in-module,import-error
         PackageNotFoundError,
+        distributions,
         version,
     )
 else:
     from importlib_metadata import (  # pylint: disable=import-error
         PackageNotFoundError,
+        distributions,
         version,
     )
 
 _LOGGER = logging.getLogger(__name__)
 
+_NAME_SEPARATORS_RE = re.compile(r"[-_.]+")
+
 
 def is_virtual_env() -> bool:
     """Return if we run in a virtual environment."""
@@ -37,23 +44,97 @@ def is_docker_env() -> bool:
     return Path("/.dockerenv").exists()
 
 
-def is_installed(package: str) -> bool:
-    """Check if a package is installed and will be loaded when we import it.
+def _normalize_name(name: str) -> str:
+    """Return the normalized form of a distribution name."""
+    return _NAME_SEPARATORS_RE.sub("-", name).lower()
 
-    Returns True when the requirement is met.
-    Returns False when the package is not installed or doesn't meet req.
+
+def _path_signature() -> List[Tuple[str, Optional[int]]]:
+    """Return the import path with the modification time of each entry."""
+    signature = []
+    for path in sys.path:
+        try:
+            mtime: Optional[int] = os.stat(path or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        signature.append((path, mtime))
+    return signature
+
+
+class InstalledPackages:
+    """Index of the versions of the installed distributions.
+
+    Looking up a version with importlib.metadata scans every entry of the
+    import path. The index is built with a single scan and rebuilt when the
+    import path or the modification time of one of its directories changes,
+    which happens when a distribution is installed, upgraded or removed.
     """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._signature: Optional[List[Tuple[str, Optional[int]]]] = None
+        self._versions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Rebuild the index on the next lookup."""
+        with self._lock:
+            self._signature = None
+
+    def version(self, name: str) -> Optional[str]:
+        """Return the installed version of a distribution or None."""
+        signature = _path_signature()
+        with self._lock:
+            if signature != self._signature:
+                self._versions = self._build()
+                self._signature = signature
+            return self._versions.get(_normalize_name(name))
+
+    @staticmethod
+    def _build() -> Dict[str, str]:
+        """Build the index from the distributions on the import path."""
+        versions: Dict[str, str] = {}
+        for dist in distributions():
+            metadata = dist.metadata
+            name, dist_version = metadata["Name"], metadata["Version"]
+            # The first distribution on the import path is the one imported
+            if name and dist_version:
+                versions.setdefault(_normalize_name(name), dist_version)
+        _LOGGER.debug("Indexed %d installed distributions", len(versions))
+        return versions
+
+
+INSTALLED_PACKAGES = InstalledPackages()
+
+
+@lru_cache(maxsize=None)
+def _parse_requirement(package: str) -> pkg_resources.Requirement:
+    """Parse a requirement."""
     try:
-        req = pkg_resources.Requirement.parse(package)
+        return pkg_resources.Requirement.parse(package)
     except ValueError:
         # This is a zip file. We no longer use this in Home Assistant,
         # leaving it in for custom components.
-        req = pkg_resources.Requirement.parse(urlparse(package).fragment)
+        return pkg_resources.Requirement.parse(urlparse(package).fragment)
 
-    try:
-        return version(req.project_name) in req
-    except PackageNotFoundError:
-        return False
+
+def is_installed(package: str) -> bool:
+    """Check if a package is installed and will be loaded when we import it.
+
+    Returns True when the requirement is met.
+    Returns False when the package is not installed or doesn't meet req.
+    """
+    req = _parse_requirement(package)
+    installed_version = INSTALLED_PACKAGES.version(req.project_name)
+    if installed_version is None:
+        # Distributions are found by the name of their metadata directory,
+        # which can differ from the name in their metadata.
+        try:
+            installed_version = version(req.project_name)
+        except PackageNotFoundError:
+            return False
+
+    return installed_version in req
 
 
 def install_package(
@@ -91,6 +172,7 @@ def install_package(
             args += ["--prefix="]
     process = Popen(args, stdin=PIPE, stdout=PIPE, stderr=PIPE, env=env)
     _, stderr = process.communicate()
+    INSTALLED_PACKAGES.invalidate()
     if process.returncode != 0:
         _LOGGER.error(
             "Unable to install package %s: %s",
@@ -0,0 +1,127 @@
+"""Record a timeline of what happens during setup."""
+from collections import deque
+from contextlib import contextmanager
+from timeit import default_timer as timer
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Set
+
+import attr
+
+# Reloads keep adding spans after startup, only the most recent are kept
+MAX_SPANS = 10000
+
+
+@attr.s(slots=True, frozen=True)
+class Span:
+    """A phase of work done for a domain."""
+
+    domain: str = attr.ib()
+    phase: str = attr.ib()
+    # Seconds since the start of the timeline
+    start: float = attr.ib()
+    end: float = attr.ib()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the span."""
+        return {
+            "domain": self.domain,
+            "phase": self.phase,
+            "start": self.start,
+            "end": self.end,
+        }
+
+
+class Timeline:
+    """A timeline of spans per domain and the dependencies between domains."""
+
+    def __init__(self, max_spans: int = MAX_SPANS) -> None:
+        """Initialize the timeline."""
+        self.origin = timer()
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+        self.dependencies: Dict[str, Set[str]] = {}
+
+    def add_span(self, domain: str, phase: str, start: float, end: float) -> None:
+        """Record a span from start and end times of the default timer."""
+        self.spans.append(Span(domain, phase, start - self.origin, end - self.origin))
+
+    @contextmanager
+    def span(self, domain: str, phase: str) -> Iterator[None]:
+        """Record the time spent in the block as a span."""
+        start = timer()
+        try:
+            yield
+        finally:
+            self.add_span(domain, phase, start, timer())
+
+    def add_dependencies(self, domain: str, dependencies: Iterable[str]) -> None:
+        """Record the domains a domain waits for."""
+        self.dependencies.setdefault(domain, set()).update(dependencies)
+
+    def critical_path(self) -> List[Dict[str, Any]]:
+        """Return the chain of domains that determined when the last one finished.
+
+        Starts at the domain that finished last and follows the dependency
+        that finished last, until a domain without recorded dependencies.
+        """
+        ends: Dict[str, float] = {}
+        for span in self.spans:
+            ends[span.domain] = max(ends.get(span.domain, 0), span.end)
+
+        if not ends:
+            return []
+
+        domain = max(ends, key=ends.__getitem__)
+        path = [domain]
+        while True:
+            dependencies = [
+                dep
+                for dep in self.dependencies.get(domain, ())
+                if dep in ends and dep not in path
+            ]
+            if not dependencies:
+                break
+            domain = max(dependencies, key=ends.__getitem__)
+            path.append(domain)
+
+        return [{"domain": domain, "end": ends[domain]} for domain in reversed(path)]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON serializable representation of the timeline."""
+        return {
+            "spans": [span.as_dict() for span in self.spans],
+            "critical_path": self.critical_path(),
+        }
+
+    def as_chrome_trace(self) -> Dict[str, Any]:
+        """Return the timeline in the Chrome trace event format.
+
+        Each domain is shown as its own thread.
+        """
+        threads: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+
+        for span in self.spans:
+            tid = threads.get(span.domain)
+            if tid is None:
+                tid = threads[span.domain] = len(threads) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": span.domain},
+                    }
+                )
+            events.append(
+                {
+                    "name": span.phase,
+                    "cat": span.domain,
+                    "ph": "X",
+                    "ts": round(span.start * 1000000),
+                    "dur": round((span.end - span.start) * 1000000),
+                    "pid": 1,
+                    "tid": tid,
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -1,6 +1,7 @@
 """Helpers to generate uuids."""
 
 from random import getrandbits
+from time import time_ns
 
 
 def random_uuid_hex() -> str:
@@ -10,3 +11,15 @@ def random_uuid_hex() -> str:
     operations.
     """
     return "%032x" % getrandbits(32 * 4)
+
+
+def ulid_hex() -> str:
+    """Generate a time ordered ULID as a UUID hex.
+
+    The first 48 bits are the time in milliseconds and the remaining
+    80 bits are random, so ids created later sort after earlier ones.
+
+    This ulid should not be used for cryptographically secure
+    operations.
+    """
+    return "%032x" % ((time_ns() // 1000000) << 80 | getrandbits(80))
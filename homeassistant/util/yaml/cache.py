@@ -0,0 +1,206 @@
+"""Cache of parsed YAML files."""
+from collections import OrderedDict
+from datetime import date, datetime
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from homeassistant.const import __version__
+
+from .loader import (
+    JSON_TYPE,
+    EnvReference,
+    SecretReference,
+    _load_secret_yaml,
+    env_signature,
+    load_yaml,
+    stat_signature,
+    track_dependencies,
+)
+from .objects import Input, NodeListClass, NodeStrClass
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+
+# Type of an encoded object
+_TYPE = "t"
+_VALUE = "v"
+_FILE = "f"
+_LINE = "n"
+
+
+class UncacheableError(Exception):
+    """Error to indicate a value can not be stored in the cache."""
+
+
+def load_yaml_cached(fname: str, cache_path: str) -> JSON_TYPE:
+    """Load a YAML file, reusing the parsed result if its sources did not change.
+
+    The parsed result is stored as JSON in cache_path together with the
+    modification time and size of every file and directory it was loaded from
+    and a digest of the environment variables it used. Secrets and environment
+    variables are stored by name and looked up again when the cache is read.
+    """
+    cached = _read_cache(cache_path, fname)
+    if cached is not None:
+        _LOGGER.debug("Using cached %s", fname)
+        return cached  # type: ignore
+
+    with track_dependencies() as dependencies:
+        data = load_yaml(fname)
+
+    try:
+        content = json.dumps(_encode(data), separators=(",", ":"))
+    except UncacheableError as err:
+        _LOGGER.debug("Unable to cache %s: %s", fname, err)
+        # Load again without references
+        return load_yaml(fname)
+
+    if dependencies.cacheable:
+        header = {
+            "version": [CACHE_VERSION, __version__],
+            "fname": fname,
+            "paths": dependencies.paths,
+            "env": dependencies.env,
+        }
+        _write_cache(cache_path, f"{json.dumps(header)}\n{content}\n")
+
+    # Resolves the references loaded while tracking
+    return _decode(content)  # type: ignore
+
+
+def _encode(value: Any) -> Any:
+    """Encode parsed YAML to values that can be stored as JSON."""
+    # Exact types, subclasses might carry more than can be restored
+    value_type = type(value)
+    if value is None or value_type in (str, int, float, bool):
+        return value
+
+    if value_type in (dict, OrderedDict):
+        encoded = {
+            _TYPE: "o" if value_type is OrderedDict else "d",
+            _VALUE: [[_encode(key), _encode(val)] for key, val in value.items()],
+        }
+    elif value_type in (list, NodeListClass):
+        encoded = {
+            _TYPE: "L" if value_type is NodeListClass else "l",
+            _VALUE: [_encode(item) for item in value],
+        }
+    elif value_type is NodeStrClass:
+        encoded = {_TYPE: "s", _VALUE: str(value)}
+    elif value_type is SecretReference:
+        return {_TYPE: "secret", _VALUE: value.name, "path": value.path}
+    elif value_type is EnvReference:
+        return {_TYPE: "env", _VALUE: value.name, "default": value.default}
+    elif value_type is Input:
+        return {_TYPE: "input", _VALUE: value.name}
+    elif value_type is datetime:
+        return {_TYPE: "datetime", _VALUE: value.isoformat()}
+    elif value_type is date:
+        return {_TYPE: "date", _VALUE: value.isoformat()}
+    else:
+        raise UncacheableError(f"Unsupported type {value_type.__name__}")
+
+    if hasattr(value, "__config_file__"):
+        encoded[_FILE] = value.__config_file__
+    if hasattr(value, "__line__"):
+        encoded[_LINE] = value.__line__
+    return encoded
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    """Decode an object created by _encode."""
+    value_type = obj[_TYPE]
+    value = obj[_VALUE]
+
+    if value_type == "secret":
+        return _load_secret_yaml(obj["path"])[value]  # type: ignore
+    if value_type == "env":
+        env_value = os.getenv(value, obj["default"])
+        if env_value is None:
+            raise KeyError(value)
+        return env_value
+    if value_type == "input":
+        return Input(value)
+    if value_type == "datetime":
+        return datetime.fromisoformat(value)
+    if value_type == "date":
+        return date.fromisoformat(value)
+
+    decoded: Any
+    if value_type == "o":
+        decoded = OrderedDict(value)
+    elif value_type == "d":
+        decoded = dict(value)
+    elif value_type == "L":
+        decoded = NodeListClass(value)
+    elif value_type == "l":
+        decoded = value
+    elif value_type == "s":
+        decoded = NodeStrClass(value)
+    else:
+        raise ValueError(f"Unknown type {value_type}")
+
+    if _FILE in obj:
+        setattr(decoded, "__config_file__", obj[_FILE])
+    if _LINE in obj:
+        setattr(decoded, "__line__", obj[_LINE])
+    return decoded
+
+
+def _decode(content: str) -> Any:
+    """Decode parsed YAML stored by _encode."""
+    return json.loads(content, object_hook=_decode_object)
+
+
+def _is_current(header: Dict[str, Any], fname: str) -> bool:
+    """Return if a cached result is for the file and its sources are unchanged."""
+    return (
+        header.get("version") == [CACHE_VERSION, __version__]
+        and header.get("fname") == fname
+        and all(
+            stat_signature(path) == (tuple(signature) if signature else None)
+            for path, signature in header["paths"].items()
+        )
+        and all(
+            env_signature(os.environ.get(key)) == value
+            for key, value in header["env"].items()
+        )
+    )
+
+
+def _read_cache(cache_path: str, fname: str) -> Optional[JSON_TYPE]:
+    """Read the cached result for fname if its sources did not change."""
+    try:
+        with open(cache_path, encoding="utf-8") as fil:
+            header = json.loads(fil.readline())
+            if not isinstance(header, dict) or not _is_current(header, fname):
+                return None
+            return _decode(fil.read())  # type: ignore
+    except FileNotFoundError:
+        return None
+    except Exception as err:  # pylint: disable=broad-except
+        # Corrupt, written by an incompatible version or a secret is gone
+        _LOGGER.debug("Unable to read YAML cache %s: %s", cache_path, err)
+        return None
+
+
+def _write_cache(cache_path: str, content: str) -> None:
+    """Write the cache file, only readable by the owner."""
+    tmp_filename = ""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", dir=os.path.dirname(cache_path), delete=False
+        ) as fdesc:
+            fdesc.write(content)
+            tmp_filename = fdesc.name
+        os.replace(tmp_filename, cache_path)
+    except OSError as err:
+        _LOGGER.debug("Unable to write YAML cache %s: %s", cache_path, err)
+    finally:
+        if tmp_filename and os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
@@ -1,13 +1,37 @@
 """Custom loader."""
 from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 import fnmatch
+import hashlib
 import logging
 import os
 import sys
-from typing import Dict, Iterator, List, TextIO, TypeVar, Union, overload
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import _SECRET_NAMESPACE, SECRET_YAML
@@ -31,10 +55,98 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
+__SECRET_SIGNATURES: Dict[str, Optional[Tuple[int, int]]] = {}
 
 CREDSTASH_WARN = False
 KEYRING_WARN = False
 
+_TRACKING = threading.local()
+
+
+class Dependencies:
+    """The files, directories and environment variables YAML was loaded from."""
+
+    def __init__(self) -> None:
+        """Initialize the dependencies."""
+        # Path -> (mtime in ns, size) or None if it does not exist
+        self.paths: Dict[str, Optional[Tuple[int, int]]] = {}
+        # Environment variable -> env_signature of its value
+        self.env: Dict[str, Optional[str]] = {}
+        # False if the result also depends on something else
+        self.cacheable = True
+
+    def add_path(self, path: str) -> None:
+        """Record the current modification time and size of a path."""
+        if path not in self.paths:
+            self.paths[path] = stat_signature(path)
+
+
+def stat_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Return the modification time and size of a path or None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def env_signature(value: Optional[str]) -> Optional[str]:
+    """Return a digest of an environment variable value or None if not set."""
+    if value is None:
+        return None
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class SecretReference:
+    """A secret from secrets.yaml, loaded while dependencies are tracked.
+
+    Tracked YAML is cached, so secrets are kept as references and resolved
+    after the result has been stored.
+    """
+
+    name: str
+    # Directory of the secrets.yaml file
+    path: str
+    value: Any = field(compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class EnvReference:
+    """An environment variable, loaded while dependencies are tracked."""
+
+    name: str
+    default: Optional[str]
+    value: str = field(compare=False, repr=False)
+
+
+@contextmanager
+def _tracking(dependencies: Optional[Dependencies]) -> Iterator[None]:
+    """Set the dependencies tracked in this thread."""
+    previous = getattr(_TRACKING, "dependencies", None)
+    _TRACKING.dependencies = dependencies
+    try:
+        yield
+    finally:
+        _TRACKING.dependencies = previous
+
+
+@contextmanager
+def track_dependencies() -> Iterator[Dependencies]:
+    """Track the dependencies of YAML loaded in this thread.
+
+    While tracking, secrets and environment variables are loaded as
+    SecretReference and EnvReference objects.
+    """
+    dependencies = Dependencies()
+    with _tracking(dependencies):
+        yield dependencies
+
+
+def _tracked_dependencies() -> Optional[Dependencies]:
+    """Return the dependencies being tracked in this thread."""
+    return getattr(_TRACKING, "dependencies", None)
+
 
 def clear_secret_cache() -> None:
     """Clear the secret cache.
@@ -42,6 +154,7 @@ def clear_secret_cache() -> None:
     Async friendly.
     """
     __SECRET_CACHE.clear()
+    __SECRET_SIGNATURES.clear()
 
 
 class SafeLineLoader(yaml.SafeLoader):
@@ -55,22 +168,55 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+class FastSafeLoader(FastestAvailableSafeLoader):
+    """Loader class using libyaml when it is available.
+
+    The C parser does not keep track of the stream, so it is stored for the
+    constructors to find the file name. Line numbers come from node marks.
+    """
+
+    def __init__(self, stream: Union[str, TextIO]) -> None:
+        """Initialize the loader."""
+        super().__init__(stream)
+        self.stream = stream
+        self.name = getattr(stream, "name", "<unicode string>")
+
+
+def add_constructor(tag: str, constructor: Callable) -> None:
+    """Add a constructor for a tag to the loaders."""
+    yaml.SafeLoader.add_constructor(tag, constructor)
+    FastSafeLoader.add_constructor(tag, constructor)
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
     """Load a YAML file."""
+    dependencies = _tracked_dependencies()
+    if dependencies is not None:
+        # Before reading, so a change while reading is noticed next time
+        dependencies.add_path(fname)
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file)
+            if dependencies is not None and dependencies.paths[fname] is None:
+                # Read, but not from the file system
+                dependencies.cacheable = False
+            content = parse_yaml(conf_file)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    if isinstance(content, (SecretReference, EnvReference)):
+        # A file that only is a reference can not have file information added
+        _mark_uncacheable()
+        return content.value  # type: ignore
+    return content
+
 
 def parse_yaml(content: Union[str, TextIO]) -> JSON_TYPE:
     """Load a YAML file."""
     try:
         # If configuration file is empty YAML returns None
         # We convert that to an empty dict
-        return yaml.load(content, Loader=SafeLineLoader) or OrderedDict()
+        return yaml.load(content, Loader=FastSafeLoader) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -97,7 +243,7 @@ def _add_reference(
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: FastSafeLoader, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -108,7 +254,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: FastSafeLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -131,7 +277,10 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    dependencies = _tracked_dependencies()
     for root, dirs, files in os.walk(directory, topdown=True):
+        if dependencies is not None:
+            dependencies.add_path(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -140,7 +289,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
 
 
 def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -154,7 +303,7 @@ def _include_dir_named_yaml(
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -169,7 +318,7 @@ def _include_dir_merge_named_yaml(
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> List[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -181,7 +330,7 @@ def _include_dir_list_yaml(
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
@@ -195,7 +344,7 @@ def _include_dir_merge_list_yaml(
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: FastSafeLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -227,31 +376,54 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: FastSafeLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(
+    loader: FastSafeLoader, node: yaml.nodes.Node
+) -> Union[str, EnvReference]:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
     # Check for a default value
-    if len(args) > 1:
-        return os.getenv(args[0], " ".join(args[1:]))
-    if args[0] in os.environ:
-        return os.environ[args[0]]
-    _LOGGER.error("Environment variable %s not defined", node.value)
-    raise HomeAssistantError(node.value)
+    default = " ".join(args[1:]) if len(args) > 1 else None
+    value = os.getenv(args[0], default)
+    if value is None:
+        _LOGGER.error("Environment variable %s not defined", node.value)
+        raise HomeAssistantError(node.value)
+
+    dependencies = _tracked_dependencies()
+    if dependencies is None:
+        return value
+    dependencies.env[args[0]] = env_signature(os.environ.get(args[0]))
+    return EnvReference(args[0], default, value)
 
 
 def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
     """Load the secrets yaml from path."""
     secret_path = os.path.join(secret_path, SECRET_YAML)
-    if secret_path in __SECRET_CACHE:
-        return __SECRET_CACHE[secret_path]
+    if secret_path not in __SECRET_CACHE:
+        __SECRET_SIGNATURES[secret_path] = stat_signature(secret_path)
+        # The secrets are shared, so they are never loaded as references
+        with _tracking(None):
+            __SECRET_CACHE[secret_path] = _read_secret_yaml(secret_path)
+
+    dependencies = _tracked_dependencies()
+    if dependencies is not None:
+        # The secrets file as it was when the secrets were read
+        signature = __SECRET_SIGNATURES[secret_path]
+        dependencies.paths.setdefault(secret_path, signature)
+        if signature is None and __SECRET_CACHE[secret_path]:
+            dependencies.cacheable = False
+
+    return __SECRET_CACHE[secret_path]
 
+
+def _read_secret_yaml(secret_path: str) -> JSON_TYPE:
+    """Read the secrets yaml file."""
     _LOGGER.debug("Loading %s", secret_path)
     try:
         secrets = load_yaml(secret_path)
@@ -269,11 +441,17 @@ def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
             del secrets["logger"]
     except FileNotFoundError:
         secrets = {}
-    __SECRET_CACHE[secret_path] = secrets
     return secrets
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _mark_uncacheable() -> None:
+    """Mark the YAML being loaded as depending on more than files."""
+    dependencies = _tracked_dependencies()
+    if dependencies is not None:
+        dependencies.cacheable = False
+
+
+def secret_yaml(loader: FastSafeLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     secret_path = os.path.dirname(loader.name)
     while True:
@@ -285,6 +463,8 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
                 node.value,
                 secret_path,
             )
+            if _tracked_dependencies() is not None:
+                return SecretReference(node.value, secret_path, secrets[node.value])
             return secrets[node.value]
 
         if secret_path == os.path.dirname(sys.path[0]):
@@ -307,6 +487,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
                 )
 
             _LOGGER.debug("Secret %s retrieved from keyring", node.value)
+            _mark_uncacheable()
             return pwd
 
     global credstash  # pylint: disable=invalid-name, global-statement
@@ -324,6 +505,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
                         "Credstash is deprecated and will be removed in March 2021."
                     )
                 _LOGGER.debug("Secret %s retrieved from credstash", node.value)
+                _mark_uncacheable()
                 return pwd
         except credstash.ItemNotFound:
             pass
@@ -334,19 +516,13 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     raise HomeAssistantError(f"Secret {node.value} not defined")
 
 
-yaml.SafeLoader.add_constructor("!include", _include_yaml)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-yaml.SafeLoader.add_constructor("!env_var", _env_var_yaml)
-yaml.SafeLoader.add_constructor("!secret", secret_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-yaml.SafeLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-yaml.SafeLoader.add_constructor("!input", Input.from_node)
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+add_constructor("!input", Input.from_node)
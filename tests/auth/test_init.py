@@ -474,6 +474,114 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validated_access_token_cached(mock_hass):
+    """Test validated access tokens are not decoded again."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    assert not mock_decode.called
+
+    user.is_active = False
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_cached_access_token_expires(mock_hass):
+    """Test cached access tokens are not valid after they expire."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch(
+        "homeassistant.auth.time.time",
+        return_value=dt_util.utcnow().timestamp()
+        + auth_const.ACCESS_TOKEN_EXPIRATION.total_seconds(),
+    ), patch("homeassistant.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError):
+        assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_remove_refresh_token_invalidates_cache(mock_hass):
+    """Test removing a refresh token invalidates cached access tokens."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    other_refresh_token = await manager.async_create_refresh_token(user, "other")
+    access_token = manager.async_create_access_token(refresh_token)
+    other_access_token = manager.async_create_access_token(other_refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert (
+        await manager.async_validate_access_token(other_access_token)
+        is other_refresh_token
+    )
+
+    await manager.async_remove_refresh_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is None
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert (
+            await manager.async_validate_access_token(other_access_token)
+            is other_refresh_token
+        )
+
+    assert not mock_decode.called
+
+
+async def test_remove_user_invalidates_cache(mock_hass):
+    """Test removing a user invalidates cached access tokens."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_user(user)
+
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_access_token_cache_bounded(mock_hass):
+    """Test the access token cache only keeps the recently used tokens."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_tokens = [
+        jwt.encode(
+            {"iss": refresh_token.id, "exp": dt_util.utcnow() + timedelta(hours=hours)},
+            refresh_token.jwt_key,
+            algorithm="HS256",
+        ).decode()
+        for hours in (1, 2)
+    ]
+
+    with patch("homeassistant.auth.ACCESS_TOKEN_CACHE_SIZE", 1):
+        for access_token in access_tokens:
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+
+    with patch(
+        "homeassistant.auth.jwt.decode", side_effect=jwt.InvalidTokenError
+    ) as mock_decode:
+        assert await manager.async_validate_access_token(access_tokens[0]) is None
+        assert (
+            await manager.async_validate_access_token(access_tokens[1]) is refresh_token
+        )
+
+    assert mock_decode.call_count == 1
+
+
 async def test_create_access_token(mock_hass):
     """Test normal refresh_token's jwt_key keep same after used."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
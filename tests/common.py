@@ -169,7 +169,7 @@ async def async_test_home_assistant(loop):
 
         return orig_async_add_job(target, *args)
 
-    def async_add_executor_job(target, *args):
+    def async_add_executor_job(target, *args, pool=None):
         """Add executor job."""
         check_target = target
         while isinstance(check_target, ft.partial):
@@ -180,7 +180,7 @@ async def async_test_home_assistant(loop):
             fut.set_result(target(*args))
             return fut
 
-        return orig_async_add_executor_job(target, *args)
+        return orig_async_add_executor_job(target, *args, pool=pool)
 
     def async_create_task(coroutine):
         """Create task."""
@@ -928,7 +928,7 @@ def mock_storage(data=None):
         _LOGGER.info("Loading data for %s: %s", store.key, loaded)
         return loaded
 
-    def mock_write_data(store, path, data_to_write):
+    def mock_write_data(store, path, data_to_write, final=False):
         """Mock version of write data."""
         _LOGGER.info("Writing data to %s: %s", store.key, data_to_write)
         # To ensure that the data can be serialized
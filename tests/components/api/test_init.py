@@ -106,6 +106,49 @@ async def test_api_state_change_to_zero_value(hass, mock_api_client):
     assert resp.status == 200
 
 
+async def test_api_bulk_state_change(hass, mock_api_client):
+    """Test setting the state of multiple entities at once."""
+    hass.states.async_set("test.existing", "off")
+
+    resp = await mock_api_client.post(
+        const.URL_API_STATES,
+        json=[
+            {"entity_id": "test.existing", "state": "on"},
+            {"entity_id": "test.new", "state": 5, "attributes": {"unit": "W"}},
+            {"entity_id": "invalid", "state": "on"},
+            {"entity_id": "test.missing_state"},
+            {"entity_id": "test.too_long", "state": "x" * 256},
+        ],
+    )
+
+    assert resp.status == 200
+    results = await resp.json()
+    assert results[0] == {
+        "entity_id": "test.existing",
+        "success": True,
+        "created": False,
+    }
+    assert results[1] == {"entity_id": "test.new", "success": True, "created": True}
+    assert [result["success"] for result in results[2:]] == [False, False, False]
+    assert results[2]["entity_id"] == "invalid"
+
+    assert hass.states.get("test.existing").state == "on"
+    new_state = hass.states.get("test.new")
+    assert new_state.state == "5"
+    assert new_state.attributes == {"unit": "W"}
+    assert hass.states.get("test.existing").context is new_state.context
+    assert hass.states.get("test.missing_state") is None
+    assert hass.states.get("test.too_long") is None
+
+
+async def test_api_bulk_state_change_not_list(hass, mock_api_client):
+    """Test bulk setting states requires a list."""
+    resp = await mock_api_client.post(
+        const.URL_API_STATES, json={"entity_id": "test.test", "state": "on"}
+    )
+    assert resp.status == 400
+
+
 # pylint: disable=invalid-name
 async def test_api_state_change_push(hass, mock_api_client):
     """Test if we can push a change the state of an entity."""
@@ -351,6 +394,56 @@ async def test_stream_with_restricted(hass, mock_api_client):
     assert data["event_type"] == "test_event3"
 
 
+async def test_stream_with_entity_filter(hass, mock_api_client):
+    """Test the stream filtered by entity id and domain."""
+    resp = await mock_api_client.get(
+        f"{const.URL_API_STREAM}?entity_id=light.kitchen&domain=switch"
+    )
+    assert resp.status == 200
+
+    hass.bus.async_fire("test_event")
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("light.kitchen", "on")
+    data = await _stream_next_event(resp.content)
+    assert data["event_type"] == "state_changed"
+    assert data["data"]["entity_id"] == "light.kitchen"
+    assert data["data"]["new_state"]["state"] == "on"
+
+    hass.states.async_set("light.bedroom", "off")
+    hass.bus.async_fire("call_service", {"entity_id": ["light.kitchen"]})
+    hass.states.async_set("switch.pump", "off")
+    data = await _stream_next_event(resp.content)
+    assert data["data"]["entity_id"] == "switch.pump"
+
+
+async def test_stream_compact(hass, mock_api_client):
+    """Test the stream with compact state payloads."""
+    resp = await mock_api_client.get(f"{const.URL_API_STREAM}?compact=1")
+    assert resp.status == 200
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    data = await _stream_next_event(resp.content)
+    assert data == {
+        "event_type": "state_changed",
+        "entity_id": "light.kitchen",
+        "state": "on",
+        "attributes": {"brightness": 100},
+        "last_changed": hass.states.get("light.kitchen").last_changed.isoformat(),
+    }
+
+    hass.states.async_remove("light.kitchen")
+    data = await _stream_next_event(resp.content)
+    assert data == {
+        "event_type": "state_changed",
+        "entity_id": "light.kitchen",
+        "state": None,
+    }
+
+    hass.bus.async_fire("test_event")
+    data = await _stream_next_event(resp.content)
+    assert data["event_type"] == "test_event"
+
+
 async def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
     while True:
@@ -376,6 +469,24 @@ def _listen_count(hass):
     return sum(hass.bus.async_listeners().values())
 
 
+async def test_api_setup_timeline(hass, hass_client, hass_admin_user):
+    """Test downloading the setup timeline as a Chrome trace."""
+    await async_setup_component(hass, "api", {})
+    client = await hass_client()
+
+    resp = await client.get("/api/setup_timeline")
+    assert resp.status == 200
+    assert "attachment" in resp.headers["Content-Disposition"]
+    trace = await resp.json()
+    assert {"name": "api"} in [
+        event["args"] for event in trace["traceEvents"] if event["ph"] == "M"
+    ]
+
+    hass_admin_user.groups = []
+    resp = await client.get("/api/setup_timeline")
+    assert resp.status == 401
+
+
 async def test_api_error_log(hass, aiohttp_client, hass_access_token, hass_admin_user):
     """Test if we can fetch the error log."""
     hass.data[DATA_LOGGING] = "/some/path"
@@ -494,6 +605,13 @@ async def test_post_entity_state_admin(hass, mock_api_client, hass_admin_user):
     assert resp.status == 401
 
 
+async def test_post_states_admin(hass, mock_api_client, hass_admin_user):
+    """Test bulk setting states requires admin."""
+    hass_admin_user.groups = []
+    resp = await mock_api_client.post(const.URL_API_STATES, json=[])
+    assert resp.status == 401
+
+
 async def test_delete_entity_state_admin(hass, mock_api_client, hass_admin_user):
     """Test deleting entity requires admin."""
     hass_admin_user.groups = []
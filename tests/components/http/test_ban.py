@@ -15,6 +15,7 @@ from homeassistant.components.http.ban import (
     KEY_BANNED_IPS,
     KEY_FAILED_LOGIN_ATTEMPTS,
     IpBan,
+    IpBanStore,
     setup_bans,
 )
 from homeassistant.components.http.view import request_handler_factory
@@ -108,6 +109,7 @@ async def test_access_from_supervisor_ip(
         resp = await client.get("/")
         assert resp.status == 401
         assert len(app[KEY_BANNED_IPS]) == bans
+        await hass.async_block_till_done()
         assert m_open.call_count == bans
 
         # second request should be forbidden if banned
@@ -116,6 +118,58 @@ async def test_access_from_supervisor_ip(
         assert len(app[KEY_BANNED_IPS]) == bans
 
 
+async def test_access_from_banned_network(hass, aiohttp_client):
+    """Test accessing to server from a banned network."""
+    app = web.Application()
+    app["hass"] = hass
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.async_load_ip_bans_config",
+        return_value=[IpBan("10.0.0.0/24"), IpBan("2001:db8::/32")],
+    ):
+        client = await aiohttp_client(app)
+
+    for remote_addr in ("10.0.0.1", "10.0.0.255", "2001:db8::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTP_FORBIDDEN
+
+    for remote_addr in ("10.0.1.1", "2001:db9::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == 404
+
+
+async def test_ip_ban_store(hass):
+    """Test the IP ban store index and batched persistence."""
+    store = IpBanStore(
+        hass, hass.config.path(IP_BANS_FILE), [IpBan("10.0.0.0/8"), IpBan("::1")]
+    )
+
+    assert len(store) == 2
+    assert ip_address("10.20.30.40") in store
+    assert ip_address("::1") in store
+    assert ip_address("11.0.0.1") not in store
+    assert ip_address("::2") not in store
+
+    with patch(
+        "homeassistant.components.http.ban.update_ip_bans_config"
+    ) as mock_update:
+        store.async_add(IpBan("200.201.202.204"))
+        store.async_add(IpBan("200.201.202.205"))
+        await hass.async_block_till_done()
+
+    assert len(store) == 4
+    assert ip_address("200.201.202.205") in store
+    assert len(mock_update.mock_calls) == 1
+    assert [str(ip_ban) for ip_ban in mock_update.mock_calls[0][1][1]] == [
+        "200.201.202.204",
+        "200.201.202.205",
+    ]
+
+
 async def test_ban_middleware_not_loaded_by_config(hass):
     """Test accessing to server from banned IP when feature is off."""
     with patch("homeassistant.components.http.setup_bans") as mock_setup:
@@ -166,6 +220,7 @@ async def test_ip_bans_file_creation(hass, aiohttp_client):
         resp = await client.get("/")
         assert resp.status == 401
         assert len(app[KEY_BANNED_IPS]) == len(BANNED_IPS) + 1
+        await hass.async_block_till_done()
         m_open.assert_called_once_with(hass.config.path(IP_BANS_FILE), "a")
 
         resp = await client.get("/")
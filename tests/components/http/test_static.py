@@ -0,0 +1,152 @@
+"""The tests for the static file handling of the HTTP component."""
+import os
+
+from aiohttp import web
+import pytest
+
+from homeassistant.components.http.const import KEY_HASS
+from homeassistant.components.http.static import (
+    CACHE_HEADERS,
+    IMMUTABLE_CACHE_HEADERS,
+    CachingStaticResource,
+)
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Create a directory with static files."""
+    (tmp_path / "app.de2d54bf.js").write_text("plain")
+    (tmp_path / "app.de2d54bf.js.gz").write_bytes(b"gzipped")
+    (tmp_path / "app.de2d54bf.js.br").write_bytes(b"brotli")
+    (tmp_path / "robots.txt").write_text("robots")
+    return tmp_path
+
+
+@pytest.fixture
+async def static_client(hass, aiohttp_client, static_dir):
+    """Return a client for a caching static resource."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    app.router.register_resource(CachingStaticResource("/static", str(static_dir)))
+    return await aiohttp_client(app, auto_decompress=False)
+
+
+async def test_serve_brotli(static_client):
+    """Test the brotli variant is preferred."""
+    resp = await static_client.get(
+        "/static/app.de2d54bf.js", headers={"Accept-Encoding": "gzip, deflate, br"}
+    )
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "br"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert resp.headers["Cache-Control"] == IMMUTABLE_CACHE_HEADERS["Cache-Control"]
+    assert resp.headers["ETag"].endswith('-br"')
+    assert await resp.read() == b"brotli"
+
+
+async def test_serve_gzip(static_client):
+    """Test the gzip variant is served when brotli is not accepted."""
+    resp = await static_client.get(
+        "/static/app.de2d54bf.js", headers={"Accept-Encoding": "gzip, br;q=0"}
+    )
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["ETag"].endswith('-gzip"')
+    assert await resp.read() == b"gzipped"
+
+
+async def test_serve_identity(static_client):
+    """Test the uncompressed file is served without compression support."""
+    resp = await static_client.get(
+        "/static/app.de2d54bf.js", headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.status == 200
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.text() == "plain"
+
+
+async def test_serve_identity_gzip_refused(static_client):
+    """Test the uncompressed file is served when gzip is refused."""
+    resp = await static_client.get(
+        "/static/app.de2d54bf.js", headers={"Accept-Encoding": "gzip;q=0"}
+    )
+    assert resp.status == 200
+    assert "Content-Encoding" not in resp.headers
+    assert resp.headers["ETag"].endswith('"') and "-" not in resp.headers["ETag"]
+    assert resp.headers["Content-Length"] == "5"
+    assert await resp.text() == "plain"
+
+
+async def test_not_fingerprinted(static_client):
+    """Test files without a content hash in the name are not immutable."""
+    resp = await static_client.get("/static/robots.txt")
+    assert resp.status == 200
+    assert resp.headers["Content-Type"] == "text/plain"
+    assert resp.headers["Cache-Control"] == CACHE_HEADERS["Cache-Control"]
+    assert "Vary" not in resp.headers
+    assert await resp.text() == "robots"
+
+
+async def test_conditional_request(static_client, static_dir):
+    """Test conditional requests are answered from the index."""
+    os.utime(static_dir / "app.de2d54bf.js.gz", (1600000000.75, 1600000000.75))
+    resp = await static_client.get(
+        "/static/app.de2d54bf.js", headers={"Accept-Encoding": "gzip"}
+    )
+    etag = resp.headers["ETag"]
+    last_modified = resp.headers["Last-Modified"]
+    assert last_modified == "Sun, 13 Sep 2020 12:26:41 GMT"
+
+    resp = await static_client.get(
+        "/static/app.de2d54bf.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": f'"other", {etag}'},
+    )
+    assert resp.status == 304
+    assert resp.headers["ETag"] == etag
+    assert resp.headers["Cache-Control"] == IMMUTABLE_CACHE_HEADERS["Cache-Control"]
+
+    resp = await static_client.get(
+        "/static/app.de2d54bf.js",
+        headers={"Accept-Encoding": "gzip", "If-Modified-Since": last_modified},
+    )
+    assert resp.status == 304
+
+
+async def test_changed_file(static_client, static_dir):
+    """Test the index entry of a file is replaced when the file changes."""
+    resp = await static_client.get("/static/robots.txt")
+    etag = resp.headers["ETag"]
+
+    (static_dir / "robots.txt").write_text("changed robots")
+    resp = await static_client.get(
+        "/static/robots.txt", headers={"If-None-Match": etag}
+    )
+    assert resp.status == 200
+    assert resp.headers["ETag"] != etag
+    assert await resp.text() == "changed robots"
+
+    (static_dir / "robots.txt").unlink()
+    resp = await static_client.get("/static/robots.txt")
+    assert resp.status == 404
+
+
+async def test_range_request(static_client):
+    """Test ranges of the selected representation can be requested."""
+    resp = await static_client.get("/static/robots.txt", headers={"Range": "bytes=2-"})
+    assert resp.status == 206
+    assert resp.headers["Content-Range"] == "bytes 2-5/6"
+    assert await resp.text() == "bots"
+
+    resp = await static_client.get(
+        "/static/app.de2d54bf.js",
+        headers={"Accept-Encoding": "gzip", "Range": "bytes=0-1"},
+    )
+    assert resp.status == 206
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert await resp.read() == b"gz"
+
+
+async def test_not_found(static_client):
+    """Test requesting a missing file."""
+    resp = await static_client.get("/static/missing.js")
+    assert resp.status == 404
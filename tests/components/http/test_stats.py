@@ -0,0 +1,113 @@
+"""Test request statistics middleware."""
+from aiohttp import web
+
+from homeassistant.components.http.stats import RequestStats, setup_request_stats
+
+
+async def test_request_stats_middleware(aiohttp_client):
+    """Test requests are recorded per route."""
+    stats = RequestStats()
+    app = web.Application()
+
+    async def mock_handler(request):
+        """Return the entity id as text."""
+        return web.Response(text=request.match_info["entity_id"])
+
+    async def mock_not_found(request):
+        """Raise not found."""
+        raise web.HTTPNotFound()
+
+    async def mock_error(request):
+        """Raise an unexpected error."""
+        raise ValueError
+
+    app.router.add_get("/api/states/{entity_id}", mock_handler)
+    app.router.add_get("/not_found", mock_not_found)
+    app.router.add_get("/error", mock_error)
+    setup_request_stats(app, stats)
+    mock_api_client = await aiohttp_client(app)
+
+    for entity_id in ("light.kitchen", "light.bedroom"):
+        resp = await mock_api_client.get(f"/api/states/{entity_id}")
+        assert resp.status == 200
+
+    resp = await mock_api_client.get("/not_found")
+    assert resp.status == 404
+
+    resp = await mock_api_client.get("/error")
+    assert resp.status == 500
+
+    resp = await mock_api_client.get("/no_route")
+    assert resp.status == 404
+
+    assert set(stats.routes) == {
+        ("GET", "/api/states/{entity_id}"),
+        ("GET", "/not_found"),
+        ("GET", "/error"),
+    }
+
+    entry = stats.routes[("GET", "/api/states/{entity_id}")]
+    assert entry.status == {200: 2}
+    assert entry.duration.count == 2
+    assert entry.response_size.sum == len("light.kitchen") + len("light.bedroom")
+
+    assert stats.routes[("GET", "/not_found")].status == {404: 1}
+    assert stats.routes[("GET", "/error")].status == {500: 1}
+
+    as_list = stats.as_list()
+    assert as_list[0]["method"] == "GET"
+    assert as_list[0]["route"] == "/api/states/{entity_id}"
+    assert as_list[0]["status"] == {"200": 2}
+    assert as_list[0]["duration"]["count"] == 2
+
+
+async def test_streamed_response_size(aiohttp_client):
+    """Test the size of streamed responses is recorded."""
+    stats = RequestStats()
+    app = web.Application()
+
+    async def mock_stream(request):
+        """Stream a response."""
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b"a" * 100)
+        await response.write(b"b" * 50)
+        await response.write_eof()
+        return response
+
+    app.router.add_get("/stream", mock_stream)
+    setup_request_stats(app, stats)
+    mock_api_client = await aiohttp_client(app)
+
+    resp = await mock_api_client.get("/stream")
+    assert resp.status == 200
+    assert len(await resp.read()) == 150
+
+    entry = stats.routes[("GET", "/stream")]
+    assert entry.response_size.count == 1
+    assert entry.response_size.sum >= 150
+
+
+async def test_file_response_size(aiohttp_client, tmp_path):
+    """Test the size of file responses prepared after the middleware is recorded."""
+    stats = RequestStats()
+    app = web.Application()
+    path = tmp_path / "file.txt"
+    path.write_text("x" * 1000)
+
+    async def mock_handler(request):
+        """Return a file."""
+        return web.FileResponse(path)
+
+    app.router.add_get("/file", mock_handler)
+    setup_request_stats(app, stats)
+    mock_api_client = await aiohttp_client(app)
+
+    resp = await mock_api_client.get("/file")
+    assert resp.status == 200
+    assert await resp.text() == "x" * 1000
+
+    entry = stats.routes[("GET", "/file")]
+    assert entry.status == {200: 1}
+    assert entry.response_size.count == 1
+    assert entry.response_size.sum == 1000
@@ -7,6 +7,7 @@ import pytest
 from homeassistant.components import climate, humidifier, sensor
 from homeassistant.components.demo.sensor import DemoSensor
 import homeassistant.components.prometheus as prometheus
+from homeassistant.components.websocket_api.const import DATA_COMMAND_STATS
 from homeassistant.const import (
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
     CONTENT_TYPE_TEXT_PLAIN,
@@ -92,6 +93,67 @@ async def prometheus_client(hass, hass_client):
     return await hass_client()
 
 
+async def test_view_websocket_command_stats(hass, hass_client):
+    """Test prometheus exports the websocket command statistics."""
+    assert await async_setup_component(
+        hass, "websocket_api", {"websocket_api": {"command_stats": True}}
+    )
+    command_stats = hass.data[DATA_COMMAND_STATS]
+    command_stats.async_record("ping", 0.002, 30)
+    command_stats.async_record("ping", 20, 30)
+
+    # Don't create any states, entity metrics can only be registered once
+    await async_setup_component(hass, prometheus.DOMAIN, {prometheus.DOMAIN: {}})
+    client = await hass_client()
+    resp = await client.get(prometheus.API_ENDPOINT)
+
+    assert resp.status == 200
+    body = (await resp.text()).split("\n")
+
+    assert (
+        'websocket_command_duration_seconds_bucket{command="ping",le="0.001"} 0.0'
+        in body
+    )
+    assert (
+        'websocket_command_duration_seconds_bucket{command="ping",le="0.0025"} 1.0'
+        in body
+    )
+    assert (
+        'websocket_command_duration_seconds_bucket{command="ping",le="+Inf"} 2.0'
+        in body
+    )
+    assert 'websocket_command_duration_seconds_count{command="ping"} 2.0' in body
+    assert 'websocket_command_payload_bytes_sum{command="ping"} 60.0' in body
+    assert not any(
+        line.startswith("websocket_command_response_time_seconds_count")
+        for line in body
+    )
+
+
+async def test_view_http_request_stats(hass, hass_client):
+    """Test prometheus exports the HTTP request statistics."""
+    assert await async_setup_component(hass, "http", {"http": {"request_stats": True}})
+    # Don't create any states, entity metrics can only be registered once
+    await async_setup_component(hass, prometheus.DOMAIN, {prometheus.DOMAIN: {}})
+    client = await hass_client()
+
+    resp = await client.get(prometheus.API_ENDPOINT)
+    assert resp.status == 200
+    resp = await client.get(prometheus.API_ENDPOINT)
+    assert resp.status == 200
+
+    body = (await resp.text()).split("\n")
+
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/prometheus"} 1.0'
+        in body
+    )
+    assert (
+        'http_responses_total{method="GET",route="/api/prometheus",status="200"} 1.0'
+        in body
+    )
+
+
 async def test_view(hass, hass_client):
     """Test prometheus metrics view."""
     client = await prometheus_client(hass, hass_client)
@@ -1,11 +1,8 @@
 """Common test utils for working with recorder."""
 
-from datetime import timedelta
-
 from homeassistant.components import recorder
 from homeassistant.util import dt as dt_util
-
-from tests.common import fire_time_changed
+from homeassistant.util.async_ import run_callback_threadsafe
 
 
 def wait_recording_done(hass):
@@ -18,6 +15,8 @@ def wait_recording_done(hass):
 
 def trigger_db_commit(hass):
     """Force the recorder to commit."""
-    for _ in range(recorder.DEFAULT_COMMIT_INTERVAL):
-        # We only commit on time change
-        fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    instance = hass.data[recorder.DATA_INSTANCE]
+    # Call soon to queue the commit after events that are being dispatched
+    run_callback_threadsafe(
+        hass.loop, hass.loop.call_soon, instance.async_commit, dt_util.utcnow()
+    ).result()
@@ -1,6 +1,8 @@
 """Tests for WebSocket API commands."""
 from async_timeout import timeout
 
+from homeassistant.bootstrap import DATA_LOOP_MONITOR
+from homeassistant.components.http.const import DATA_REQUEST_STATS
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
@@ -13,6 +15,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util.loop_monitor import LoopMonitor
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -863,3 +866,171 @@ async def test_test_condition(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"]["result"] is True
+
+
+async def test_command_stats(hass, hass_ws_client):
+    """Test retrieving command statistics."""
+    assert await async_setup_component(
+        hass, "websocket_api", {"websocket_api": {"command_stats": True}}
+    )
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json({"id": 5, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+    await websocket_client.send_json({"id": 6, "type": "websocket_api/command_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    ping = msg["result"]["ping"]
+    assert ping["duration"]["count"] == 1
+    assert ping["payload_size"]["count"] == 1
+    assert ping["payload_size"]["sum"] == len('{"id": 5, "type": "ping"}')
+    assert ping["response_time"]["count"] == 0
+
+
+async def test_command_stats_payload_bytes(hass, hass_ws_client):
+    """Test the payload size of messages is recorded in bytes."""
+    assert await async_setup_component(
+        hass, "websocket_api", {"websocket_api": {"command_stats": True}}
+    )
+    websocket_client = await hass_ws_client(hass)
+
+    payload = '{"id": 5, "type": "ping", "name": "Küche"}'
+    await websocket_client.send_str(payload)
+    await websocket_client.receive_json()
+
+    await websocket_client.send_json({"id": 6, "type": "websocket_api/command_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["ping"]["payload_size"]["sum"] == len(payload) + 1
+
+
+async def test_command_stats_async_handler(hass, hass_ws_client):
+    """Test command statistics record the response time of async handlers."""
+    assert await async_setup_component(
+        hass, "websocket_api", {"websocket_api": {"command_stats": True}}
+    )
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json({"id": 5, "type": "manifest/list"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    stats = hass.data[const.DATA_COMMAND_STATS].commands["manifest/list"]
+    assert stats.duration.count == 1
+    assert stats.response_time.count == 1
+
+
+async def test_command_stats_disabled(hass, websocket_client):
+    """Test command statistics are disabled by default."""
+    await websocket_client.send_json({"id": 5, "type": "websocket_api/command_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_SUPPORTED
+
+
+async def test_command_stats_requires_admin(hass, hass_ws_client, hass_admin_user):
+    """Test command statistics require an admin."""
+    assert await async_setup_component(
+        hass, "websocket_api", {"websocket_api": {"command_stats": True}}
+    )
+    websocket_client = await hass_ws_client(hass)
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 5, "type": "websocket_api/command_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_request_stats(hass, hass_ws_client):
+    """Test retrieving HTTP request statistics."""
+    assert await async_setup_component(hass, "http", {"http": {"request_stats": True}})
+    websocket_client = await hass_ws_client(hass)
+    hass.data[DATA_REQUEST_STATS].async_record("GET", "/api/states", 200, 0.1, 512)
+
+    await websocket_client.send_json({"id": 5, "type": "http/request_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    assert len(msg["result"]) == 1
+    result = msg["result"][0]
+    assert result["method"] == "GET"
+    assert result["route"] == "/api/states"
+    assert result["status"] == {"200": 1}
+    assert result["duration"]["sum"] == 0.1
+    assert result["response_size"]["sum"] == 512
+
+
+async def test_request_stats_disabled(hass, websocket_client):
+    """Test HTTP request statistics are disabled by default."""
+    await websocket_client.send_json({"id": 5, "type": "http/request_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_SUPPORTED
+
+
+async def test_loop_monitor(hass, websocket_client):
+    """Test retrieving the event loop monitor reports."""
+    monitor = hass.data[DATA_LOOP_MONITOR] = LoopMonitor(hass.loop)
+    monitor.reports.append({"lag": 0.5, "target": "test.blocking"})
+
+    await websocket_client.send_json({"id": 5, "type": "loop_monitor"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["reports"] == [{"lag": 0.5, "target": "test.blocking"}]
+
+
+async def test_loop_monitor_not_running(hass, websocket_client):
+    """Test retrieving reports when the event loop monitor is not running."""
+    await websocket_client.send_json({"id": 5, "type": "loop_monitor"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_SUPPORTED
+
+
+async def test_executor_pools(hass, websocket_client):
+    """Test retrieving the executor pool metrics."""
+    hass.executor_pools.configure({"slow_cloud": 2})
+    await hass.async_add_executor_job(lambda: None, pool="slow_cloud")
+
+    await websocket_client.send_json({"id": 5, "type": "executor_pools"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "name": "slow_cloud",
+            "max_workers": 2,
+            "queued": 0,
+            "max_queued": 1,
+            "running": 0,
+            "completed": 1,
+        }
+    ]
+
+
+async def test_setup_timeline(hass, websocket_client):
+    """Test retrieving the setup timeline."""
+    await websocket_client.send_json({"id": 5, "type": "setup_timeline"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert ("websocket_api", "setup") in {
+        (span["domain"], span["phase"]) for span in msg["result"]["spans"]
+    }
+    assert msg["result"]["critical_path"]
+    assert "websocket_api" in msg["result"]["config_validation"]
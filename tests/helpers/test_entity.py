@@ -718,3 +718,28 @@ async def test_setup_source(hass):
     await platform.async_reset()
 
     assert entity.entity_sources(hass) == {}
+
+
+async def test_update_in_integration_executor_pool(hass):
+    """Test blocking updates run in the executor pool of the integration."""
+    hass.executor_pools.configure({"test_platform": 1})
+    threads = []
+
+    class BlockingEntity(entity.Entity):
+        """Entity with a blocking update."""
+
+        entity_id = "test_domain.blocking"
+
+        def update(self):
+            """Update the entity."""
+            threads.append(threading.current_thread().name)
+
+    ent = BlockingEntity()
+    ent.hass = hass
+    await ent.async_device_update()
+
+    ent.platform = MockEntityPlatform(hass)
+    await ent.async_device_update()
+
+    assert not threads[0].startswith("SyncWorker_test_platform")
+    assert threads[1].startswith("SyncWorker_test_platform")
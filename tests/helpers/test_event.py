@@ -2677,6 +2677,97 @@ async def test_periodic_task_minute(hass):
     assert len(specific_runs) == 2
 
 
+async def test_periodic_task_error(hass, caplog):
+    """Test a failing periodic task does not stop other tasks or its next run."""
+    runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    @callback
+    def failing(now):
+        """Raise an error."""
+        raise ValueError("boom")
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsub_failing = async_track_utc_time_change(hass, failing, second=0)
+        unsub = async_track_utc_time_change(
+            hass, callback(lambda x: runs.append(x)), second=0
+        )
+
+    for minute in (0, 1):
+        async_fire_time_changed(
+            hass,
+            datetime(now.year + 1, 5, 24, 12, minute, 0, 999999, tzinfo=dt_util.UTC),
+        )
+        await hass.async_block_till_done()
+
+    assert len(runs) == 2
+    assert caplog.text.count("Error running time pattern listener") == 2
+
+    unsub_failing()
+    unsub()
+
+
+async def test_periodic_tasks_share_timer(hass):
+    """Test periodic tasks are run from a single timer armed for the next one due."""
+    minute_runs = []
+    hour_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ), patch(
+        "homeassistant.helpers.event.async_track_point_in_utc_time",
+        wraps=async_track_point_in_utc_time,
+    ) as mock_track:
+        unsub_hour = async_track_utc_time_change(
+            hass, callback(lambda x: hour_runs.append(x)), hour=13, minute=0, second=0
+        )
+        unsub_minute = async_track_utc_time_change(
+            hass, callback(lambda x: minute_runs.append(x)), second=0
+        )
+
+    assert [call[1][2] for call in mock_track.mock_calls] == [
+        datetime(now.year + 1, 5, 24, 13, 0, 0, tzinfo=dt_util.UTC),
+        datetime(now.year + 1, 5, 24, 12, 0, 0, tzinfo=dt_util.UTC),
+    ]
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(minute_runs) == 1
+    assert len(hour_runs) == 0
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 13, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(minute_runs) == 2
+    assert len(hour_runs) == 1
+
+    unsub_minute()
+    unsub_hour()
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 14, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(minute_runs) == 2
+    assert len(hour_runs) == 1
+
+
 async def test_periodic_task_hour(hass):
     """Test periodic tasks per hour."""
     specific_runs = []
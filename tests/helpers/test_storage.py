@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
 
 import pytest
 
@@ -279,3 +280,253 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+def _journal_data(names):
+    """Return data with a record per name."""
+    return {
+        "version": MOCK_VERSION,
+        "key": MOCK_KEY,
+        "data": {
+            "items": [{"id": key, "name": name} for key, name in names.items()],
+            "other": "value",
+        },
+    }
+
+
+def _journal_lines(path):
+    """Return the lines of the journal of a snapshot."""
+    with open(f"{path}{storage.JOURNAL_SUFFIX}") as fil:
+        return fil.read().splitlines()
+
+
+def test_journal_appends_changes(tmp_path):
+    """Test only changed records are written to the journal."""
+    path = str(tmp_path / MOCK_KEY)
+    names = {f"id_{index}": f"Item {index}" for index in range(20)}
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+
+    journal.write(path, _journal_data(names))
+    with open(path) as fil:
+        snapshot = fil.read()
+    assert json.loads(snapshot)["journal"] == 1
+    assert len(_journal_lines(path)) == 1
+
+    names["id_1"] = "Renamed"
+    del names["id_2"]
+    names["id_20"] = "Added"
+    journal.write(path, _journal_data(names))
+    journal.write(path, _journal_data(names))
+
+    with open(path) as fil:
+        assert fil.read() == snapshot
+    assert [json.loads(line) for line in _journal_lines(path)[1:]] == [
+        {
+            "collection": "items",
+            "key": "id_1",
+            "record": {"id": "id_1", "name": "Renamed"},
+        },
+        {
+            "collection": "items",
+            "key": "id_20",
+            "record": {"id": "id_20", "name": "Added"},
+        },
+        {"collection": "items", "key": "id_2", "record": None},
+    ]
+
+    assert storage.StoreJournal({"items": "id"}, False, None).read(path) == (
+        _journal_data(names)
+    )
+
+
+def test_journal_compaction(tmp_path):
+    """Test the snapshot is rewritten when the journal grows too large."""
+    path = str(tmp_path / MOCK_KEY)
+    names = {f"id_{index}": f"Item {index}" for index in range(10)}
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    journal.write(path, _journal_data(names))
+
+    for index in range(10):
+        names[f"id_{index}"] = "Renamed"
+        journal.write(path, _journal_data(names))
+
+    with open(path) as fil:
+        assert json.load(fil)["journal"] > 1
+    assert len(_journal_lines(path)) < 10
+
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    assert journal.read(path) == _journal_data(names)
+
+    # Changing data outside of the records rewrites the snapshot
+    data = _journal_data(names)
+    data["data"]["other"] = "changed"
+    journal.write(path, data)
+    assert len(_journal_lines(path)) == 1
+    assert storage.StoreJournal({"items": "id"}, False, None).read(path) == data
+
+
+def test_journal_recovery(tmp_path):
+    """Test recovering from interrupted writes."""
+    path = str(tmp_path / MOCK_KEY)
+    names = {f"id_{index}": f"Item {index}" for index in range(20)}
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    journal.write(path, _journal_data(names))
+    names["id_1"] = "Renamed"
+    journal.write(path, _journal_data(names))
+
+    with open(f"{path}{storage.JOURNAL_SUFFIX}", "a") as fil:
+        fil.write('{"collection":"items","key":"id_2","rec')
+
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    assert journal.read(path) == _journal_data(names)
+
+    # The next write starts over from a new snapshot
+    names["id_3"] = "Renamed"
+    journal.write(path, _journal_data(names))
+    assert len(_journal_lines(path)) == 1
+    assert storage.StoreJournal({"items": "id"}, False, None).read(path) == (
+        _journal_data(names)
+    )
+
+    # A snapshot of another generation is rewritten instead of appending to
+    # a journal that would be ignored
+    with open(path) as fil:
+        data = json.load(fil)
+    data["journal"] += 1
+    with open(path, "w") as fil:
+        json.dump(data, fil)
+    names["id_4"] = "Renamed"
+    journal.write(path, _journal_data(names))
+    assert len(_journal_lines(path)) == 1
+    assert storage.StoreJournal({"items": "id"}, False, None).read(path) == (
+        _journal_data(names)
+    )
+
+    # So is a journal of another generation
+    with open(f"{path}{storage.JOURNAL_SUFFIX}", "w") as fil:
+        fil.write('{"version":1,"generation":0}\n')
+    names["id_5"] = "Renamed"
+    journal.write(path, _journal_data(names))
+    assert storage.StoreJournal({"items": "id"}, False, None).read(path) == (
+        _journal_data(names)
+    )
+
+
+def test_journal_of_edited_snapshot(tmp_path):
+    """Test the journal is ignored when its snapshot was edited."""
+    path = str(tmp_path / MOCK_KEY)
+    names = {f"id_{index}": f"Item {index}" for index in range(20)}
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    journal.write(path, _journal_data(names))
+    names["id_1"] = "Renamed"
+    journal.write(path, _journal_data(names))
+
+    # Edited while Home Assistant was stopped, keeping the generation
+    with open(path) as fil:
+        data = json.load(fil)
+    data["data"]["items"][1]["name"] = "Edited"
+    with open(path, "w") as fil:
+        json.dump(data, fil)
+
+    names["id_1"] = "Edited"
+    assert storage.StoreJournal({"items": "id"}, False, None).read(path) == (
+        _journal_data(names)
+    )
+
+
+def test_journal_compact(tmp_path):
+    """Test compacting moves the changes in the journal to the snapshot."""
+    path = str(tmp_path / MOCK_KEY)
+    names = {f"id_{index}": f"Item {index}" for index in range(20)}
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    journal.write(path, _journal_data(names))
+    snapshot_mtime = os.stat(path).st_mtime_ns
+
+    # Nothing to move
+    journal.compact(path)
+    assert os.stat(path).st_mtime_ns == snapshot_mtime
+
+    names["id_1"] = "Renamed"
+    journal.write(path, _journal_data(names))
+    journal.compact(path)
+
+    assert len(_journal_lines(path)) == 1
+    with open(path) as fil:
+        data = json.load(fil)
+    del data["journal"]
+    assert data == _journal_data(names)
+
+
+def test_journal_size_in_bytes(tmp_path):
+    """Test the journal size is counted in bytes."""
+    path = str(tmp_path / MOCK_KEY)
+    names = {f"id_{index}": f"Item {index}" for index in range(20)}
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    journal.write(path, _journal_data(names))
+
+    names["id_1"] = "Küche"
+    journal.write(path, _journal_data(names))
+    assert len(_journal_lines(path)) == 2
+    journal_size = os.path.getsize(f"{path}{storage.JOURNAL_SUFFIX}")
+    assert journal._journal_size == journal_size
+
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    journal.read(path)
+    assert journal._journal_size == journal_size
+
+    # Appending is possible after reading
+    names["id_2"] = "Küche"
+    journal.write(path, _journal_data(names))
+    assert len(_journal_lines(path)) == 3
+
+
+def test_journal_snapshot_on_disk(tmp_path):
+    """Test the snapshot is on disk before the journal is started over."""
+    path = str(tmp_path / MOCK_KEY)
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    with patch("homeassistant.util.json.os.fsync", wraps=os.fsync) as mock_fsync:
+        journal.write(path, _journal_data({"id_1": "Item 1"}))
+
+    # The snapshot and the journal, with their directory entries
+    assert mock_fsync.call_count == (4 if hasattr(os, "O_DIRECTORY") else 2)
+
+
+def test_journal_remove(tmp_path):
+    """Test removing the journal."""
+    path = str(tmp_path / MOCK_KEY)
+    journal = storage.StoreJournal({"items": "id"}, False, None)
+    journal.write(path, _journal_data({"id_1": "Item 1"}))
+
+    journal.remove(path)
+    journal.remove(path)
+    assert not os.path.exists(f"{path}{storage.JOURNAL_SUFFIX}")
+
+
+async def test_final_write_journal_snapshot(hass):
+    """Test the final write leaves a snapshot that does not need the journal."""
+    store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+    )
+    await store.async_save({"items": []})
+
+    with patch.object(store, "_write_data") as mock_write, patch.object(
+        store._journal, "compact"
+    ) as mock_compact:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    assert not mock_write.called
+    mock_compact.assert_called_once_with(store.path)
+
+    hass.state = CoreState.stopping
+    await store.async_save({"items": [{"id": "id_1"}]})
+
+    with patch.object(store, "_write_data") as mock_write:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    mock_write.assert_called_once_with(
+        store.path,
+        {"version": MOCK_VERSION, "key": MOCK_KEY, "data": {"items": [{"id": "id_1"}]}},
+        True,
+    )
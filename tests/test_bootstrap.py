@@ -6,9 +6,10 @@ from unittest.mock import Mock
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import async_get_setup_timeline
 import homeassistant.util.dt as dt_util
 
 from tests.async_mock import patch
@@ -101,6 +102,77 @@ async def test_setting_up_config(hass):
     assert "group" in hass.config.components
 
 
+async def test_setting_up_config_prefetches_imports(hass):
+    """Test integrations and their configured platforms are imported ahead."""
+    with patch.object(
+        loader, "_import_modules", wraps=loader._import_modules
+    ) as mock_import:
+        await bootstrap._async_set_up_integrations(
+            hass,
+            {
+                "homeassistant": {},
+                "group": {},
+                "sensor": {"platform": "template", "sensors": {}},
+            },
+        )
+
+    imported = {
+        pkg_path for call in mock_import.call_args_list for pkg_path in call[0][0]
+    }
+    assert "homeassistant.components.group" in imported
+    assert "homeassistant.components.template.sensor" in imported
+    assert loader.DATA_IMPORT_PREFETCH not in hass.data
+    assert ("group", "prefetch") in {
+        (span.domain, span.phase) for span in async_get_setup_timeline(hass).spans
+    }
+
+
+async def test_prefetch_skips_missing_requirements(hass):
+    """Test integrations are not imported ahead while requirements are missing."""
+    mock_integration(
+        hass, MockModule("needs_package", requirements=["not-installed-package==1.0"])
+    )
+    mock_integration(hass, MockModule("uses_needs_package", ["needs_package"]))
+    mock_integration(hass, MockModule("no_requirements"))
+
+    with patch.object(
+        loader, "_import_modules", wraps=loader._import_modules
+    ) as mock_import:
+        await bootstrap._async_set_up_integrations(
+            hass,
+            {
+                "homeassistant": {},
+                "needs_package": {},
+                "uses_needs_package": {},
+                "no_requirements": {},
+            },
+        )
+
+    imported = {
+        pkg_path for call in mock_import.call_args_list for pkg_path in call[0][0]
+    }
+    assert "homeassistant.components.no_requirements" in imported
+    assert "homeassistant.components.needs_package" not in imported
+    assert "homeassistant.components.uses_needs_package" not in imported
+
+
+async def test_prefetch_config_entry_platforms(hass):
+    """Test platforms of integrations set up from config entries are imported."""
+    integration = await loader.async_get_integration(hass, "hue")
+    prefetch = Mock()
+
+    with patch.object(
+        hass.config_entries, "async_domains", return_value=["hue"]
+    ), patch("homeassistant.bootstrap._requirements_installed", return_value={"hue"}):
+        await bootstrap._async_prefetch_imports(
+            hass, {}, prefetch, {"hue": integration}
+        )
+
+    prefetch.async_schedule.assert_called_once_with(
+        integration, {"binary_sensor", "light", "sensor"}
+    )
+
+
 async def test_setup_after_deps_all_present(hass):
     """Test after_dependencies when all present."""
     order = []
@@ -150,9 +222,14 @@ async def test_setup_after_deps_in_stage_1_ignored(hass):
     # This test relies on this
     assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
     order = []
+    cloud_set_up = asyncio.Event()
 
     def gen_domain_setup(domain):
         async def async_setup(hass, config):
+            if domain == "cloud":
+                cloud_set_up.set()
+            else:
+                await cloud_set_up.wait()
             order.append(domain)
             return True
 
@@ -191,6 +268,99 @@ async def test_setup_after_deps_in_stage_1_ignored(hass):
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+async def test_setup_not_waiting_for_unrelated_stage_1(hass):
+    """Test integrations do not wait for unrelated stage 1 integrations."""
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    normal_set_up = asyncio.Event()
+
+    async def async_setup_cloud(hass, config):
+        await normal_set_up.wait()
+        return True
+
+    async def async_setup_normal(hass, config):
+        normal_set_up.set()
+        return True
+
+    mock_integration(hass, MockModule(domain="cloud", async_setup=async_setup_cloud))
+    mock_integration(
+        hass, MockModule(domain="normal_integration", async_setup=async_setup_normal)
+    )
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"cloud": {}, "normal_integration": {}}
+    )
+
+    assert "cloud" in hass.config.components
+    assert "normal_integration" in hass.config.components
+
+
+async def test_setup_concurrency(hass):
+    """Test the number of integrations set up at the same time is limited."""
+    hass.config.setup_concurrency = 2
+    running = 0
+    max_running = 0
+
+    async def async_setup(hass, config):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return True
+
+    for index in range(5):
+        mock_integration(
+            hass, MockModule(domain=f"concurrent_{index}", async_setup=async_setup)
+        )
+
+    await bootstrap._async_set_up_integrations(
+        hass, {f"concurrent_{index}": {} for index in range(5)}
+    )
+
+    assert max_running == 2
+    assert all(f"concurrent_{index}" in hass.config.components for index in range(5))
+
+
+async def test_build_setup_graph(hass):
+    """Test the domains each domain waits for."""
+    integrations = {}
+    for domain, dependencies, after_dependencies in (
+        ("recorder", ["http"], []),
+        ("http", [], []),
+        ("debugpy", [], []),
+        ("cloud", ["http"], ["alexa"]),
+        ("alexa", [], ["cloud"]),
+    ):
+        integrations[domain] = mock_integration(
+            hass,
+            MockModule(
+                domain=domain,
+                dependencies=dependencies,
+                partial_manifest={"after_dependencies": after_dependencies},
+            ),
+        )
+        await integrations[domain].resolve_dependencies()
+
+    stages = [{"recorder", "http"}, {"debugpy"}, {"cloud"}, {"alexa"}]
+    assert (
+        bootstrap._promote_dependencies(
+            bootstrap.LOGGING_INTEGRATIONS, set(integrations), integrations
+        )
+        == stages[0]
+    )
+
+    graph = bootstrap._build_setup_graph(set(integrations), integrations, stages)
+
+    assert graph == {
+        "recorder": {"http"},
+        "http": set(),
+        "debugpy": {"recorder", "http"},
+        # Stage 1 ignores after dependencies
+        "cloud": {"recorder", "http", "debugpy"},
+        "alexa": {"recorder", "http", "debugpy", "cloud"},
+    }
+
+
 async def test_setup_after_deps_via_platform(hass):
     """Test after_dependencies set up via platform."""
     order = []
@@ -402,6 +572,9 @@ async def test_setup_hass(
     assert len(mock_ensure_config_exists.mock_calls) == 1
     assert len(mock_process_ha_config_upgrade.mock_calls) == 1
 
+    assert bootstrap.DATA_LOOP_MONITOR in hass.data
+    hass.data[bootstrap.DATA_LOOP_MONITOR].stop()
+
 
 async def test_setup_hass_takes_longer_than_log_slow_startup(
     mock_enable_logging,
@@ -3,6 +3,7 @@
 from collections import OrderedDict
 import copy
 import os
+import threading
 from unittest import mock
 
 import pytest
@@ -30,6 +31,7 @@ from homeassistant.core import SOURCE_STORAGE, HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 import homeassistant.helpers.check_config as check_config
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.loader import async_get_integration
 from homeassistant.util import dt as dt_util
 from homeassistant.util.yaml import SECRET_YAML
@@ -41,6 +43,7 @@ CONFIG_DIR = get_test_config_dir()
 YAML_PATH = os.path.join(CONFIG_DIR, config_util.YAML_CONFIG_FILE)
 SECRET_PATH = os.path.join(CONFIG_DIR, SECRET_YAML)
 VERSION_PATH = os.path.join(CONFIG_DIR, config_util.VERSION_FILE)
+YAML_CACHE_PATH = os.path.join(CONFIG_DIR, STORAGE_DIR, config_util.YAML_CACHE_FILE)
 GROUP_PATH = os.path.join(CONFIG_DIR, config_util.GROUP_CONFIG_PATH)
 AUTOMATIONS_PATH = os.path.join(CONFIG_DIR, config_util.AUTOMATION_CONFIG_PATH)
 SCRIPTS_PATH = os.path.join(CONFIG_DIR, config_util.SCRIPT_CONFIG_PATH)
@@ -67,6 +70,9 @@ def teardown():
     if os.path.isfile(VERSION_PATH):
         os.remove(VERSION_PATH)
 
+    if os.path.isfile(YAML_CACHE_PATH):
+        os.remove(YAML_CACHE_PATH)
+
     if os.path.isfile(GROUP_PATH):
         os.remove(GROUP_PATH)
 
@@ -122,6 +128,22 @@ def test_load_yaml_config_converts_empty_files_to_dict():
     assert isinstance(config_util.load_yaml_config_file(YAML_PATH), dict)
 
 
+def test_load_yaml_config_cached(tmp_path):
+    """Test the configuration is cached when a cache path is given."""
+    config_path = tmp_path / config_util.YAML_CONFIG_FILE
+    cache_path = tmp_path / STORAGE_DIR / config_util.YAML_CACHE_FILE
+    config_path.write_text("key: value")
+
+    conf = config_util.load_yaml_config_file(str(config_path), str(cache_path))
+    assert conf == {"key": "value"}
+    assert cache_path.is_file()
+
+    with patch("homeassistant.util.yaml.cache.load_yaml") as mock_load:
+        conf = config_util.load_yaml_config_file(str(config_path), str(cache_path))
+    assert conf == {"key": "value"}
+    assert not mock_load.called
+
+
 def test_load_yaml_config_raises_error_if_not_dict():
     """Test error raised when YAML file is not a dict."""
     with open(YAML_PATH, "w") as fp:
@@ -472,6 +494,7 @@ async def test_loading_configuration(hass):
             "internal_url": "http://example.local",
             "media_dirs": {"mymedia": "/usr"},
             "legacy_templates": True,
+            "setup_concurrency": 4,
         },
     )
 
@@ -489,6 +512,7 @@ async def test_loading_configuration(hass):
     assert hass.config.media_dirs == {"mymedia": "/usr"}
     assert hass.config.config_source == config_util.SOURCE_YAML
     assert hass.config.legacy_templates is True
+    assert hass.config.setup_concurrency == 4
 
 
 async def test_loading_configuration_temperature_unit(hass):
@@ -534,6 +558,19 @@ async def test_loading_configuration_default_media_dirs_docker(hass):
     assert hass.config.media_dirs == {"local": "/media"}
 
 
+async def test_loading_configuration_executor_pools(hass):
+    """Test loading the executor pool sizes."""
+    await config_util.async_process_ha_core_config(
+        hass, {"executor_pools": {"slow_cloud": 2}}
+    )
+    assert hass.executor_pools.get("slow_cloud").max_workers == 2
+
+    with pytest.raises(vol.Invalid):
+        await config_util.async_process_ha_core_config(
+            hass, {"executor_pools": {"slow_cloud": 0}}
+        )
+
+
 async def test_loading_configuration_from_packages(hass):
     """Test loading packages config onto hass object config."""
     await config_util.async_process_ha_core_config(
@@ -1089,6 +1126,60 @@ async def test_component_config_exceptions(hass, caplog):
     )
 
 
+async def test_component_config_validation_in_executor(hass):
+    """Test platform configs are validated in the executor and keep their order."""
+    loop_thread = threading.get_ident()
+    threads = set()
+
+    def platform_schema(value):
+        threads.add(threading.get_ident())
+        return {**value, "validated": True}
+
+    def with_schema(value):
+        return {**platform_schema(value), "platform_schema": True}
+
+    integrations = {
+        "with_schema": Mock(
+            get_platform=Mock(return_value=Mock(PLATFORM_SCHEMA=with_schema))
+        ),
+        "without_schema": Mock(get_platform=Mock(return_value=Mock(spec=[]))),
+    }
+
+    with patch(
+        "homeassistant.config.async_get_integration_with_requirements",
+        side_effect=lambda hass, name: integrations[name],
+    ):
+        result = await config_util.async_process_component_config(
+            hass,
+            {
+                "test_domain": [
+                    {"platform": "with_schema", "id": 1},
+                    {"platform": "without_schema", "id": 2},
+                    {"platform": "with_schema", "id": 3},
+                ]
+            },
+            integration=Mock(
+                domain="test_domain",
+                get_platform=Mock(return_value=None),
+                get_component=Mock(
+                    return_value=Mock(
+                        spec=["PLATFORM_SCHEMA_BASE"],
+                        PLATFORM_SCHEMA_BASE=platform_schema,
+                    )
+                ),
+            ),
+        )
+
+    assert [conf["id"] for conf in result["test_domain"]] == [1, 2, 3]
+    assert [conf.get("platform_schema") for conf in result["test_domain"]] == [
+        True,
+        None,
+        True,
+    ]
+    assert threads and loop_thread not in threads
+    assert hass.data[config_util.DATA_CONFIG_VALIDATION_TIMES]["test_domain"] >= 0
+
+
 @pytest.mark.parametrize(
     "domain, schema, expected",
     [
@@ -3,9 +3,11 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
+import threading
 
 import pytest
 import pytz
@@ -336,6 +338,79 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_json():
+    """Test a State as JSON."""
+    state = ha.State("happy.happy", "on", {"pig": "dog"})
+    assert json.loads(state.as_json()) == state.as_dict()
+    # 2nd time to verify cache
+    assert state.as_json() is state.as_json()
+
+    state = ha.State("happy.happy", "on", {"value": float("nan")})
+    with pytest.raises(ValueError):
+        state.as_json()
+
+
+async def test_eventbus_filtered_listener(hass):
+    """Test listeners are only scheduled for events passing their filter."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        calls.append(event)
+
+    @ha.callback
+    def event_filter(event):
+        return event.data["filtered"] is False
+
+    unsub = hass.bus.async_listen("test", listener, event_filter=event_filter)
+
+    hass.bus.async_fire("test", {"filtered": True})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"filtered": False})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    unsub()
+
+
+async def test_eventbus_filter_errors(hass, caplog):
+    """Test an event filter raising does not schedule the listener."""
+    calls = []
+
+    @ha.callback
+    def event_filter(event):
+        raise ValueError
+
+    hass.bus.async_listen("test", calls.append, event_filter=event_filter)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 0
+    assert "Error in event filter" in caplog.text
+
+
+async def test_eventbus_filter_must_be_callback(hass):
+    """Test an event filter needs to be a callback."""
+    with pytest.raises(ha.HomeAssistantError):
+        hass.bus.async_listen("test", lambda event: None, event_filter=lambda e: True)
+
+
+async def test_eventbus_has_listeners(hass):
+    """Test checking for listeners of an event type."""
+    assert not hass.bus.async_has_listeners("test")
+
+    unsub = hass.bus.async_listen("test", lambda event: None)
+    unsub_all = hass.bus.async_listen(MATCH_ALL, lambda event: None)
+    assert hass.bus.async_has_listeners("test")
+    assert not hass.bus.async_has_listeners("other")
+
+    unsub()
+    unsub_all()
+    assert not hass.bus.async_has_listeners("test")
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -799,6 +874,251 @@ async def test_serviceregistry_callback_service_raise_exception(hass):
     await hass.async_block_till_done()
 
 
+async def test_serviceregistry_call_batch(hass):
+    """Test calling a batch of services."""
+    schema_calls = []
+
+    def schema(data):
+        schema_calls.append(data)
+        return vol.Schema({"entity_id": str, "brightness": int})(data)
+
+    calls = async_mock_service(hass, "light", "turn_on", schema)
+    events = async_capture_events(hass, EVENT_CALL_SERVICE)
+
+    @ha.callback
+    def failing_handler(_):
+        raise ValueError
+
+    hass.services.async_register("light", "fail", failing_handler)
+
+    results = await hass.services.async_call_batch(
+        [
+            ("light", "turn_on", {"entity_id": "light.kitchen", "brightness": 10}),
+            ("light", "turn_on", {"entity_id": "light.living", "brightness": 10}),
+            ("light", "turn_on", {"entity_id": "light.kitchen", "brightness": 10}),
+            ("light", "turn_on", {"entity_id": "light.bed", "brightness": "x"}),
+            ("light", "fail", None),
+            ("light", "missing", None),
+        ]
+    )
+
+    assert results[:3] == [True, True, True]
+    assert isinstance(results[3], vol.Invalid)
+    assert isinstance(results[4], ValueError)
+    assert isinstance(results[5], ha.ServiceNotFound)
+
+    assert [call.data["entity_id"] for call in calls] == [
+        "light.kitchen",
+        "light.living",
+        "light.kitchen",
+    ]
+    assert calls[0].context is calls[1].context
+    # Identical data is only validated once
+    assert len(schema_calls) == 3
+
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert events[0].data == {
+        "domain": "light",
+        "service": "turn_on",
+        "service_data": {
+            "entity_id": ["light.kitchen", "light.living"],
+            "brightness": 10,
+        },
+    }
+    assert events[1].data == {"domain": "light", "service": "fail", "service_data": {}}
+
+
+async def test_serviceregistry_call_batch_mixed_types(hass):
+    """Test batched payloads that compare equal but differ in type stay apart."""
+
+    def schema(data):
+        return {**data, "type": type(data["value"]).__name__}
+
+    calls = async_mock_service(hass, "test_domain", "typed", schema)
+    events = async_capture_events(hass, EVENT_CALL_SERVICE)
+
+    results = await hass.services.async_call_batch(
+        [
+            ("test_domain", "typed", {"entity_id": "light.a", "value": 1}),
+            ("test_domain", "typed", {"entity_id": "light.b", "value": True}),
+            ("test_domain", "typed", {"entity_id": "light.c", "value": 1}),
+        ]
+    )
+
+    assert results == [True, True, True]
+    assert [(call.data["entity_id"], call.data["type"]) for call in calls] == [
+        ("light.a", "int"),
+        ("light.b", "bool"),
+        ("light.c", "int"),
+    ]
+
+    await hass.async_block_till_done()
+    assert [event.data["service_data"] for event in events] == [
+        {"entity_id": ["light.a", "light.c"], "value": 1},
+        {"entity_id": ["light.b"], "value": True},
+    ]
+    assert events[1].data["service_data"]["value"] is True
+
+
+async def test_serviceregistry_call_batch_parallel_limit(hass):
+    """Test a batch runs a limited number of handlers at the same time."""
+    running = 0
+    max_running = 0
+
+    async def service_handler(_):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    hass.services.async_register("test_domain", "register_calls", service_handler)
+
+    results = await hass.services.async_call_batch(
+        [("test_domain", "register_calls", {"index": index}) for index in range(5)],
+        max_parallel=2,
+    )
+
+    assert results == [True] * 5
+    assert max_running == 2
+
+
+async def test_serviceregistry_call_batch_timeout(hass):
+    """Test a batch reports calls that did not finish in time."""
+    event = asyncio.Event()
+
+    async def service_handler(_):
+        await event.wait()
+
+    hass.services.async_register("test_domain", "slow", service_handler)
+    async_mock_service(hass, "test_domain", "fast")
+
+    results = await hass.services.async_call_batch(
+        [("test_domain", "slow", None), ("test_domain", "fast", None)], limit=0.01
+    )
+
+    assert results == [False, True]
+    event.set()
+    await hass.async_block_till_done()
+
+
+async def test_serviceregistry_validation_cache(hass):
+    """Test validated service data is cached per registered service."""
+    schema_calls = []
+
+    def schema(data):
+        schema_calls.append(data)
+        return {**data, "validated": True}
+
+    calls = async_mock_service(hass, "test_domain", "cached", schema=schema)
+
+    await hass.services.async_call(
+        "test_domain", "cached", {"entity_id": ["light.a"]}, blocking=True
+    )
+    await hass.services.async_call(
+        "test_domain", "cached", {"entity_id": ["light.a"]}, blocking=True
+    )
+    assert len(schema_calls) == 1
+    assert calls[1].data == {"entity_id": ["light.a"], "validated": True}
+
+    # Unhashable data is validated every time
+    await hass.services.async_call(
+        "test_domain", "cached", {"value": {1, 2}}, blocking=True
+    )
+    await hass.services.async_call(
+        "test_domain", "cached", {"value": {1, 2}}, blocking=True
+    )
+    assert len(schema_calls) == 3
+
+    # Registering the service again drops the cache
+    async_mock_service(hass, "test_domain", "cached", schema=schema)
+    await hass.services.async_call(
+        "test_domain", "cached", {"entity_id": ["light.a"]}, blocking=True
+    )
+    assert len(schema_calls) == 4
+
+
+async def test_serviceregistry_validation_cache_types(hass):
+    """Test values that compare equal but differ in type are validated separately."""
+
+    def schema(data):
+        return {"type": type(data["value"]).__name__}
+
+    calls = async_mock_service(hass, "test_domain", "cached", schema=schema)
+
+    for value in (1, True, 1.0, [1], (1,), 1):
+        await hass.services.async_call(
+            "test_domain", "cached", {"value": value}, blocking=True
+        )
+
+    assert [call.data["type"] for call in calls] == [
+        "int",
+        "bool",
+        "float",
+        "list",
+        "tuple",
+        "int",
+    ]
+
+
+async def test_serviceregistry_validation_cache_copies(hass):
+    """Test handlers changing their call data do not change cached results."""
+
+    @ha.callback
+    def service_handler(call):
+        call.data["entity_id"].append("light.changed")
+
+    hass.services.async_register(
+        "light",
+        "turn_on",
+        service_handler,
+        vol.Schema({"entity_id": [str]}),
+    )
+
+    for _ in range(2):
+        await hass.services.async_call(
+            "light", "turn_on", {"entity_id": ["light.a"]}, blocking=True
+        )
+
+    handler = hass.services._services["light"]["turn_on"]
+    assert list(handler.validated.values()) == [{"entity_id": ["light.a"]}]
+
+
+async def test_serviceregistry_validation_cache_size(hass):
+    """Test the validation cache only keeps the most recent payloads."""
+    schema_calls = []
+
+    def schema(data):
+        schema_calls.append(data)
+        return data
+
+    async_mock_service(hass, "test_domain", "cached", schema=schema)
+
+    with patch("homeassistant.core.SERVICE_VALIDATION_CACHE_SIZE", 2):
+        for index in (1, 2, 1, 3, 1, 2):
+            await hass.services.async_call(
+                "test_domain", "cached", {"index": index}, blocking=True
+            )
+
+    assert [data["index"] for data in schema_calls] == [1, 2, 3, 2]
+
+
+async def test_add_executor_job_pool(hass):
+    """Test executor jobs run in a configured executor pool."""
+    hass.executor_pools.configure({"slow_cloud": 1})
+
+    name = await hass.async_add_executor_job(
+        lambda: threading.current_thread().name, pool="slow_cloud"
+    )
+    assert name.startswith("SyncWorker_slow_cloud")
+
+    name = await hass.async_add_executor_job(
+        lambda: threading.current_thread().name, pool="other"
+    )
+    assert not name.startswith("SyncWorker_other")
+
+
 def test_config_defaults():
     """Test config defaults."""
     hass = Mock()
@@ -972,8 +1292,8 @@ def test_create_timer(mock_monotonic, loop):
     ):
         ha._async_create_timer(hass)
 
-    assert len(funcs) == 2
-    fire_time_event, stop_timer = funcs
+    assert len(funcs) == 3
+    fire_time_event, _, stop_timer = funcs
 
     assert len(hass.loop.call_later.mock_calls) == 1
     delay, callback, target = hass.loop.call_later.mock_calls[0][1]
@@ -1005,6 +1325,61 @@ def test_create_timer(mock_monotonic, loop):
     assert event_data[ATTR_NOW] == datetime(2018, 12, 31, 3, 4, 6, 100000)
 
 
+@patch("homeassistant.core.monotonic")
+def test_timer_without_tick_listeners(mock_monotonic, loop):
+    """Test the timer does not fire ticks nobody listens to."""
+    hass = MagicMock()
+    hass.bus.async_has_listeners.return_value = False
+    mock_monotonic.side_effect = 10.2, 10.8, 11.3
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 5, 333333),
+    ):
+        ha._async_create_timer(hass)
+
+    _, callback, target = hass.loop.call_later.mock_calls[0][1]
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 6, 100000),
+    ):
+        callback(target)
+
+    hass.bus.async_has_listeners.assert_called_once_with(EVENT_TIME_CHANGED)
+    assert len(hass.bus.async_fire.mock_calls) == 0
+    assert len(hass.loop.call_later.mock_calls) == 1
+
+    # Adding a listener resumes the ticks
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 7, 500000),
+    ):
+        hass.bus._time_listener_added()
+
+    assert len(hass.loop.call_later.mock_calls) == 2
+    delay, callback, target = hass.loop.call_later.mock_calls[1][1]
+    assert abs(delay - 0.5) < 0.001
+    assert abs(target - 11.3) < 0.001
+
+    # Only one tick is scheduled at a time
+    hass.bus._time_listener_added()
+    assert len(hass.loop.call_later.mock_calls) == 2
+
+
+async def test_time_listener_added(hass):
+    """Test the bus reports listeners for time changed events to the timer."""
+    time_listener_added = MagicMock()
+    hass.bus._time_listener_added = time_listener_added
+
+    hass.bus.async_listen("test_event", lambda _: None)
+    assert len(time_listener_added.mock_calls) == 0
+
+    hass.bus.async_listen(EVENT_TIME_CHANGED, lambda _: None)
+    hass.bus.async_listen_once(EVENT_TIME_CHANGED, lambda _: None)
+    assert len(time_listener_added.mock_calls) == 2
+
+
 @patch("homeassistant.core.monotonic")
 def test_timer_out_of_sync(mock_monotonic, loop):
     """Test create timer."""
@@ -1047,8 +1422,8 @@ def test_timer_out_of_sync(mock_monotonic, loop):
 
         assert event_context_0 == event_context_1
 
-        assert len(funcs) == 2
-        fire_time_event, _ = funcs
+        assert len(funcs) == 3
+        fire_time_event, _, _ = funcs
 
     assert len(hass.loop.call_later.mock_calls) == 2
 
@@ -1462,6 +1837,32 @@ async def test_async_entity_ids_count(hass):
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_statemachine_domain_index(hass):
+    """Test domain filtered lookups follow sets and removals."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.ac", "off")
+    hass.states.async_set("light.frog", "on")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids_count(["light", "switch"]) == 3
+    assert hass.states.async_all("switch") == [hass.states.get("switch.ac")]
+
+    hass.states.async_set("light.bowl", "off")
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "on"]
+
+    assert hass.states.async_entity_ids(["switch", "light", "Light"]) == [
+        "light.bowl",
+        "switch.ac",
+        "light.frog",
+    ]
+    assert hass.states.async_entity_ids_count(["light", "LIGHT"]) == 2
+
+    hass.states.async_remove("switch.ac")
+    assert hass.states.async_entity_ids("switch") == []
+    assert hass.states.async_entity_ids_count("switch") == 0
+    assert hass.states.async_all(["switch", "light"]) == hass.states.async_all("light")
+
+
 async def test_hassjob_forbid_coroutine():
     """Test hassjob forbids coroutines."""
 
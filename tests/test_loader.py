@@ -1,4 +1,8 @@
 """Test to verify that we can load components."""
+import asyncio
+import os
+import pathlib
+
 import pytest
 
 from homeassistant import core, loader
@@ -6,7 +10,7 @@ from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 
 from tests.async_mock import ANY, patch
-from tests.common import MockModule, async_mock_service, mock_integration
+from tests.common import MockModule, async_mock_service, flush_store, mock_integration
 
 
 async def test_component_dependencies(hass):
@@ -254,6 +258,14 @@ async def test_get_custom_components_internal(hass):
     integrations = await loader._async_get_custom_components(hass)
     assert integrations == {"test": ANY, "test_package": ANY}
 
+    index = await loader.async_get_manifest_index(hass)
+    assert set(index.custom_components) == {"test", "test_package"}
+
+    with patch("homeassistant.loader.Integration.resolve_from_root") as mock_resolve:
+        integrations = await loader._async_get_custom_components(hass)
+    assert not mock_resolve.called
+    assert integrations == {"test": ANY, "test_package": ANY}
+
 
 def _get_test_integration(hass, name, config_flow):
     """Return a generated test integration."""
@@ -395,3 +407,164 @@ async def test_get_custom_components_safe_mode(hass):
     """Test that we get empty custom components in safe mode."""
     hass.config.safe_mode = True
     assert await loader.async_get_custom_components(hass) == {}
+
+
+async def test_manifest_index(hass, hass_storage):
+    """Test integrations and dependencies are stored in the manifest index."""
+    integration = await loader.async_get_integration(hass, "mobile_app")
+    assert await integration.resolve_dependencies()
+
+    await flush_store((await loader.async_get_manifest_index(hass))._store)
+    data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert data["ha_version"] == core.__version__
+    assert data["integrations"]["mobile_app"]["manifest"]["domain"] == "mobile_app"
+    assert str(integration.file_path) in data["mtimes"]
+    assert str(integration.file_path / "manifest.json") in data["mtimes"]
+    assert "http" in data["integrations"]
+    assert data["dependencies"]["mobile_app"] == sorted(integration.all_dependencies)
+
+
+async def test_manifest_index_loaded(hass, hass_storage):
+    """Test integrations are resolved from a current manifest index."""
+    file_path = pathlib.Path(hue.__file__).parent
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "key": loader.MANIFEST_INDEX_STORAGE_KEY,
+        "data": {
+            "ha_version": core.__version__,
+            "mtimes": {str(file_path): os.stat(file_path).st_mtime_ns},
+            "integrations": {
+                "hue": {
+                    "pkg_path": "homeassistant.components.hue",
+                    "file_path": str(file_path),
+                    "manifest": {
+                        "domain": "hue",
+                        "name": "Indexed Hue",
+                        "dependencies": ["http"],
+                    },
+                }
+            },
+            "custom_components": None,
+            "dependencies": {"hue": ["http", "stored"]},
+        },
+    }
+
+    with patch("homeassistant.loader.Integration.resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+        assert await integration.resolve_dependencies()
+
+    assert not mock_resolve.called
+    assert integration.name == "Indexed Hue"
+    assert integration.all_dependencies == {"http", "stored"}
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [{"ha_version": "0.1"}, {"mtimes": {hue.__file__: 0}}],
+)
+async def test_manifest_index_outdated(hass, hass_storage, changes):
+    """Test an outdated manifest index is discarded."""
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "key": loader.MANIFEST_INDEX_STORAGE_KEY,
+        "data": {
+            "ha_version": core.__version__,
+            "mtimes": {},
+            "integrations": {
+                "hue": {
+                    "pkg_path": "homeassistant.components.hue",
+                    "file_path": "/",
+                    "manifest": {"domain": "hue", "name": "Indexed Hue"},
+                }
+            },
+            "custom_components": None,
+            "dependencies": {},
+            **changes,
+        },
+    }
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Philips Hue"
+
+
+async def test_manifest_index_manifest_changed(hass, hass_storage):
+    """Test the manifest index is discarded when a built-in manifest changed."""
+    file_path = pathlib.Path(hue.__file__).parent
+    manifest_path = file_path / "manifest.json"
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "key": loader.MANIFEST_INDEX_STORAGE_KEY,
+        "data": {
+            "ha_version": core.__version__,
+            "mtimes": {
+                str(file_path): os.stat(file_path).st_mtime_ns,
+                # Edited in place, the directory did not change
+                str(manifest_path): os.stat(manifest_path).st_mtime_ns - 1,
+            },
+            "integrations": {
+                "hue": {
+                    "pkg_path": "homeassistant.components.hue",
+                    "file_path": str(file_path),
+                    "manifest": {"domain": "hue", "name": "Indexed Hue"},
+                }
+            },
+            "custom_components": None,
+            "dependencies": {"hue": ["stored"]},
+        },
+    }
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Philips Hue"
+    assert await integration.resolve_dependencies()
+    assert "stored" not in integration.all_dependencies
+
+
+async def test_import_prefetch(hass):
+    """Test importing an integration and its platforms ahead of setup."""
+    prefetch = loader.ImportPrefetch(hass)
+    hass.data[loader.DATA_IMPORT_PREFETCH] = prefetch
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch("homeassistant.loader.importlib.import_module") as mock_import:
+        prefetch.async_schedule(integration, ["light"])
+        await asyncio.sleep(0)
+        assert "hue" in prefetch.started
+        await loader.async_wait_for_import_prefetch(hass, "hue")
+
+    assert prefetch.tasks["hue"].done()
+    assert [call[0][0] for call in mock_import.call_args_list] == [
+        "homeassistant.components.hue",
+        "homeassistant.components.hue.light",
+    ]
+    assert "hue" in prefetch.timings
+
+
+async def test_import_prefetch_not_started(hass):
+    """Test an import that has not started is cancelled when it is needed."""
+    prefetch = loader.ImportPrefetch(hass)
+    hass.data[loader.DATA_IMPORT_PREFETCH] = prefetch
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch("homeassistant.loader.importlib.import_module") as mock_import:
+        prefetch.async_schedule(integration, [])
+        await loader.async_wait_for_import_prefetch(hass, "hue")
+        await hass.async_block_till_done()
+
+    assert prefetch.tasks["hue"].cancelled()
+    assert not mock_import.called
+
+
+async def test_import_prefetch_error(hass):
+    """Test errors importing ahead of setup are ignored."""
+    prefetch = loader.ImportPrefetch(hass)
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        side_effect=RuntimeError("deadlock detected"),
+    ) as mock_import:
+        prefetch.async_schedule(integration, ["light"])
+        await hass.async_block_till_done()
+
+    assert mock_import.call_count == 1
+    assert "hue" in prefetch.timings
@@ -596,3 +596,23 @@ async def test_integration_disabled(hass, caplog):
     result = await setup.async_setup_component(hass, "test_component1", {})
     assert not result
     assert disabled_reason in caplog.text
+
+
+async def test_setup_timeline(hass):
+    """Test the phases of setting up an integration are recorded."""
+    mock_integration(hass, MockModule("comp_dep"))
+    mock_integration(hass, MockModule("comp", dependencies=["comp_dep"]))
+
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    timeline = setup.async_get_setup_timeline(hass)
+    phases = [(span.domain, span.phase) for span in timeline.spans]
+    assert ("comp", "dependencies") in phases
+    assert ("comp", "import") in phases
+    assert ("comp", "config") in phases
+    assert ("comp", "setup") in phases
+    assert ("comp_dep", "setup") in phases
+    assert [step["domain"] for step in timeline.critical_path()] == [
+        "comp_dep",
+        "comp",
+    ]
@@ -0,0 +1,72 @@
+"""Test Home Assistant executor pool utils."""
+import threading
+
+from homeassistant.util.executor import MAX_EXECUTOR_POOLS, ExecutorPool, ExecutorPools
+
+
+def test_executor_pool_metrics():
+    """Test the pool keeps track of queued and running jobs."""
+    pool = ExecutorPool("test", 1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait()
+        return threading.current_thread().name
+
+    first = pool.submit(blocking)
+    assert started.wait(1)
+    second = pool.submit(blocking)
+    assert pool.as_dict() == {
+        "name": "test",
+        "max_workers": 1,
+        "queued": 1,
+        "max_queued": 1,
+        "running": 1,
+        "completed": 0,
+    }
+
+    release.set()
+    assert first.result(1).startswith("SyncWorker_test")
+    second.result(1)
+    assert pool.queued == 0
+    assert pool.running == 0
+    assert pool.completed == 2
+    pool.shutdown()
+
+
+def test_executor_pools_configured_only():
+    """Test pools are only created for configured names."""
+    pools = ExecutorPools()
+    pools.configure({"slow_cloud": 2})
+
+    assert pools.get("other") is None
+    pool = pools.get("slow_cloud")
+    assert pool is not None
+    assert pool.max_workers == 2
+    assert pools.get("slow_cloud") is pool
+
+    # Pools that exist keep their size
+    pools.configure({"slow_cloud": 4})
+    assert pools.get("slow_cloud").max_workers == 2
+
+    pools.shutdown()
+    assert pools.pools == {}
+    assert pools.get("slow_cloud").max_workers == 4
+    pools.shutdown()
+
+
+def test_executor_pools_limit(caplog):
+    """Test no more than the maximum number of pools are created."""
+    pools = ExecutorPools()
+    pools.configure({f"pool_{index}": 1 for index in range(MAX_EXECUTOR_POOLS + 1)})
+
+    for index in range(MAX_EXECUTOR_POOLS):
+        assert pools.get(f"pool_{index}") is not None
+
+    assert pools.get(f"pool_{MAX_EXECUTOR_POOLS}") is None
+    assert pools.get(f"pool_{MAX_EXECUTOR_POOLS}") is None
+    assert len(pools.pools) == MAX_EXECUTOR_POOLS
+    assert caplog.text.count("Not creating executor pool") == 1
+    pools.shutdown()
@@ -0,0 +1,30 @@
+"""Test Home Assistant histogram utility functions."""
+from homeassistant.util.histogram import Histogram
+
+
+def test_histogram_add():
+    """Test adding values to a histogram."""
+    histogram = Histogram((1, 5, 10))
+
+    for value in (0.5, 1, 3, 7, 10, 25):
+        histogram.add(value)
+
+    assert histogram.counts == [2, 1, 2, 1]
+    assert histogram.count == 6
+    assert histogram.sum == 46.5
+    assert histogram.max == 25
+    assert histogram.cumulative_counts() == [2, 3, 5, 6]
+
+
+def test_histogram_as_dict():
+    """Test serializing a histogram."""
+    histogram = Histogram((1, 5))
+    histogram.add(2)
+
+    assert histogram.as_dict() == {
+        "count": 1,
+        "sum": 2,
+        "max": 2,
+        "bounds": [1, 5],
+        "counts": [0, 1, 0],
+    }
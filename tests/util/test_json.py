@@ -19,7 +19,7 @@ from homeassistant.util.json import (
     save_json,
 )
 
-from tests.async_mock import Mock
+from tests.async_mock import Mock, patch
 
 # Test data that can be saved as JSON
 TEST_JSON_A = {"a": 1, "B": "two"}
@@ -77,6 +77,19 @@ def test_overwrite_and_reload():
     assert data == TEST_JSON_B
 
 
+def test_save_fsync():
+    """Test saving waits until the file and its directory entry are on disk."""
+    fname = _path_for("test_fsync")
+    with patch("homeassistant.util.json.os.fsync", wraps=os.fsync) as mock_fsync:
+        save_json(fname, TEST_JSON_A)
+        assert not mock_fsync.called
+
+        save_json(fname, TEST_JSON_B, fsync=True)
+
+    assert mock_fsync.call_count == (2 if hasattr(os, "O_DIRECTORY") else 1)
+    assert load_json(fname) == TEST_JSON_B
+
+
 def test_save_bad_data():
     """Test error from trying to save unserialisable data."""
     with pytest.raises(SerializationError) as excinfo:
@@ -0,0 +1,47 @@
+"""Test the event loop monitor."""
+import asyncio
+import time
+
+import pytest
+
+from homeassistant.util import loop_monitor
+
+
+@pytest.mark.parametrize(
+    "path, integration",
+    [
+        ("/srv/homeassistant/components/hue/light.py", "hue"),
+        ("/config/custom_components/my_integration/__init__.py", "my_integration"),
+        ("/srv/homeassistant/helpers/event.py", None),
+    ],
+)
+def test_integration_from_path(path, integration):
+    """Test finding the integration of a source file."""
+    assert loop_monitor.integration_from_path(path) == integration
+
+
+def _block_loop():
+    """Block the event loop."""
+    time.sleep(0.3)
+
+
+async def test_reports_blocking_callback(caplog):
+    """Test a callback blocking the loop is reported."""
+    loop = asyncio.get_running_loop()
+    monitor = loop_monitor.LoopMonitor(loop, interval=0.01, threshold=0.05)
+    monitor.start()
+
+    await asyncio.sleep(0.05)
+    loop.call_soon(_block_loop)
+    await asyncio.sleep(0)
+    # Give the monitor time to record the lag once the loop is unblocked
+    await asyncio.sleep(0.1)
+    monitor.stop()
+
+    assert len(monitor.reports) == 1
+    report = monitor.reports[0]
+    assert report["target"] == f"{__name__}._block_loop"
+    assert report["integration"] is None
+    assert report["lag"] >= 0.25
+    assert monitor.max_lag == report["lag"]
+    assert "Event loop was blocked" in caplog.text
@@ -247,3 +247,45 @@ def test_check_package_global():
 def test_check_package_zip():
     """Test for an installed zip package."""
     assert not package.is_installed(TEST_ZIP_REQ)
+
+
+def test_check_package_version():
+    """Test checking the version of an installed package."""
+    dist = list(pkg_resources.working_set)[0]
+    assert package.is_installed(f"{dist.project_name}=={dist.version}")
+    assert not package.is_installed(f"{dist.project_name}<0.0.1")
+
+
+def test_installed_packages_index(tmp_path):
+    """Test the index of installed distributions is rebuilt on changes."""
+    index = package.InstalledPackages()
+    dist_info = tmp_path / "Test_Package-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Name: Test_Package\nVersion: 1.0\n")
+
+    with patch.object(package.sys, "path", [str(tmp_path)]):
+        assert index.version("test-package") == "1.0"
+        assert index.version("Test.Package") == "1.0"
+        assert index.version("other") is None
+
+        with patch(
+            "homeassistant.util.package.distributions", return_value=[]
+        ) as mock_distributions:
+            assert index.version("test-package") == "1.0"
+            assert not mock_distributions.called
+
+            # Removing a distribution changes the mtime of its directory
+            os.utime(tmp_path, ns=(0, 0))
+            assert index.version("test-package") is None
+            assert mock_distributions.call_count == 1
+
+            index.invalidate()
+            assert index.version("test-package") is None
+            assert mock_distributions.call_count == 2
+
+
+def test_install_invalidates_index(mock_sys, mock_popen, mock_env_copy, mock_venv):
+    """Test installing a package invalidates the index of installed packages."""
+    with patch.object(package.INSTALLED_PACKAGES, "invalidate") as mock_invalidate:
+        assert package.install_package(TEST_NEW_REQ, False)
+    assert mock_invalidate.call_count == 1
@@ -0,0 +1,89 @@
+"""Test the setup timeline."""
+from homeassistant.util.timeline import Timeline
+
+
+def test_timeline_spans():
+    """Test spans are recorded relative to the start of the timeline."""
+    timeline = Timeline()
+    timeline.add_span("light", "setup", timeline.origin + 1, timeline.origin + 3)
+
+    with timeline.span("hue", "import"):
+        pass
+
+    assert timeline.as_dict()["spans"][0] == {
+        "domain": "light",
+        "phase": "setup",
+        "start": 1,
+        "end": 3,
+    }
+    assert timeline.spans[1].domain == "hue"
+    assert 0 <= timeline.spans[1].start <= timeline.spans[1].end
+
+
+def test_timeline_max_spans():
+    """Test only the most recent spans are kept."""
+    timeline = Timeline(max_spans=2)
+    for domain in ("light", "switch", "hue"):
+        timeline.add_span(domain, "setup", timeline.origin, timeline.origin + 1)
+
+    assert [span.domain for span in timeline.spans] == ["switch", "hue"]
+
+
+def test_timeline_critical_path():
+    """Test the critical path follows the dependencies that finished last."""
+    timeline = Timeline()
+    origin = timeline.origin
+    timeline.add_span("http", "setup", origin, origin + 2)
+    timeline.add_span("auth", "setup", origin, origin + 1)
+    timeline.add_span("frontend", "setup", origin + 2, origin + 3)
+    timeline.add_span("hue", "setup", origin + 3, origin + 4)
+    timeline.add_span("hue", "light platform", origin + 4, origin + 6)
+    timeline.add_span("sun", "setup", origin, origin + 5)
+    timeline.add_dependencies("frontend", ["http", "auth"])
+    timeline.add_dependencies("hue", ["frontend", "not_loaded"])
+
+    assert timeline.critical_path() == [
+        {"domain": "http", "end": 2},
+        {"domain": "frontend", "end": 3},
+        {"domain": "hue", "end": 6},
+    ]
+    assert Timeline().critical_path() == []
+
+
+def test_timeline_chrome_trace():
+    """Test the timeline in Chrome trace format."""
+    timeline = Timeline()
+    origin = timeline.origin
+    timeline.add_span("hue", "import", origin, origin + 0.5)
+    timeline.add_span("hue", "setup", origin + 0.5, origin + 1.5)
+
+    assert timeline.as_chrome_trace() == {
+        "traceEvents": [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "hue"},
+            },
+            {
+                "name": "import",
+                "cat": "hue",
+                "ph": "X",
+                "ts": 0,
+                "dur": 500000,
+                "pid": 1,
+                "tid": 1,
+            },
+            {
+                "name": "setup",
+                "cat": "hue",
+                "ph": "X",
+                "ts": 500000,
+                "dur": 1000000,
+                "pid": 1,
+                "tid": 1,
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
@@ -4,8 +4,23 @@ import uuid
 
 import homeassistant.util.uuid as uuid_util
 
+from tests.async_mock import patch
+
 
 async def test_uuid_util_random_uuid_hex():
     """Verify we can generate a random uuid."""
     assert len(uuid_util.random_uuid_hex()) == 32
     assert uuid.UUID(uuid_util.random_uuid_hex())
+
+
+async def test_uuid_util_ulid_hex():
+    """Verify we can generate a time ordered ulid."""
+    with patch("homeassistant.util.uuid.time_ns", return_value=1605000000000000000):
+        first = uuid_util.ulid_hex()
+    with patch("homeassistant.util.uuid.time_ns", return_value=1605000000001000000):
+        second = uuid_util.ulid_hex()
+
+    assert len(first) == 32
+    assert uuid.UUID(first)
+    assert int(first[:12], 16) == 1605000000000
+    assert first < second
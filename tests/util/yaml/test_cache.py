@@ -0,0 +1,125 @@
+"""Test the cache of parsed YAML files."""
+import os
+
+import pytest
+
+from homeassistant.util.yaml import cache, loader
+
+from tests.async_mock import patch
+from tests.common import patch_yaml_files
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Create a configuration with includes, secrets and environment variables."""
+    (tmp_path / "configuration.yaml").write_text(
+        "name: !secret name\n"
+        "sensor: !include sensor.yaml\n"
+        "automation: !include_dir_list automations\n"
+        "path: !env_var TEST_YAML_CACHE default\n"
+    )
+    (tmp_path / "secrets.yaml").write_text("name: Home\n")
+    (tmp_path / "sensor.yaml").write_text("- platform: template\n")
+    (tmp_path / "automations").mkdir()
+    (tmp_path / "automations" / "one.yaml").write_text("alias: One\n")
+    loader.clear_secret_cache()
+    yield tmp_path
+    loader.clear_secret_cache()
+
+
+def _load(config_dir):
+    """Load the configuration through the cache."""
+    return cache.load_yaml_cached(
+        str(config_dir / "configuration.yaml"), str(_cache_path(config_dir))
+    )
+
+
+def _cache_path(config_dir):
+    """Return the path of the cache file."""
+    return config_dir / ".storage" / "core.yaml_cache"
+
+
+def _touch(path, content):
+    """Change a file and make sure its modification time changes."""
+    stat = os.stat(path)
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+
+def test_cache_reused(config_dir):
+    """Test the parsed configuration is reused while nothing changes."""
+    conf = _load(config_dir)
+    assert conf == {
+        "name": "Home",
+        "sensor": [{"platform": "template"}],
+        "automation": [{"alias": "One"}],
+        "path": "default",
+    }
+    assert _cache_path(config_dir).is_file()
+
+    with patch.object(cache, "load_yaml") as mock_load:
+        cached = _load(config_dir)
+
+    assert not mock_load.called
+    assert cached == conf
+    assert cached["sensor"].__config_file__ == str(config_dir / "configuration.yaml")
+    assert cached["sensor"].__line__ == 1
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda path: _touch(path / "sensor.yaml", "- platform: time_date\n"),
+        lambda path: _touch(path / "secrets.yaml", "name: Away\n"),
+        lambda path: (path / "automations" / "two.yaml").write_text("alias: Two\n"),
+        lambda path: os.environ.__setitem__("TEST_YAML_CACHE", "set"),
+    ],
+)
+def test_cache_invalidated(config_dir, change):
+    """Test the cache is not used when a source of the configuration changes."""
+    _load(config_dir)
+    change(config_dir)
+    loader.clear_secret_cache()
+
+    try:
+        with patch.object(cache, "load_yaml", wraps=loader.load_yaml) as mock_load:
+            _load(config_dir)
+    finally:
+        os.environ.pop("TEST_YAML_CACHE", None)
+
+    assert mock_load.called
+
+
+def test_cache_not_written_for_mocked_files(tmp_path):
+    """Test configurations that are not read from disk are not cached."""
+    with patch_yaml_files({"configuration.yaml": "name: Home"}):
+        assert _load(tmp_path) == {"name": "Home"}
+
+    assert not _cache_path(tmp_path).exists()
+
+
+def test_cache_corrupt(config_dir):
+    """Test a corrupt cache is ignored."""
+    _cache_path(config_dir).parent.mkdir()
+    _cache_path(config_dir).write_bytes(b"corrupt")
+    assert _load(config_dir)["name"] == "Home"
+
+
+def test_cache_without_secrets(config_dir, monkeypatch):
+    """Test secrets and environment variables are stored by name."""
+    (config_dir / "secrets.yaml").write_text("name: Hidden name\n")
+    monkeypatch.setenv("TEST_YAML_CACHE", "Hidden variable")
+    loader.clear_secret_cache()
+
+    assert _load(config_dir)["name"] == "Hidden name"
+    content = _cache_path(config_dir).read_text()
+    assert "Hidden" not in content
+    assert oct(_cache_path(config_dir).stat().st_mode & 0o777) == oct(0o600)
+
+    loader.clear_secret_cache()
+    with patch.object(cache, "load_yaml") as mock_load:
+        conf = _load(config_dir)
+
+    assert not mock_load.called
+    assert conf["name"] == "Hidden name"
+    assert conf["path"] == "Hidden variable"
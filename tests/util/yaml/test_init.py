@@ -23,6 +23,16 @@ def mock_credstash():
         yield mock_credstash
 
 
+@pytest.fixture(params=["enable_c_loader", "disable_c_loader"])
+def try_both_loaders(request):
+    """Disable the yaml c loader."""
+    if request.param != "disable_c_loader":
+        yield
+        return
+    with patch.object(yaml_loader, "FastSafeLoader", yaml_loader.SafeLineLoader):
+        yield
+
+
 def test_simple_list():
     """Test simple list."""
     conf = "config:\n  - simple\n  - list"
@@ -478,3 +488,36 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_loaders_tags_and_line_numbers():
+    """Test both loaders support the custom tags and keep track of lines."""
+    config_file = get_test_config_dir(YAML_CONFIG_FILE)
+    files = {
+        YAML_CONFIG_FILE: (
+            "homeassistant:\n"
+            "  name: !secret name\n"
+            "sensor: !include sensor.yaml\n"
+            "light:\n"
+            "  - platform: !env_var LIGHT_PLATFORM hue\n"
+        ),
+        "secrets.yaml": "name: Home",
+        "sensor.yaml": "- platform: template\n",
+    }
+    with patch_yaml_files(files):
+        conf = yaml.load_yaml(config_file)
+
+    assert conf["homeassistant"] == {"name": "Home"}
+    assert conf["sensor"] == [{"platform": "template"}]
+    assert conf["light"] == [{"platform": "hue"}]
+    assert conf["light"].__config_file__ == config_file
+    assert conf["light"].__line__ == 4
+    assert conf["light"][0].__line__ == 4
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_loaders_invalid_yaml():
+    """Test both loaders raise for invalid YAML."""
+    with pytest.raises(HomeAssistantError):
+        yaml.parse_yaml("key: [1, 2")